@@ -0,0 +1,227 @@
+import argparse
+import json
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from convert_ratings import REGRESSIONS_PATH, convert
+from instrumentation import init_worker, span
+from model_artifact import load_models
+
+# Bytes of decompressed input read per chunk; each chunk is then cut back to the last whole game.
+CHUNK_SIZE = 8 << 20
+# Chunks being annotated or waiting to be written, per worker. This bounds memory however large the dump.
+PENDING_PER_WORKER = 2
+
+# Lichess speeds by estimated duration (initial seconds + 40 * increment seconds), as upper bounds.
+# Ultrabullet uses the bullet model and correspondence the classical one, like the extension.
+SPEED_LIMITS = [(180, 'BULLET'), (480, 'BLITZ'), (1500, 'RAPID')]
+SPEED_CATEGORIES = {
+    'ultraBullet': 'BULLET',
+    'bullet': 'BULLET',
+    'blitz': 'BLITZ',
+    'rapid': 'RAPID',
+    'classical': 'CLASSICAL',
+    'correspondence': 'CLASSICAL',
+}
+
+# Every PGN game of a Lichess dump starts with an Event tag after a blank line.
+GAME_SEPARATOR = b'\n\n[Event '
+GAME_START = re.compile(rb'^\[Event ', re.M)
+TAG = re.compile(rb'^\[(TimeControl|WhiteElo|BlackElo) "([^"]*)"\][ \t]*(\r?\n)', re.M)
+
+def classify_clock(initial, increment):
+    """Category of a game with initial and increment seconds."""
+    seconds = initial + 40 * increment
+    for limit, category in SPEED_LIMITS:
+        if seconds < limit:
+            return category
+    return 'CLASSICAL'
+
+def classify_time_control(time_control):
+    """Category of a PGN TimeControl such as '180+2', or None when it is missing or malformed."""
+    if time_control == '-':
+        return 'CLASSICAL'
+    initial, _, increment = time_control.partition('+')
+    try:
+        return classify_clock(int(initial), int(increment or 0))
+    except ValueError:
+        return None
+
+def _convert_grouped(requests, regressions):
+    """Converts a list of (category, rating) with one vectorized call per category, keeping the order."""
+    groups = {}
+    for i, (category, _) in enumerate(requests):
+        groups.setdefault(category, []).append(i)
+    converted = [None] * len(requests)
+    for category, indexes in groups.items():
+        ratings = np.array([requests[i][1] for i in indexes], dtype=np.float64)
+        for i, value in zip(indexes, convert(ratings, category, regressions).tolist()):
+            converted[i] = value
+    return converted
+
+def annotate_pgn(data, regressions):
+    """Adds WhiteChessComElo and BlackChessComElo tags after the Elo tags of every game in a PGN chunk.
+
+    Games without a usable TimeControl or rating are passed through unchanged.
+    Returns the annotated bytes and the number of games.
+    """
+    starts = [m.start() for m in GAME_START.finditer(data)]
+    inserts = []
+    requests = []
+    for start, end in zip(starts, starts[1:] + [len(data)]):
+        header_end = data.find(b'\n\n', start, end)
+        tags = {m[1]: m for m in TAG.finditer(data, start, end if header_end < 0 else header_end + 1)}
+        time_control = tags.get(b'TimeControl')
+        category = time_control and classify_time_control(time_control[2].decode('ascii', 'replace'))
+        if category is None:
+            continue
+        for color in (b'White', b'Black'):
+            elo = tags.get(color + b'Elo')
+            if elo is not None and elo[2].isdigit():
+                inserts.append((elo.end(), color, elo[3]))
+                requests.append((category, int(elo[2])))
+
+    pieces = []
+    position = 0
+    for (offset, color, newline), rating in sorted(zip(inserts, _convert_grouped(requests, regressions))):
+        pieces.append(data[position:offset])
+        pieces.append(b'[%sChessComElo "%d"]%s' % (color, rating, newline))
+        position = offset
+    pieces.append(data[position:])
+    return b''.join(pieces), len(starts)
+
+def _game_category(game):
+    category = SPEED_CATEGORIES.get(game.get('speed'))
+    clock = game.get('clock')
+    if category is None and clock:
+        category = classify_clock(clock.get('initial', 0), clock.get('increment', 0))
+    return category
+
+def annotate_ndjson(data, regressions):
+    """Adds a chessComRating to every rated player of each game in an NDJSON chunk, as exported by the Lichess API.
+
+    Returns the annotated bytes and the number of games.
+    """
+    games = [json.loads(line) for line in data.splitlines() if line.strip()]
+    players = []
+    requests = []
+    for game in games:
+        category = _game_category(game)
+        if category is None:
+            continue
+        for player in game.get('players', {}).values():
+            rating = player.get('rating')
+            if isinstance(rating, (int, float)) and not isinstance(rating, bool):
+                players.append(player)
+                requests.append((category, rating))
+    for player, rating in zip(players, _convert_grouped(requests, regressions)):
+        player['chessComRating'] = rating
+    return b''.join(json.dumps(game, ensure_ascii=False, separators=(',', ':')).encode() + b'\n' for game in games), len(games)
+
+ANNOTATORS = {'pgn': annotate_pgn, 'ndjson': annotate_ndjson}
+
+def read_chunks(stream, fmt, chunk_size=CHUNK_SIZE):
+    """Yields chunks of about chunk_size bytes that end at a game boundary."""
+    separator, keep = (GAME_SEPARATOR, 2) if fmt == 'pgn' else (b'\n', 1)
+    buffer = b''
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        buffer += block
+        # Only search the new block (and the separator's length before it) for the last boundary.
+        cut = buffer.rfind(separator, max(0, len(buffer) - len(block) - len(separator)))
+        if cut >= 0:
+            yield buffer[:cut + keep]
+            buffer = buffer[cut + keep:]
+    if buffer:
+        yield buffer
+
+def annotate_chunks(chunks, fmt, regressions, workers=None):
+    """Annotates chunks across a process pool and yields (annotated bytes, games) in input order."""
+    annotate = ANNOTATORS[fmt]
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        for chunk in chunks:
+            yield annotate(chunk, regressions)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(annotate, chunk, regressions))
+            if len(pending) >= workers * PENDING_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError('Reading or writing .zst files needs the zstandard package (pip install zstandard)') from error
+    return zstandard
+
+def open_input(path):
+    """Opens a dump for binary reading, decompressing .zst files on the fly."""
+    stream = sys.stdin.buffer if path == '-' else open(path, 'rb')
+    if path.endswith('.zst'):
+        return _zstandard().ZstdDecompressor().stream_reader(stream, read_across_frames=True, closefd=path != '-')
+    return stream
+
+def open_output(path):
+    """Opens an output for binary writing, compressing .zst files on the fly."""
+    stream = sys.stdout.buffer if path == '-' else open(path, 'wb')
+    if path.endswith('.zst'):
+        return _zstandard().ZstdCompressor().stream_writer(stream, closefd=path != '-')
+    return stream
+
+def detect_format(path, fmt=None):
+    if fmt:
+        return fmt
+    if path.removesuffix('.zst').endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return 'pgn'
+
+def annotate_file(input_path, output_path, fmt=None, regressions=None, workers=None, chunk_size=CHUNK_SIZE):
+    """Streams a PGN or NDJSON game dump (optionally .zst) into an annotated copy. Returns the number of games."""
+    if regressions is None:
+        regressions = load_models(REGRESSIONS_PATH)
+    fmt = detect_format(input_path, fmt)
+    games = 0
+    source = open_input(input_path)
+    out = open_output(output_path)
+    try:
+        for annotated, count in annotate_chunks(read_chunks(source, fmt, chunk_size), fmt, regressions, workers):
+            out.write(annotated)
+            games += count
+    finally:
+        source.close()
+        if out is sys.stdout.buffer:
+            out.flush()
+        else:
+            out.close()
+    return games
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Adds Chess.com rating estimates to a Lichess PGN or NDJSON game dump.')
+    parser.add_argument('input', help="Game dump (.pgn, .ndjson, optionally .zst), or '-' for stdin")
+    parser.add_argument('-o', '--output', default='-', help="Output file (.zst to compress), or '-' for stdout (default)")
+    parser.add_argument('--format', choices=list(ANNOTATORS), help='Input/output format (inferred from the input extension by default)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per CPU)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Bytes of games per chunk sent to a worker')
+    parser.add_argument('--regressions', default=REGRESSIONS_PATH, help='Model artifact or regressions.json to convert with')
+    args = parser.parse_args(argv)
+
+    with span('annotate games', input=args.input):
+        games = annotate_file(args.input, args.output, args.format, load_models(args.regressions), args.workers, args.chunk_size)
+    if args.output != '-':
+        print(f"Annotated {games} games into {args.output}")
+
+if __name__ == '__main__':
+    main()
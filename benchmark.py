@@ -0,0 +1,325 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BASELINE_PATH = 'benchmark_baseline.json'
+RESULTS_PATH = 'benchmark_results.json'
+# A benchmark fails when its fastest time exceeds the baseline's by more than this fraction.
+TOLERANCE = 0.5
+REPEATS = 5
+# Each timed sample repeats the benchmark until it takes at least this long, so sub-millisecond
+# benchmarks are not at the mercy of timer resolution and scheduler noise.
+MIN_SAMPLE_SECONDS = 0.1
+RATINGS = 1_000_000
+
+# Benchmark name -> setup() returning (run, items): run() is timed, items counts the work it does.
+BENCHMARKS = {}
+
+def register_benchmark(name):
+    """Registers a benchmark setup function."""
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+def _example_data():
+    import pandas as pd
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    data = pd.read_csv(os.path.join(root, 'tests', 'example_lichess_to_chess_com_data.csv'))
+    df = data[['lichess_blitz', 'chess_com_blitz']].dropna()
+    return df['lichess_blitz'].to_numpy(dtype=np.float64), df['chess_com_blitz'].to_numpy(dtype=np.float64)
+
+@register_benchmark('fit.find_best_regression')
+def _find_best_regression():
+    from calculate_regressions import find_best_regression
+
+    x, y = _example_data()
+    return lambda: find_best_regression(x, y), 1
+
+@register_benchmark('fit.calculate_aic')
+def _calculate_aic():
+    from calculate_regressions import calculate_aic
+
+    mse = np.random.default_rng(0).uniform(100, 10000, 10_000)
+
+    def run():
+        for value in mse:
+            calculate_aic(50, value, 3)
+    return run, len(mse)
+
+@register_benchmark('fit.sufficient_statistics')
+def _sufficient_statistics():
+    from streaming_fit import SufficientStatistics
+
+    x = _ratings()
+    y = 1.2 * x - 600
+    return lambda: SufficientStatistics().update(x, y).regression(), len(x)
+
+# One model of each type the extension and convert_ratings evaluate, over typical ratings.
+MODEL_TYPES = {
+    'linear': {'type': 'linear', 'params': [1.19, -665.8]},
+    'quadratic': {'type': 'quadratic', 'params': [3.6e-05, 1.25, -815.5]},
+    'log': {'type': 'log', 'params': [900.0, -5600.0]},
+    'polynomial': {'type': 'polynomial', 'params': [1e-08, -5e-05, 1.2, -400.0]},
+    'piecewise_linear': {'type': 'piecewise_linear', 'params': [800.0, 1500.0, 2200.0, 300.0, 1150.0, 2000.5]},
+    'pchip': {'type': 'pchip', 'params': [800.0, 1300.0, 1900.0, 2600.0, 200.0, 820.0, 1500.0, 2350.0]},
+}
+
+def _ratings(count=RATINGS):
+    return np.random.default_rng(0).integers(600, 3000, count).astype(np.float64)
+
+def _register_convert(name, regression):
+    @register_benchmark(f'convert.{name}')
+    def setup():
+        from convert_ratings import convert
+
+        ratings = _ratings()
+        return lambda: convert(ratings, 'BLITZ', {'BLITZ': regression}), len(ratings)
+
+for _name, _regression in MODEL_TYPES.items():
+    _register_convert(_name, _regression)
+
+@register_benchmark('convert.lookup')
+def _lookup():
+    from convert_ratings import build_lookup_table, lookup
+
+    table = build_lookup_table({category: MODEL_TYPES['quadratic'] for category in
+                                ('BLITZ', 'BULLET', 'RAPID', 'CLASSICAL')})
+    ratings = _ratings().astype(np.intp)
+    return lambda: lookup(ratings, 'BLITZ', table), len(ratings)
+
+@register_benchmark('convert.reverse_lookup')
+def _reverse_lookup():
+    from convert_ratings import build_inverse_table, reverse_lookup
+
+    table = build_inverse_table({category: MODEL_TYPES['quadratic'] for category in
+                                 ('BLITZ', 'BULLET', 'RAPID', 'CLASSICAL')})
+    ratings = _ratings()
+    return lambda: reverse_lookup(ratings, 'BLITZ', table), len(ratings)
+
+@register_benchmark('annotate.pgn')
+def _annotate_pgn():
+    from annotate_games import annotate_pgn
+
+    games = 20_000
+    time_controls = ['60+0', '180+2', '600+0', '1800+0']
+    ratings = np.random.default_rng(0).integers(600, 3000, (games, 2))
+    data = ''.join(f'[Event "Rated game"]\n[Site "https://lichess.org/{i:08d}"]\n[Result "1-0"]\n'
+                   f'[WhiteElo "{white}"]\n[BlackElo "{black}"]\n[TimeControl "{time_controls[i % 4]}"]\n\n'
+                   f'1. e4 e5 2. Qh5 Nc6 3. Bc4 Nf6 4. Qxf7# 1-0\n\n'
+                   for i, (white, black) in enumerate(ratings)).encode()
+    regressions = {category: MODEL_TYPES['quadratic'] for category in ('BLITZ', 'BULLET', 'RAPID', 'CLASSICAL')}
+    return lambda: annotate_pgn(data, regressions), games
+
+@register_benchmark('parse.parse_table')
+def _parse_table():
+    from parse_regressions import parse_table
+
+    rows = 20_000
+    body = ''.join(f'<tr><td>{i}</td><td>{i * 2}</td><td>{i % 7 or ""}</td><td>{i * 3:,}</td></tr>' for i in range(rows))
+    html = ('<html><body><table id="tablepress-27"><thead><tr><th>Lichess<br/>Blitz</th><th>Chess.com Blitz</th>'
+            f'<th>FIDE</th><th>USCF</th></tr></thead><tbody>{body}</tbody></table></body></html>').encode()
+    return lambda: parse_table(html, 'tablepress-27'), rows
+
+@register_benchmark('plot.plot_regression')
+def _plot_regression():
+    from calculate_regressions import find_best_regression
+    from generate_plots import plot_regression
+
+    x, y = _example_data()
+    regression = find_best_regression(x, y)
+    # plot_regression writes into images/, so render inside a scratch directory.
+    directory = tempfile.mkdtemp()
+    os.makedirs(os.path.join(directory, 'images'))
+
+    def run():
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            plot_regression(x, y, regression, 'Blitz', 'blitz_regression.png')
+        finally:
+            os.chdir(cwd)
+    return run, 1
+
+# Times every compiled category function from lichess2chess_models.js over the same ratings;
+# model_artifact.js is evaluated first, as in the manifest.
+_JS_BENCHMARK = """
+const fs = require('fs');
+const source = [process.argv[3], process.argv[1]].map((path) => fs.readFileSync(path, 'utf8')).join('\\n');
+eval(source + '\\n;globalThis.models = COMPILED_MODELS;');
+const count = Number(process.argv[2]);
+const ratings = new Int32Array(count);
+for (let i = 0; i < count; i++) ratings[i] = 600 + ((i * 2654435761) >>> 0) % 2400;
+const run = () => {
+  let checksum = 0;
+  for (const model of Object.values(models.convert)) {
+    for (let i = 0; i < count; i++) checksum += model(ratings[i]);
+  }
+  return checksum;
+};
+run();
+const start = process.hrtime.bigint();
+run();
+console.log(JSON.stringify({ seconds: Number(process.hrtime.bigint() - start) / 1e9 }));
+"""
+
+def _js_setup(regressions):
+    from convert_ratings import write_models_module
+
+    if not shutil.which('node'):
+        return None
+    path = os.path.join(tempfile.mkdtemp(), 'models.js')
+    write_models_module(regressions, path=path)
+
+    def run():
+        reader = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model_artifact.js')
+        output = subprocess.run(['node', '-e', _JS_BENCHMARK, path, str(RATINGS), reader],
+                                capture_output=True, text=True, check=True).stdout
+        return json.loads(output)['seconds']
+    return run, RATINGS * len(regressions)
+
+@register_benchmark('js.compiled_models')
+def _js_compiled_models():
+    from convert_ratings import load_regressions
+
+    return _js_setup(load_regressions(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'regressions.json')))
+
+@register_benchmark('js.compiled_model_types')
+def _js_compiled_model_types():
+    types = ['polynomial', 'log', 'piecewise_linear', 'pchip']
+    return _js_setup({category: MODEL_TYPES[t] for category, t in zip(('BLITZ', 'BULLET', 'RAPID', 'CLASSICAL'), types)})
+
+def _time(run, loops):
+    """Seconds for loops runs; a run that returns a float reports its own time (e.g. measured inside node)."""
+    total = 0.0
+    for _ in range(loops):
+        start = time.perf_counter()
+        measured = run()
+        elapsed = time.perf_counter() - start
+        total += measured if isinstance(measured, float) else elapsed
+    return total
+
+def autorange(run, min_time=MIN_SAMPLE_SECONDS):
+    """The loop count (1, 2, 5, 10, 20, 50, ...) that makes one sample take at least min_time, as timeit does."""
+    loops = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            if _time(run, loops * multiplier) >= min_time:
+                return loops * multiplier
+        loops *= 10
+
+def run_benchmark(name, repeats=REPEATS, min_time=MIN_SAMPLE_SECONDS):
+    """Times a benchmark in samples of at least min_time each. Returns its result dict, or None when it cannot run here.
+
+    Finding the loop count doubles as the warm-up. Times are per run: the fastest sample, which
+    is the least disturbed by other work on the machine, and the median.
+    """
+    setup = BENCHMARKS[name]()
+    if setup is None:
+        return None
+    run, items = setup
+    loops = autorange(run, min_time)
+    times = [_time(run, loops) / loops for _ in range(repeats)]
+    best = min(times)
+    return {'min': best, 'median': statistics.median(times), 'loops': loops, 'items': items, 'items_per_second': items / best}
+
+def run_benchmarks(names, repeats=REPEATS, min_time=MIN_SAMPLE_SECONDS):
+    results = {}
+    for name in names:
+        result = run_benchmark(name, repeats, min_time)
+        if result is None:
+            print(f"{name:<32} skipped (not available here)", flush=True)
+            continue
+        results[name] = result
+        print(f"{name:<32} {result['min'] * 1000:10.3f} ms  {result['items_per_second']:14,.0f} items/s", flush=True)
+    return results
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Returns (name, baseline time, time) for every benchmark slower than the baseline allows, comparing fastest times.
+
+    A baseline entry may set its own tolerance, for benchmarks that vary more than others between runs.
+    A benchmark missing from the baseline could never fail, so it is returned too, with None as its baseline time.
+    """
+    slower = []
+    for name, result in results.items():
+        if name not in baseline:
+            slower.append((name, None, result['min']))
+        elif result['min'] > baseline[name]['min'] * (1 + baseline[name].get('tolerance', tolerance)):
+            slower.append((name, baseline[name]['min'], result['min']))
+    return slower
+
+def _environment():
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine(),
+            'processor': platform.processor(), 'cpus': os.cpu_count()}
+
+def main():
+    parser = argparse.ArgumentParser(description='Times the fitting, conversion, parsing, plotting and extension paths '
+                                                 'and compares them against a stored baseline.')
+    parser.add_argument('names', nargs='*', help='Benchmarks to run, or prefixes such as convert. (default: all)')
+    parser.add_argument('--repeats', type=int, default=REPEATS, help='Timed samples per benchmark (the fastest is compared)')
+    parser.add_argument('--min-time', type=float, default=MIN_SAMPLE_SECONDS,
+                        help='Minimum seconds per sample; fast benchmarks are looped until they take this long')
+    parser.add_argument('--output', default=RESULTS_PATH, help='Where to write the results as JSON')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline results to compare against')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help='Allowed slowdown over the baseline fastest time, as a fraction, '
+                             'for benchmarks without a tolerance of their own in the baseline')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results as the new baseline')
+    parser.add_argument('--list', action='store_true', help='List the benchmarks and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(BENCHMARKS))
+        return
+    names = [name for name in BENCHMARKS if not args.names or any(name.startswith(n) for n in args.names)]
+    if not names:
+        sys.exit(f"No benchmarks match {args.names}")
+
+    results = run_benchmarks(names, args.repeats, args.min_time)
+    report = {'environment': _environment(), 'results': results}
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)['results']
+        # A tolerance set for a benchmark outlives new timings
+        tolerances = {name: {'tolerance': baseline[name]['tolerance']} for name in results
+                      if 'tolerance' in baseline.get(name, {})}
+        report['results'] = {**baseline, **{name: {**result, **tolerances.get(name, {})} for name, result in results.items()}}
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Updated the baseline in {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)['results']
+    slower = compare(results, baseline, args.tolerance)
+    for name, expected, actual in slower:
+        if expected is None:
+            print(f"NO BASELINE {name}: {actual * 1000:.2f} ms; record it with --update-baseline {name}", file=sys.stderr)
+            continue
+        print(f"REGRESSION {name}: {actual * 1000:.2f} ms vs baseline {expected * 1000:.2f} ms "
+              f"({actual / expected - 1:+.0%})", file=sys.stderr)
+    if slower:
+        sys.exit(1)
+    print(f"All benchmarks within {args.tolerance:.0%} of the baseline.")
+
+if __name__ == '__main__':
+    main()
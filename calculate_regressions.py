@@ -1,9 +1,31 @@
-import pandas as pd
+# Imported first, so that when profiling its import hook also times numpy
+from instrumentation import init_worker, span
 import numpy as np
 import json
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.metrics import mean_squared_error
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from convert_ratings import (CATEGORIES, INTERVAL_PATH, INVERSE_PATH, LUT_MAX_RATING, LUT_PATH, MODELS_JS_PATH,
+                             build_inverse_table, build_lookup_table, load_lookup_table, non_monotone_ratings,
+                             predict_regression, write_lookup_table, write_models_module)
+from model_artifact import ARTIFACT_PATH, write_artifact
+from model_selection import CANDIDATES, CV_FOLDS, select_models
+from prepared_data import load_datasets
+
+# Candidate model families and their number of parameters, in tie-breaking order.
+FAMILIES = ['linear', 'quadratic', 'log']
+PARAM_COUNTS = np.array([2, 3, 2])
+
+# Parameters are written with this many significant digits, far below the data's precision, so
+# refitting the same data reproduces regressions.json exactly despite last-digit float noise.
+SIGNIFICANT_DIGITS = 10
+
+# Bootstrap prediction intervals: resamples per category, central coverage, and the
+# rating step at which quantiles are taken before interpolating to every rating.
+BOOTSTRAP_SAMPLES = 20000
+INTERVAL_LEVEL = 0.95
+INTERVAL_STEP = 10
 
 def calculate_aic(n, mse, k):
     """Calculates the Akaike Information Criterion."""
@@ -11,80 +33,281 @@ def calculate_aic(n, mse, k):
         return -np.inf
     return n * np.log(mse) + 2 * k
 
-def find_best_regression(x, y):
-    """Finds the best regression model (linear, quadratic, or log) based on AIC."""
-    models = {}
-    x_reshaped = x.values.reshape(-1, 1)
-
-    # Linear
-    linear_model = LinearRegression()
-    linear_model.fit(x_reshaped, y)
-    linear_mse = mean_squared_error(y, linear_model.predict(x_reshaped))
-    models['linear'] = {
-        'model': linear_model,
-        'aic': calculate_aic(len(x), linear_mse, 2),
-        'params': [linear_model.coef_[0], linear_model.intercept_] # [linear_coef, intercept]
-    }
+def batched_aic(n, mse, k):
+    """calculate_aic over arrays: log(0) gives -inf, so a perfect fit still wins."""
+    with np.errstate(divide='ignore'):
+        return n * np.log(mse) + 2 * k
 
-    # Quadratic
-    poly = PolynomialFeatures(degree=2)
-    x_poly = poly.fit_transform(x_reshaped)
-    quad_model = LinearRegression()
-    quad_model.fit(x_poly, y)
-    quad_mse = mean_squared_error(y, quad_model.predict(x_poly))
-    models['quadratic'] = {
-        'model': quad_model,
-        'aic': calculate_aic(len(x), quad_mse, 3),
-        'params': [quad_model.coef_[2], quad_model.coef_[1], quad_model.intercept_] # [quadratic, linear, constant]
-    }
+def _standardize(values, weights, n):
+    """Returns the weighted mean and standard deviation used to condition the normal equations."""
+    mean = (values * weights).sum(axis=-1) / n
+    std = np.sqrt((((values - mean[:, None]) * weights) ** 2).sum(axis=-1) / n)
+    return mean, np.where(std > 0, std, 1.0)
 
-    # Logarithmic
-    x_log = np.log(x_reshaped)
-    log_model = LinearRegression()
-    log_model.fit(x_log, y)
-    log_mse = mean_squared_error(y, log_model.predict(x_log))
-    models['log'] = {
-        'model': log_model,
-        'aic': calculate_aic(len(x), log_mse, 2),
-        'params': [log_model.coef_[0], log_model.intercept_] # [log_coef, intercept]
-    }
+def unstandardize(beta, mean, std):
+    """Converts [b0, b1, b2] for t = (u - mean) / std into [constant, u, u^2] coefficients."""
+    b0, b1, b2 = beta[..., 0], beta[..., 1], beta[..., 2]
+    m, s = mean[:, None], std[:, None]
+    return np.stack([
+        b0 - b1 * m / s + b2 * m ** 2 / s ** 2,
+        b1 / s - 2 * b2 * m / s ** 2,
+        b2 / s ** 2,
+    ], axis=-1)
+
+def _pad(arrays, fill):
+    """Stacks ragged 1-D arrays into a (batch, n_max) array plus a 0/1 weight mask."""
+    if isinstance(arrays, np.ndarray):
+        return arrays.astype(np.float64, copy=False), np.ones(arrays.shape)
+    n_max = max(len(a) for a in arrays)
+    stacked = np.full((len(arrays), n_max), fill, dtype=np.float64)
+    weights = np.zeros((len(arrays), n_max))
+    for i, a in enumerate(arrays):
+        stacked[i, :len(a)] = a
+        weights[i, :len(a)] = 1.0
+    return stacked, weights
 
-    # Find best model
-    best_model_name = min(models, key=lambda k: models[k]['aic'])
+def fit_candidates(xs, ys):
+    """Fits every candidate family to a batch of datasets in one batched least-squares solve.
+
+    xs and ys are sequences of 1-D arrays, or equally sized (batch, n) arrays.
+    Returns (coefs, mse, aic) where coefs has shape (batch, family, 3) holding
+    [constant, u, u^2] coefficients with u = x for linear/quadratic and u = log(x) for log.
+    """
+    if not isinstance(xs, np.ndarray):
+        xs = [np.asarray(a, dtype=np.float64) for a in xs]
+        ys = [np.asarray(a, dtype=np.float64) for a in ys]
+    x, w = _pad(xs, 1.0)
+    y, _ = _pad(ys, 0.0)
+    n = w.sum(axis=-1)
+
+    # Each family is a polynomial in a standardized variable; unused columns stay zero.
+    x_mean, x_std = _standardize(x, w, n)
+    log_x = np.log(x)
+    log_mean, log_std = _standardize(log_x, w, n)
+    t = (x - x_mean[:, None]) / x_std[:, None]
+    t_log = (log_x - log_mean[:, None]) / log_std[:, None]
+    ones, zeros = np.ones_like(x), np.zeros_like(x)
+    basis = np.stack([
+        np.stack([ones, t, zeros], axis=-1),
+        np.stack([ones, t, t * t], axis=-1),
+        np.stack([ones, t_log, zeros], axis=-1),
+    ], axis=1)  # (batch, family, n, 3)
+
+    weighted = basis * w[:, None, :, None]
+    gram = np.einsum('bfni,bfnj->bfij', weighted, basis)
+    moments = np.einsum('bfni,bn->bfi', weighted, y)
+    # Pin the coefficients of unused columns to zero.
+    gram[:, [0, 2], 2, 2] = 1.0
+    try:
+        beta = np.linalg.solve(gram, moments[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        beta = (np.linalg.pinv(gram) @ moments[..., None])[..., 0]
+
+    residuals = (y[:, None, :] - np.einsum('bfni,bfi->bfn', basis, beta)) * w[:, None, :]
+    mse = (residuals ** 2).sum(axis=-1) / n[:, None]
+    aic = batched_aic(n[:, None], mse, PARAM_COUNTS)
+
+    coefs = np.empty_like(beta)
+    coefs[:, :2] = unstandardize(beta[:, :2], x_mean, x_std)
+    coefs[:, 2] = unstandardize(beta[:, 2:], log_mean, log_std)[:, 0]
+    return coefs, mse, aic
+
+def regression_from_coefs(family, coefs):
+    """A regressions.json entry from a family's [constant, u, u^2] coefficients."""
+    c0, c1, c2 = (float(c) for c in coefs)
+    if family == 'linear':
+        params = [c1, c0] # [linear_coef, intercept]
+    elif family == 'quadratic':
+        params = [c2, c1, c0] # [quadratic, linear, constant]
+    else:
+        params = [c1, c0] # [log_coef, intercept]
+    return {'type': family, 'params': params}
+
+def fit_regressions(datasets):
+    """Finds the best regression (by AIC) for each {name: (x, y)} dataset in a single batched fit."""
+    names = list(datasets)
+    coefs, _, aic = fit_candidates([datasets[k][0] for k in names], [datasets[k][1] for k in names])
+    best = np.argmin(aic, axis=1)
     return {
-        'type': best_model_name,
-        'params': models[best_model_name]['params']
+        name: regression_from_coefs(FAMILIES[best[i]], coefs[i, best[i]])
+        for i, name in enumerate(names)
     }
 
-# Load the datasets
-lichess_data = pd.read_csv('lichess_to_chess_com_data.csv')
-chess_com_data = pd.read_csv('chess_com_to_chess_com_data.csv')
+def round_regressions(regressions, digits=SIGNIFICANT_DIGITS):
+    """The regressions with every parameter rounded to the given significant digits."""
+    return {name: {**regression, 'params': [float(f'{p:.{digits}g}') for p in regression['params']]}
+            for name, regression in regressions.items()}
+
+def find_best_regression(x, y):
+    """Finds the best regression model (linear, quadratic, or log) based on AIC."""
+    return fit_regressions({'best': (x, y)})['best']
+
+def _predict(family, coefs, ratings):
+    """Evaluates [constant, u, u^2] coefficients (batch, 3) at ratings, giving (batch, ratings)."""
+    u = ratings
+    if family == 'log':
+        with np.errstate(divide='ignore'):
+            u = np.log(ratings)
+    return coefs[:, :1] + coefs[:, 1:2] * u + coefs[:, 2:] * u ** 2
+
+def _half_widths(simulated):
+    """Half-width of the central INTERVAL_LEVEL interval of (replicates, ratings) simulations."""
+    tail = (1 - INTERVAL_LEVEL) / 2
+    with np.errstate(invalid='ignore'):
+        lower, upper = np.quantile(simulated, [tail, 1 - tail], axis=0)
+    return (upper - lower) / 2
+
+def _interval_half_widths(family, coefs, residuals, ratings):
+    """Half-width of the central INTERVAL_LEVEL prediction interval at each rating."""
+    with np.errstate(invalid='ignore'):
+        return _half_widths(_predict(family, coefs, ratings) + residuals[:, None])
+
+def _refit_predictions(candidate, x, y, indices, ratings):
+    """Refits a model_selection candidate to each resample and predicts at the ratings."""
+    fit = CANDIDATES[candidate]
+    return np.array([predict_regression(fit(x[i], y[i]), ratings) for i in indices])
+
+def bootstrap_intervals(x, y, regression, n_samples=BOOTSTRAP_SAMPLES, seed=0, executor=None, candidate=None):
+    """Estimates per-rating prediction intervals for a fitted regression by a residual-augmented pairs bootstrap.
+
+    Linear, quadratic and log resamples are refitted in one batched solve; the quantiles are
+    taken on an INTERVAL_STEP grid (split across the executor's workers when one is given)
+    and interpolated to every rating from 0 to LUT_MAX_RATING. Other families need the
+    model_selection candidate that produced them, which is refitted per resample.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, len(x), size=(n_samples, len(x)))
+
+    # Each replicate also draws one new observation error from the full-data residuals.
+    residuals = y - predict_regression(regression, x)
+    residuals = rng.choice(residuals - residuals.mean(), size=n_samples)
+
+    grid = np.arange(0, LUT_MAX_RATING + INTERVAL_STEP, INTERVAL_STEP, dtype=np.float64)
+    if regression['type'] not in FAMILIES:
+        chunks = np.array_split(indices, os.cpu_count() or 1)
+        mapper = executor.map if executor is not None else map
+        predictions = np.concatenate(list(mapper(
+            _refit_predictions, repeat(candidate), repeat(x), repeat(y), chunks, repeat(grid)
+        )))
+        half_widths = _half_widths(predictions + residuals[:, None])
+    else:
+        coefs = fit_candidates(x[indices], y[indices])[0][:, FAMILIES.index(regression['type'])]
+        if executor is None:
+            half_widths = _interval_half_widths(regression['type'], coefs, residuals, grid)
+        else:
+            slices = np.array_split(grid, os.cpu_count() or 1)
+            half_widths = np.concatenate(list(executor.map(
+                _interval_half_widths, repeat(regression['type']), repeat(coefs), repeat(residuals), slices
+            )))
+
+    finite = np.isfinite(half_widths)
+    ratings = np.arange(LUT_MAX_RATING + 1)
+    return np.interp(ratings, grid[finite], half_widths[finite])
+
+def build_interval_table(datasets, regressions, n_samples=BOOTSTRAP_SAMPLES, workers=None, candidates=None, skip=()):
+    """Builds an int16 table of interval half-widths with the same layout as the lookup table.
+
+    The rows of the categories in skip are left at zero, which the readers show as no interval.
+    """
+    candidates = candidates or {}
+    table = np.zeros((len(CATEGORIES), LUT_MAX_RATING + 1), dtype='<i2')
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        for row, category in enumerate(CATEGORIES):
+            if category in skip:
+                continue
+            x, y = datasets[category]
+            half_widths = bootstrap_intervals(x, y, regressions[category], n_samples, seed=row, executor=executor,
+                                              candidate=candidates.get(category))
+            table[row] = np.clip(np.round(half_widths), 0, np.iinfo(np.int16).max)
+    return table
+
+def main():
+    parser = argparse.ArgumentParser(description='Fits the Lichess to Chess.com regression models.')
+    parser.add_argument('--bootstrap-samples', type=int, default=BOOTSTRAP_SAMPLES,
+                        help='Bootstrap resamples per category for the prediction intervals (0 to skip)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for the bootstrap and model selection')
+    parser.add_argument('--selection', choices=['aic', 'cv'], default='aic',
+                        help='Choose between linear/quadratic/log by in-sample AIC (default), or between all '
+                             'registered model_selection candidates by k-fold cross-validation')
+    parser.add_argument('--candidates', nargs='+', choices=sorted(CANDIDATES), help='Candidates for --selection cv')
+    parser.add_argument('--folds', type=int, default=CV_FOLDS, help='Cross-validation folds for --selection cv')
+    parser.add_argument('--paired', nargs='+', metavar='PATH',
+                        help='Fit from CSV/Parquet files of paired ratings in one streaming pass instead. Categories '
+                             'without paired ratings keep using the comparison tables. Categories fitted from '
+                             'paired ratings get no prediction interval')
+    args = parser.parse_args()
+    if args.paired and args.selection == 'cv':
+        parser.error('--paired only supports --selection aic')
+
+    # Load the datasets
+    with span('load data'):
+        datasets = load_datasets()
+
+    chosen, paired = {}, {}
+    if args.selection == 'cv':
+        with span('select models', candidates=len(args.candidates or CANDIDATES)):
+            regressions, scores = select_models(datasets, args.candidates, args.folds, workers=args.workers)
+        for category, category_scores in scores.items():
+            chosen[category] = min(category_scores, key=category_scores.get)
+            print(f"{category}: {chosen[category]} (CV MSE {category_scores[chosen[category]]:.1f})")
+    else:
+        with span('fit regressions'):
+            regressions = fit_regressions(datasets)
+    if args.paired:
+        from streaming_fit import accumulate_files, fit_statistics
+
+        with span('streaming fit', files=len(args.paired)):
+            paired = fit_statistics(accumulate_files(args.paired, workers=args.workers))
+        regressions.update(paired)
+        print(f"Fitted {', '.join(paired) or 'no categories'} from the paired ratings in {', '.join(args.paired)}.")
 
-# --- Regressions ---
-regressions = {}
+    # Every artifact below is built from the rounded models, so they all agree with regressions.json
+    regressions = round_regressions(regressions)
+    with open('regressions.json', 'w') as f:
+        json.dump(regressions, f, indent=2)
 
-# Blitz
-df_blitz = lichess_data[['lichess_blitz', 'chess_com_blitz']].dropna()
-regressions['BLITZ'] = find_best_regression(df_blitz['lichess_blitz'], df_blitz['chess_com_blitz'])
+    print("Successfully created regressions.json with the best-fit models.")
 
-# Bullet
-l_b_vs_c_b = lichess_data[['lichess_bullet', 'chess_com_blitz']].dropna()
-c_b_vs_c_b = chess_com_data[['chess_com_blitz', 'chess_com_bullet']].dropna()
-interp_bullet_ratings = np.interp(l_b_vs_c_b['chess_com_blitz'], c_b_vs_c_b['chess_com_blitz'], c_b_vs_c_b['chess_com_bullet'])
-regressions['BULLET'] = find_best_regression(l_b_vs_c_b['lichess_bullet'], interp_bullet_ratings)
+    with span('lookup table'):
+        lookup_table = build_lookup_table(regressions)
+        write_lookup_table(lookup_table, LUT_PATH)
+    print(f"Successfully compiled the lookup table into {LUT_PATH}.")
 
-# Rapid
-l_r_vs_c_b = lichess_data[['lichess_rapid', 'chess_com_blitz']].dropna()
-c_b_vs_c_r = chess_com_data[['chess_com_blitz', 'chess_com_rapid']].dropna()
-interp_rapid_ratings = np.interp(l_r_vs_c_b['chess_com_blitz'], c_b_vs_c_r['chess_com_blitz'], c_b_vs_c_r['chess_com_rapid'])
-regressions['RAPID'] = find_best_regression(l_r_vs_c_b['lichess_rapid'], interp_rapid_ratings)
+    with span('inverse table'):
+        for category in CATEGORIES:
+            decreasing = non_monotone_ratings(regressions[category])
+            if len(decreasing):
+                print(f"Warning: the {category} model decreases at {len(decreasing)} ratings from {decreasing[0]}; "
+                      "its reverse conversion uses the lowest Lichess rating reaching each estimate.")
+        inverse_table = build_inverse_table(regressions)
+        write_lookup_table(inverse_table, INVERSE_PATH)
+    print(f"Successfully compiled the inverse lookup table into {INVERSE_PATH}.")
 
-# Classical
-df_classical = lichess_data[['lichess_classical', 'chess_com_blitz']].dropna()
-regressions['CLASSICAL'] = find_best_regression(df_classical['lichess_classical'], df_classical['chess_com_blitz'])
+    # The bootstrap resamples the in-memory datasets, which paired files are too large to be, so
+    # the categories fitted from paired ratings get zero rows: no interval rather than a stale one.
+    if args.bootstrap_samples > 0:
+        with span('bootstrap intervals', samples=args.bootstrap_samples):
+            interval_table = build_interval_table(datasets, regressions, args.bootstrap_samples, args.workers, chosen,
+                                                  skip=paired)
+        write_lookup_table(interval_table, INTERVAL_PATH)
+        print(f"Successfully wrote {INTERVAL_LEVEL:.0%} prediction intervals into {INTERVAL_PATH}.")
+    else:
+        interval_table = np.array(load_lookup_table(INTERVAL_PATH)) if os.path.exists(INTERVAL_PATH) else None
+        if interval_table is not None and paired:
+            interval_table[[CATEGORIES.index(category) for category in paired]] = 0
+            write_lookup_table(interval_table, INTERVAL_PATH)
+    for category in paired:
+        print(f"{category} has no prediction interval, since it was fitted from paired ratings.")
 
+    with span('model artifact'):
+        write_artifact(ARTIFACT_PATH, regressions, lookup_table, interval_table, inverse_table)
+    print(f"Successfully wrote the models and tables into {ARTIFACT_PATH}.")
 
-with open('regressions.json', 'w') as f:
-    json.dump(regressions, f, indent=2)
+    with span('models module'):
+        write_models_module(regressions, interval_table, MODELS_JS_PATH)
+    print(f"Successfully generated {MODELS_JS_PATH} for the extension.")
 
-print("Successfully created regressions.json with the best-fit models.")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,381 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from convert_ratings import convert
+from model_artifact import ARTIFACT_PATH, load_models
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+CACHE_SIZE = 10_000
+# Seconds between checks of the model file's modification time.
+RELOAD_INTERVAL = 1.0
+MAX_BODY_SIZE = 64 * 1024 * 1024
+# Larger request bodies are answered without being cached.
+CACHE_MAX_BODY = 4096
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+class RequestError(Exception):
+    """A client error, answered with its status and message; close ends the connection after the answer."""
+    def __init__(self, message, status=400, close=False):
+        super().__init__(message)
+        self.status = status
+        self.close = close
+
+class LRUCache:
+    """Least-recently-used cache of encoded responses."""
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if self.size <= 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+class ConversionBatcher:
+    """Merges the conversions requested during one event-loop iteration into a single
+    vectorized convert call per category, however many connections they came from."""
+    def __init__(self, service):
+        self.service = service
+        self.pending = []
+        self.flushes = 0
+
+    def submit(self, category, ratings):
+        future = asyncio.get_running_loop().create_future()
+        if not self.pending:
+            asyncio.get_running_loop().call_soon(self.flush)
+        self.pending.append((category, ratings, future))
+        return future
+
+    def flush(self):
+        pending, self.pending = self.pending, []
+        self.flushes += 1
+        by_category = {}
+        for category, ratings, future in pending:
+            by_category.setdefault(category, []).append((ratings, future))
+        for category, requests in by_category.items():
+            try:
+                merged = np.concatenate([ratings for ratings, _ in requests])
+                converted = convert(merged, category, self.service.regressions)
+            except Exception as e:
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            start = 0
+            for ratings, future in requests:
+                if not future.done():
+                    future.set_result(converted[start:start + len(ratings)])
+                start += len(ratings)
+
+def _to_json_values(converted):
+    """Converted ratings as JSON values, with None where the input rating was missing."""
+    if converted.dtype == np.int64:
+        return converted.tolist()
+    return [None if np.isnan(v) else int(v) for v in converted]
+
+def _parse_ratings(values):
+    try:
+        ratings = np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+    except (TypeError, ValueError):
+        raise RequestError('Ratings must be numbers or null')
+    if np.isinf(ratings).any():
+        raise RequestError('Ratings must be finite')
+    return ratings
+
+class ConversionService:
+    """Serves conversions from a model artifact or regressions.json file, reloading it when the file changes.
+
+    GET  /convert?category=blitz&rating=1500[&rating=...]
+    POST /convert  {"category": "blitz", "ratings": [...]} or [{"category": ..., "rating": ...}, ...]
+    POST /convert  NDJSON (Content-Type: application/x-ndjson), one {"category", "rating"} per line,
+                   answered line by line as the request streams in
+    GET  /health
+    """
+    def __init__(self, path=ARTIFACT_PATH, cache_size=CACHE_SIZE, reload_interval=RELOAD_INTERVAL):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.cache = LRUCache(cache_size)
+        self.batcher = ConversionBatcher(self)
+        self.regressions = None
+        self.mtime = None
+        self.checked = 0.0
+        self.reloads = 0
+        self.requests = 0
+        self._load()
+
+    def _load(self):
+        mtime = os.stat(self.path).st_mtime_ns
+        regressions = load_models(self.path)
+        self.regressions = {category.upper(): model for category, model in regressions.items()}
+        self.mtime = mtime
+        self.cache.clear()
+
+    def maybe_reload(self):
+        """Reloads the models if the file changed, checking at most once per reload_interval."""
+        now = time.monotonic()
+        if now - self.checked < self.reload_interval:
+            return
+        self.checked = now
+        try:
+            if os.stat(self.path).st_mtime_ns != self.mtime:
+                self._load()
+                self.reloads += 1
+                print(f"Reloaded models from {self.path}", flush=True)
+        except (OSError, ValueError) as e:
+            # Keep serving the last good models while the file is being rewritten.
+            print(f"Could not reload {self.path}: {e}", flush=True)
+
+    def _category(self, category):
+        if not isinstance(category, str) or category.upper() not in self.regressions:
+            raise RequestError(f'Unknown category: {category}')
+        return category.upper()
+
+    async def convert(self, category, ratings):
+        return await self.batcher.submit(self._category(category), ratings)
+
+    async def convert_records(self, records):
+        """Converts a list of {"category", "rating"} objects, one batched call per category."""
+        if not all(isinstance(r, dict) for r in records):
+            raise RequestError('Expected objects with a category and a rating')
+        groups = {}
+        for i, record in enumerate(records):
+            groups.setdefault(self._category(record.get('category')), []).append(i)
+        results = [None] * len(records)
+        categories = list(groups)
+        converted = await asyncio.gather(*(
+            self.convert(c, _parse_ratings([records[i].get('rating') for i in groups[c]])) for c in categories))
+        for category, values in zip(categories, converted):
+            for i, value in zip(groups[category], _to_json_values(values)):
+                results[i] = {**records[i], 'category': category, 'chess_com': value}
+        return results
+
+    async def handle_get(self, target):
+        parts = urlsplit(target)
+        if parts.path == '/health':
+            return {'status': 'ok', 'categories': sorted(self.regressions), 'reloads': self.reloads}
+        if parts.path != '/convert':
+            raise RequestError(f'Not found: {parts.path}', 404)
+        query = parse_qs(parts.query)
+        if 'category' not in query or 'rating' not in query:
+            raise RequestError('Expected category and rating query parameters')
+        category = self._category(query['category'][0])
+        ratings = _parse_ratings(query['rating'])
+        converted = _to_json_values(await self.convert(category, ratings))
+        if len(converted) > 1:
+            return {'category': category, 'ratings': converted}
+        rating = float(ratings[0])
+        rating = None if np.isnan(rating) else int(rating) if rating.is_integer() else rating
+        return {'category': category, 'rating': rating, 'chess_com': converted[0]}
+
+    async def handle_json(self, body):
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise RequestError('Invalid JSON body')
+        if isinstance(payload, list):
+            return await self.convert_records(payload)
+        if isinstance(payload, dict) and 'ratings' in payload:
+            if not isinstance(payload['ratings'], list):
+                raise RequestError('ratings must be a list')
+            converted = await self.convert(payload.get('category'), _parse_ratings(payload['ratings']))
+            return {'category': payload['category'].upper(), 'ratings': _to_json_values(converted)}
+        if isinstance(payload, dict):
+            return (await self.convert_records([payload]))[0]
+        raise RequestError('Expected an object or an array of objects')
+
+    async def handle_ndjson(self, lines, writer):
+        """Converts each batch of complete NDJSON lines as it arrives and streams the answers back."""
+        buffered = b''
+        async for chunk in lines:
+            buffered += chunk
+            complete, _, buffered = buffered.rpartition(b'\n')
+            if complete:
+                await self._write_ndjson(complete.split(b'\n'), writer)
+        if buffered.strip():
+            await self._write_ndjson([buffered], writer)
+        writer.write(b'0\r\n\r\n')
+
+    async def _write_ndjson(self, lines, writer):
+        try:
+            records = [json.loads(line) for line in lines if line.strip()]
+        except ValueError:
+            raise RequestError('Invalid NDJSON line')
+        if not records:
+            return
+        results = await self.convert_records(records)
+        data = ''.join(json.dumps(r, separators=(',', ':')) + '\n' for r in results).encode()
+        writer.write(b'%x\r\n%s\r\n' % (len(data), data))
+        await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                keep_alive = await self._handle_request(head, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, head, reader, writer):
+        self.requests += 1
+        lines = head.decode('latin-1').split('\r\n')
+        method, target, version = (lines[0].split(' ') + ['', '', ''])[:3]
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+        body = _body_chunks(reader, headers)
+        streaming = False
+        try:
+            self.maybe_reload()
+            if method == 'GET':
+                key = ('GET', target)
+                response = self.cache.get(key) if target.startswith('/convert') else None
+                if response is None:
+                    response = _encode(await self.handle_get(target))
+                    if target.startswith('/convert'):
+                        self.cache.put(key, response)
+            elif method == 'POST' and urlsplit(target).path == '/convert':
+                if 'ndjson' in headers.get('content-type', ''):
+                    writer.write(_response_head(200, 'application/x-ndjson', keep_alive))
+                    streaming = True
+                    await self.handle_ndjson(body, writer)
+                    return keep_alive
+                payload = b''.join([chunk async for chunk in body])
+                cacheable = len(payload) <= CACHE_MAX_BODY
+                response = self.cache.get(('POST', payload)) if cacheable else None
+                if response is None:
+                    response = _encode(await self.handle_json(payload))
+                    if cacheable:
+                        self.cache.put(('POST', payload), response)
+            elif method == 'POST':
+                raise RequestError(f'Not found: {target}', 404)
+            else:
+                raise RequestError(f'Method not allowed: {method}', 405)
+            status = 200
+        except RequestError as e:
+            if streaming:
+                # The status line is already sent; end the stream with the error as its last line.
+                data = _encode({'error': str(e)})
+                writer.write(b'%x\r\n%s\r\n0\r\n\r\n' % (len(data), data))
+                return False
+            status, response = e.status, _encode({'error': str(e)})
+            keep_alive = keep_alive and e.status != 413 and not e.close
+        if keep_alive:
+            # Skip whatever body the handler left unread (a GET's, or one sent with an error),
+            # so the next request on the connection starts at its request line.
+            try:
+                async for _ in body:
+                    pass
+            except RequestError:
+                keep_alive = False
+        writer.write(_response_head(status, 'application/json', keep_alive, len(response)) + response)
+        return keep_alive
+
+async def _body_chunks(reader, headers):
+    """Yields the request body as it arrives, for Content-Length and chunked requests."""
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        total = 0
+        while True:
+            try:
+                size = int((await reader.readline()).split(b';')[0], 16)
+            except ValueError:
+                raise RequestError('Invalid chunked request body', close=True)
+            if size == 0:
+                await reader.readline()
+                return
+            total += size
+            if total > MAX_BODY_SIZE:
+                raise RequestError('Request body too large', 413)
+            try:
+                chunk = await reader.readexactly(size)
+                await reader.readexactly(2)
+            except asyncio.IncompleteReadError:
+                raise RequestError('Incomplete request body', close=True)
+            yield chunk
+    else:
+        try:
+            remaining = int(headers.get('content-length', 0))
+        except ValueError:
+            remaining = -1
+        if remaining < 0:
+            raise RequestError('Invalid Content-Length', close=True)
+        if remaining > MAX_BODY_SIZE:
+            raise RequestError('Request body too large', 413)
+        while remaining > 0:
+            chunk = await reader.read(min(remaining, 1 << 16))
+            if not chunk:
+                raise RequestError('Incomplete request body', close=True)
+            remaining -= len(chunk)
+            yield chunk
+
+def _encode(payload):
+    return json.dumps(payload, separators=(',', ':')).encode() + b'\n'
+
+def _response_head(status, content_type, keep_alive, length=None):
+    head = [f'HTTP/1.1 {status} {STATUS_TEXT[status]}', f'Content-Type: {content_type}',
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    head.append(f'Content-Length: {length}' if length is not None else 'Transfer-Encoding: chunked')
+    return ('\r\n'.join(head) + '\r\n\r\n').encode()
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, path=ARTIFACT_PATH, cache_size=CACHE_SIZE, ready=None):
+    """Runs the service until cancelled; ready, if given, is called with (server, service) once listening."""
+    service = ConversionService(path, cache_size)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    if ready:
+        ready(server, service)
+    else:
+        address = server.sockets[0].getsockname()
+        print(f"Serving conversions from {path} on http://{address[0]}:{address[1]}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description='Serves Lichess to Chess.com rating conversions over HTTP.')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='Address to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port to listen on')
+    parser.add_argument('--regressions', default=ARTIFACT_PATH, help='Model artifact or regressions.json to serve (reloaded when it changes)')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE, help='Responses kept in the LRU cache (0 to disable)')
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.regressions, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
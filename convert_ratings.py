@@ -0,0 +1,401 @@
+import argparse
+import base64
+import json
+import os
+import sys
+
+import numpy as np
+
+REGRESSIONS_PATH = 'regressions.json'
+CATEGORIES = ['BLITZ', 'BULLET', 'RAPID', 'CLASSICAL']
+
+# Compiled lookup table: one little-endian int16 row of LUT_MAX_RATING + 1 entries
+# per category, in CATEGORIES order, indexed directly by the Lichess rating.
+LUT_PATH = 'regressions_lut.bin'
+LUT_MAX_RATING = 4000
+
+# Bootstrap prediction-interval half-widths, in the same layout as the lookup table.
+INTERVAL_PATH = 'regressions_interval.bin'
+
+# Inverse lookup table: for each category, the Lichess rating estimated closest to each
+# Chess.com rating from 0 to LUT_MAX_RATING, in the same layout as the lookup table.
+INVERSE_PATH = 'regressions_inverse.bin'
+
+# Generated content-script module with the models inlined (see write_models_module).
+MODELS_JS_PATH = 'lichess2chess_models.js'
+
+# Input columns converted by the CLI when no --column is given.
+DEFAULT_COLUMNS = {
+    'lichess_blitz': 'BLITZ',
+    'lichess_bullet': 'BULLET',
+    'lichess_rapid': 'RAPID',
+    'lichess_classical': 'CLASSICAL',
+}
+
+_regressions_cache = {}
+
+def load_regressions(path=REGRESSIONS_PATH):
+    """Loads the regression models, reading each file only once."""
+    path = os.path.abspath(path)
+    if path not in _regressions_cache:
+        with open(path, 'r') as f:
+            _regressions_cache[path] = json.load(f)
+    return _regressions_cache[path]
+
+def js_round(values):
+    """Rounds like JavaScript's Math.round (halves go towards +infinity), in place."""
+    floor = np.floor(values)
+    with np.errstate(invalid='ignore'):
+        np.subtract(values, floor, out=values)
+    np.greater_equal(values, 0.5, out=values)
+    np.add(values, floor, out=values)
+    return values
+
+def _segments(knots, x):
+    """Index of the knot interval holding each x; ratings outside the knots use the end intervals."""
+    return np.clip(np.searchsorted(knots, x, side='right') - 1, 0, len(knots) - 2)
+
+def pchip_slopes(knots, values):
+    """Fritsch-Carlson slopes at each knot; the ends use the adjacent secant so extrapolation is linear."""
+    h = np.diff(knots)
+    delta = np.diff(values) / h
+    slopes = np.empty_like(values)
+    slopes[0], slopes[-1] = delta[0], delta[-1]
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    same_sign = delta[:-1] * delta[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        harmonic = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+    slopes[1:-1] = np.where(same_sign, harmonic, 0.0)
+    return slopes
+
+def predict_regression(regression, ratings):
+    """Evaluates a regression model for an array of ratings without rounding."""
+    x = np.asarray(ratings, dtype=np.float64)
+    params = regression['params']
+
+    # The operation order mirrors the JavaScript so results are bit-identical.
+    if regression['type'] == 'linear':
+        p1, p2 = params
+        result = x * p1
+        result += p2
+    elif regression['type'] == 'quadratic':
+        p1, p2, p3 = params
+        result = x * x
+        result *= p1
+        result += x * p2
+        result += p3
+    elif regression['type'] == 'log':
+        p1, p2 = params
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.log(x)
+        result *= p1
+        result += p2
+    elif regression['type'] == 'polynomial':
+        # params: coefficients from the highest power down, evaluated with Horner's rule
+        result = np.full_like(x, params[0])
+        for p in params[1:]:
+            result *= x
+            result += p
+    elif regression['type'] in ('piecewise_linear', 'pchip'):
+        # params: the knots followed by the values at the knots
+        knots = np.asarray(params[:len(params) // 2], dtype=np.float64)
+        values = np.asarray(params[len(params) // 2:], dtype=np.float64)
+        i = _segments(knots, x)
+        h = knots[i + 1] - knots[i]
+        if regression['type'] == 'piecewise_linear':
+            result = values[i] + (values[i + 1] - values[i]) / h * (x - knots[i])
+        else:
+            slopes = pchip_slopes(knots, values)
+            t = (x - knots[i]) / h
+            inside = (x >= knots[0]) & (x <= knots[-1])
+            hermite = (values[i] * (1 + 2 * t) * (1 - t) ** 2 + h * slopes[i] * t * (1 - t) ** 2
+                       + values[i + 1] * t ** 2 * (3 - 2 * t) + h * slopes[i + 1] * t ** 2 * (t - 1))
+            end = np.where(x < knots[0], 0, len(knots) - 1)
+            linear = values[end] + slopes[end] * (x - knots[end])
+            result = np.where(inside, hermite, linear)
+    else:
+        raise ValueError(f"Unknown regression type: {regression['type']}")
+    return result
+
+def evaluate_regression(regression, ratings):
+    """Evaluates a regression model for an array of ratings, matching calculateRegression in lichess2chess.js.
+
+    A single rating gives a 0-d array.
+    """
+    # Rounded and clamped in place, which needs an array (0-d) rather than a NumPy scalar for a single rating
+    result = np.asarray(predict_regression(regression, ratings))
+    js_round(result)
+    # Return 0 if the result is negative (can't have negative ratings)
+    np.maximum(result, 0, out=result)
+    return result
+
+def convert(ratings, category, regressions=None):
+    """Converts Lichess ratings to Chess.com ratings for a category (BLITZ, BULLET, RAPID or CLASSICAL).
+
+    Returns an int64 array, or a float64 array with NaN where the input rating was missing
+    (a NumPy scalar for a single rating). Infinite ratings, and ratings so large that their
+    estimate does not fit in an int64, are treated as missing.
+    """
+    if regressions is None:
+        regressions = load_regressions()
+    category = category.upper()
+    if category not in regressions:
+        raise KeyError(f"Unknown category: {category}")
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        result = evaluate_regression(regressions[category], ratings)
+    ratings = np.broadcast_to(np.asarray(ratings, dtype=np.float64), result.shape)
+    # 2**63 itself does not fit, so estimates must be strictly below it
+    result[np.isinf(ratings) | ~(result < 2.0 ** 63)] = np.nan
+    if not np.isnan(result).any():
+        result = result.astype(np.int64)
+    # [()] turns the 0-d result of a single rating into a scalar and leaves arrays as they are
+    return result[()]
+
+def build_lookup_table(regressions):
+    """Evaluates every category's model for each rating from 0 to LUT_MAX_RATING."""
+    ratings = np.arange(LUT_MAX_RATING + 1, dtype=np.float64)
+    table = np.empty((len(CATEGORIES), LUT_MAX_RATING + 1), dtype='<i2')
+    for row, category in enumerate(CATEGORIES):
+        converted = evaluate_regression(regressions[category], ratings)
+        table[row] = np.minimum(converted, np.iinfo(np.int16).max)
+    return table
+
+def _clamped_estimates(regression, ratings):
+    """Unrounded estimates with the extension's clamping at 0 (log(0) and other non-finite values become 0)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        estimates = predict_regression(regression, ratings)
+    return np.maximum(np.nan_to_num(estimates, nan=0.0, posinf=0.0, neginf=0.0), 0)
+
+def non_monotone_ratings(regression):
+    """Lichess ratings from 1 to LUT_MAX_RATING whose estimate is lower than the previous rating's.
+
+    Empty when the model is monotone, so every Chess.com rating has a single inverse.
+    """
+    estimates = _clamped_estimates(regression, np.arange(LUT_MAX_RATING + 1, dtype=np.float64))
+    return np.flatnonzero(np.diff(estimates) < 0) + 1
+
+def build_inverse_table(regressions):
+    """For every category and each Chess.com rating from 0 to LUT_MAX_RATING, the Lichess rating that converts to it.
+
+    Ratings between two Lichess ratings' estimates are interpolated and rounded; Chess.com ratings
+    above the highest estimate map to LUT_MAX_RATING. A non-monotone model is inverted through its
+    running maximum, i.e. the lowest Lichess rating reaching each estimate (see non_monotone_ratings).
+    """
+    ratings = np.arange(LUT_MAX_RATING + 1, dtype=np.float64)
+    table = np.empty((len(CATEGORIES), LUT_MAX_RATING + 1), dtype='<i2')
+    for row, category in enumerate(CATEGORIES):
+        estimates = np.maximum.accumulate(_clamped_estimates(regressions[category], ratings))
+        # Flat runs (e.g. ratings clamped to 0) invert to their lowest rating.
+        first = np.concatenate([[True], np.diff(estimates) > 0])
+        inverse = np.interp(ratings, estimates[first], ratings[first])
+        table[row] = js_round(inverse)
+    return table
+
+def write_lookup_table(table, path=LUT_PATH):
+    table.astype('<i2', copy=False).tofile(path)
+
+_lookup_table_cache = {}
+
+def load_lookup_table(path=LUT_PATH):
+    """Memory-maps the compiled lookup table as a (categories, ratings) int16 array."""
+    path = os.path.abspath(path)
+    if path not in _lookup_table_cache:
+        table = np.memmap(path, dtype='<i2', mode='r')
+        _lookup_table_cache[path] = table.reshape(len(CATEGORIES), LUT_MAX_RATING + 1)
+    return _lookup_table_cache[path]
+
+def lookup(ratings, category, table=None):
+    """Converts integer ratings with a single index into the lookup table.
+
+    Ratings are clamped to 0..LUT_MAX_RATING, like reverse_lookup.
+    """
+    if table is None:
+        table = load_lookup_table()
+    row = CATEGORIES.index(category.upper())
+    # take's clip mode clamps the indices while gathering, without a separate pass over them
+    return table[row].take(np.asarray(ratings, dtype=np.intp), mode='clip')
+
+def reverse_lookup(ratings, category, table=None):
+    """Converts Chess.com ratings back to Lichess ratings with a single index into the inverse table.
+
+    Ratings are rounded and clamped to 0..LUT_MAX_RATING. Missing (NaN) and infinite ratings are
+    treated as missing, like convert does: the result is then a float64 array with NaN for them.
+    """
+    if table is None:
+        table = load_lookup_table(INVERSE_PATH)
+    row = CATEGORIES.index(category.upper())
+    x = np.array(ratings, dtype=np.float64)
+    missing = ~np.isfinite(x)
+    x[missing] = 0
+    index = np.clip(js_round(x), 0, LUT_MAX_RATING).astype(np.intp)
+    result = table[row][index]
+    if missing.any():
+        result = result.astype(np.float64)
+        result[missing] = np.nan
+    return result
+
+def _js_number(value):
+    """Shortest round-tripping literal, which JavaScript parses to the same double."""
+    return repr(float(value))
+
+def _js_array(values):
+    return '[' + ', '.join(_js_number(v) for v in values) + ']'
+
+def compile_regression_js(regression):
+    """JavaScript source of a function evaluating the regression with its parameters inlined.
+
+    The expressions follow calculateRegression's operation order, rounding and clamping,
+    so the compiled function returns exactly what convert does.
+    """
+    params = [_js_number(p) for p in regression['params']]
+    kind = regression['type']
+    if kind == 'linear':
+        body = f'{params[0]} * x + {params[1]}'
+    elif kind == 'quadratic':
+        body = f'{params[1]} * x + {params[0]} * (x ** 2) + {params[2]}'
+    elif kind == 'log':
+        body = f'{params[0]} * Math.log(x) + {params[1]}'
+    elif kind == 'polynomial':
+        body = params[0]
+        for p in params[1:]:
+            body = f'({body}) * x + {p}'
+    elif kind in ('piecewise_linear', 'pchip'):
+        knots = np.asarray(regression['params'][:len(params) // 2], dtype=np.float64)
+        values = np.asarray(regression['params'][len(params) // 2:], dtype=np.float64)
+        if kind == 'piecewise_linear':
+            return f'piecewiseLinear({_js_array(knots)}, {_js_array(values)})'
+        return f'pchip({_js_array(knots)}, {_js_array(values)}, {_js_array(pchip_slopes(knots, values))})'
+    else:
+        raise ValueError(f"Unknown regression type: {kind}")
+    return f'(x) => Math.max(0, Math.round({body}))'
+
+# Shared by the compiled knot models; the segment search and formulas match evaluateKnots.
+_MODELS_JS_HELPERS = """\
+const segment = (knots, x) => {
+  let i = 0;
+  while (i < knots.length - 2 && knots[i + 1] <= x) i++;
+  return i;
+};
+
+const piecewiseLinear = (knots, values) => (x) => {
+  const i = segment(knots, x);
+  const h = knots[i + 1] - knots[i];
+  return Math.max(0, Math.round(values[i] + (values[i + 1] - values[i]) / h * (x - knots[i])));
+};
+
+const pchip = (knots, values, slopes) => (x) => {
+  if (x < knots[0] || x > knots[knots.length - 1]) {
+    const end = x < knots[0] ? 0 : knots.length - 1;
+    return Math.max(0, Math.round(values[end] + slopes[end] * (x - knots[end])));
+  }
+  const i = segment(knots, x);
+  const h = knots[i + 1] - knots[i];
+  const t = (x - knots[i]) / h;
+  return Math.max(0, Math.round(values[i] * (1 + 2 * t) * (1 - t) ** 2 + h * slopes[i] * t * (1 - t) ** 2
+    + values[i + 1] * t ** 2 * (3 - 2 * t) + h * slopes[i + 1] * t ** 2 * (t - 1)));
+};
+
+const decodeBase64 = (base64) => Uint8Array.from(atob(base64), (c) => c.charCodeAt(0));
+"""
+
+def write_models_module(regressions, interval_table=None, path=MODELS_JS_PATH):
+    """Writes the content-script module defining COMPILED_MODELS: one function per category
+    with its fitted parameters inlined, and the interval table.
+
+    The interval table is embedded as a base64 model artifact (see model_artifact.py), which
+    model_artifact.js validates before anything is annotated. The inverse table is left out:
+    Lichess pages only show Lichess ratings, so the extension never converts back. The
+    extension loads this module before lichess2chess.js, so ratings are annotated without
+    fetching or dispatching on the model type.
+    """
+    from model_artifact import artifact_bytes
+
+    if interval_table is None:
+        interval_table = np.zeros((len(CATEGORIES), LUT_MAX_RATING + 1), dtype='<i2')
+    artifact = artifact_bytes(regressions, interval_table=interval_table)
+    encoded = base64.b64encode(artifact).decode('ascii')
+    functions = ''.join(f'    {category}: {compile_regression_js(regressions[category])},\n' for category in CATEGORIES)
+    with open(path, 'w') as f:
+        f.write('// Generated by calculate_regressions.py from regressions.json; do not edit.\n')
+        f.write(_MODELS_JS_HELPERS)
+        f.write(f"\nconst MODEL_ARTIFACT = readModelArtifact(decodeBase64('{encoded}'));\n")
+        f.write('\nconst COMPILED_MODELS = {\n')
+        f.write(f'  convert: {{\n{functions}  }},\n')
+        f.write('  intervalTable: MODEL_ARTIFACT.intervalTable,\n')
+        f.write('};\n')
+
+def _detect_format(path, fmt):
+    if fmt:
+        return fmt
+    if path.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return 'csv'
+
+def _read_chunks(path, fmt, chunksize):
+    import pandas as pd
+
+    source = sys.stdin if path == '-' else path
+    if fmt == 'ndjson':
+        return pd.read_json(source, lines=True, chunksize=chunksize)
+    return pd.read_csv(source, chunksize=chunksize)
+
+def _parse_column_args(column_args):
+    columns = {}
+    for arg in column_args:
+        column, _, category = arg.partition('=')
+        if not category:
+            raise SystemExit(f"--column expects COLUMN=CATEGORY, got '{arg}'")
+        columns[column] = category.upper()
+    return columns
+
+def convert_file(input_path, output_path, columns=None, fmt=None, chunksize=1_000_000, regressions=None):
+    """Streams a CSV or NDJSON file in chunks, adding a <column>_chess_com column for each converted column."""
+    import pandas as pd
+
+    if regressions is None:
+        regressions = load_regressions()
+    fmt = _detect_format(input_path, fmt)
+    out = sys.stdout if output_path == '-' else open(output_path, 'w', newline='')
+    rows = 0
+    try:
+        for i, chunk in enumerate(_read_chunks(input_path, fmt, chunksize)):
+            chunk_columns = columns
+            if chunk_columns is None:
+                chunk_columns = {c: cat for c, cat in DEFAULT_COLUMNS.items() if c in chunk.columns}
+            for column, category in chunk_columns.items():
+                ratings = pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=np.float64)
+                converted = convert(ratings, category, regressions)
+                chunk[f'{column}_chess_com'] = pd.array(converted, dtype='Int64')
+
+            if fmt == 'ndjson':
+                chunk.to_json(out, orient='records', lines=True)
+            else:
+                chunk.to_csv(out, index=False, header=(i == 0))
+            rows += len(chunk)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Adds Chess.com rating estimates to a CSV or NDJSON file of Lichess ratings.')
+    parser.add_argument('input', help="Input CSV/NDJSON file, or '-' for stdin")
+    parser.add_argument('-o', '--output', default='-', help="Output file, or '-' for stdout (default)")
+    parser.add_argument('-c', '--column', action='append', default=[],
+                        help='Column to convert as COLUMN=CATEGORY, e.g. lichess_blitz=BLITZ (repeatable). '
+                             'Defaults to any of lichess_blitz/bullet/rapid/classical present.')
+    parser.add_argument('--format', choices=['csv', 'ndjson'], help='Input/output format (inferred from the input extension by default)')
+    parser.add_argument('--chunksize', type=int, default=1_000_000, help='Rows per streamed chunk')
+    parser.add_argument('--regressions', default=REGRESSIONS_PATH, help='Path to regressions.json')
+    args = parser.parse_args(argv)
+
+    columns = _parse_column_args(args.column) or None
+    regressions = load_regressions(args.regressions)
+    rows = convert_file(args.input, args.output, columns, args.format, args.chunksize, regressions)
+    if args.output != '-':
+        print(f"Converted {rows} rows into {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import math
+import os
+import sys
+from array import array
+
+# Conversion without NumPy: importing this module takes a few milliseconds and reads nothing.
+# These match convert_ratings, which the tests check.
+REGRESSIONS_PATH = 'regressions.json'
+LUT_PATH = 'regressions_lut.bin'
+CATEGORIES = ['BLITZ', 'BULLET', 'RAPID', 'CLASSICAL']
+LUT_MAX_RATING = 4000
+
+_tables = {}
+
+def load_table(path=LUT_PATH):
+    """Reads the compiled lookup table into a flat int16 array on first use."""
+    path = os.path.abspath(path)
+    if path not in _tables:
+        table = array('h')
+        with open(path, 'rb') as f:
+            table.frombytes(f.read())
+        if sys.byteorder == 'big':
+            table.byteswap()
+        if len(table) != len(CATEGORIES) * (LUT_MAX_RATING + 1):
+            raise ValueError(f"{path} is not a lookup table for {len(CATEGORIES)} categories")
+        _tables[path] = table
+    return _tables[path]
+
+def convert_rating(rating, category, table_path=LUT_PATH, regressions_path=REGRESSIONS_PATH):
+    """Converts one Lichess rating to Chess.com, returning an int (None for a missing rating).
+
+    Whole ratings from 0 to LUT_MAX_RATING, which covers every rating Lichess shows, are a single
+    index into the lookup table. Any other rating falls back to convert_ratings.convert, which
+    loads NumPy and the models.
+    """
+    category = category.upper()
+    if category not in CATEGORIES:
+        raise KeyError(f"Unknown category: {category}")
+    if rating is None or math.isnan(rating):
+        return None
+    if float(rating).is_integer() and 0 <= rating <= LUT_MAX_RATING:
+        return load_table(table_path)[CATEGORIES.index(category) * (LUT_MAX_RATING + 1) + int(rating)]
+
+    from convert_ratings import convert, load_regressions
+
+    converted = float(convert([rating], category, load_regressions(regressions_path))[0])
+    # convert treats infinite ratings as missing
+    return None if math.isnan(converted) else int(converted)
+
+def main():
+    parser = argparse.ArgumentParser(description='Converts Lichess ratings to Chess.com ratings without loading NumPy.')
+    parser.add_argument('ratings', nargs='+', type=float, help='Lichess ratings')
+    parser.add_argument('--category', default='BLITZ', help='BLITZ, BULLET, RAPID or CLASSICAL')
+    args = parser.parse_args()
+
+    for rating in args.ratings:
+        print(f"{rating:g} -> {convert_rating(rating, args.category)}")
+
+if __name__ == '__main__':
+    main()
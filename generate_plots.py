@@ -1,13 +1,25 @@
-import pandas as pd
+# Imported first, so that when profiling its import hook also times numpy
+from instrumentation import init_worker, span
 import numpy as np
 import json
-import matplotlib.pyplot as plt
-
-def plot_regression(x, y, regression, title, filename):
-    """Plots the data points and the regression line."""
-    plt.figure()
-    plt.scatter(x, y, label='Data')
+import argparse
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from convert_ratings import predict_regression
+from prepared_data import load_datasets
+
+PLOT_CACHE_PATH = '.plot_cache.json'
+# Bump to re-render every image after changing how plots are drawn.
+PLOT_VERSION = 1
+PLOT_TITLES = {
+    'BLITZ': 'Lichess Blitz vs. Chess.com Blitz',
+    'BULLET': 'Lichess Bullet vs. Chess.com Bullet',
+    'RAPID': 'Lichess Rapid vs. Chess.com Rapid',
+    'CLASSICAL': 'Lichess Classical vs. Chess.com Blitz',
+}
 
+def _fit_line(x, regression):
     x_fit = np.linspace(x.min(), x.max(), 100)
     y_fit = 0
 
@@ -18,64 +30,126 @@ def plot_regression(x, y, regression, title, filename):
         y_fit = regression['params'][0] * (x_fit ** 2) + regression['params'][1] * x_fit + regression['params'][2]
     elif regression['type'] == 'log':
         y_fit = regression['params'][0] * np.log(x_fit) + regression['params'][1]
+    else:
+        y_fit = predict_regression(regression, x_fit)
+    return x_fit, y_fit
+
+def _draw(ax, x, y, regression, title):
+    ax.scatter(x, y, label='Data')
+    x_fit, y_fit = _fit_line(np.asarray(x), regression)
+    ax.plot(x_fit, y_fit, color='red', label=f"{regression['type'].replace('_', ' ').capitalize()} Fit")
+    ax.set_title(title)
+    ax.set_xlabel('Lichess Rating')
+    ax.set_ylabel('Chess.com Rating')
+    ax.legend()
+    ax.grid(True)
 
-    plt.plot(x_fit, y_fit, color='red', label=f"{regression['type'].capitalize()} Fit")
-    plt.title(title)
-    plt.xlabel('Lichess Rating')
-    plt.ylabel('Chess.com Rating')
-    plt.legend()
-    plt.grid(True)
-    plt.savefig(f'images/{filename}')
-    plt.close()
-
-# Load the datasets
-lichess_data = pd.read_csv('lichess_to_chess_com_data.csv')
-chess_com_data = pd.read_csv('chess_com_to_chess_com_data.csv')
-
-with open('regressions.json', 'r') as f:
-    regressions = json.load(f)
-
-# --- Generate Plots ---
-
-# Blitz
-df_blitz = lichess_data[['lichess_blitz', 'chess_com_blitz']].dropna()
-plot_regression(df_blitz['lichess_blitz'], df_blitz['chess_com_blitz'], regressions['BLITZ'], 'Lichess Blitz vs. Chess.com Blitz', 'blitz_regression.png')
-
-# Bullet
-l_b_vs_c_b = lichess_data[['lichess_bullet', 'chess_com_blitz']].dropna()
-c_b_vs_c_b = chess_com_data[['chess_com_blitz', 'chess_com_bullet']].dropna()
-interp_bullet_ratings = np.interp(l_b_vs_c_b['chess_com_blitz'], c_b_vs_c_b['chess_com_blitz'], c_b_vs_c_b['chess_com_bullet'])
-plot_regression(l_b_vs_c_b['lichess_bullet'], interp_bullet_ratings, regressions['BULLET'], 'Lichess Bullet vs. Chess.com Bullet', 'bullet_regression.png')
-
-# Rapid
-l_r_vs_c_b = lichess_data[['lichess_rapid', 'chess_com_blitz']].dropna()
-c_b_vs_c_r = chess_com_data[['chess_com_blitz', 'chess_com_rapid']].dropna()
-interp_rapid_ratings = np.interp(l_r_vs_c_b['chess_com_blitz'], c_b_vs_c_r['chess_com_blitz'], c_b_vs_c_r['chess_com_rapid'])
-plot_regression(l_r_vs_c_b['lichess_rapid'], interp_rapid_ratings, regressions['RAPID'], 'Lichess Rapid vs. Chess.com Rapid', 'rapid_regression.png')
-
-# Classical
-df_classical = lichess_data[['lichess_classical', 'chess_com_blitz']].dropna()
-plot_regression(df_classical['lichess_classical'], df_classical['chess_com_blitz'], regressions['CLASSICAL'], 'Lichess Classical vs. Chess.com Blitz', 'classical_regression.png')
-
-print("Successfully generated and saved regression plots.")
-
-# --- Update README.md with new image paths ---
-readme_path = 'README.md'
-with open(readme_path, 'r') as f:
-    readme_content = f.read()
-
-# Define a mapping of old image URLs to new local paths
-image_updates = {
-    '![bullet_regression](https://user-images.githubusercontent.com/89805167/173907866-57c8af0d-5985-44ea-ae53-2a1ae08a8d57.png)': '![bullet_regression](images/bullet_regression.png)',
-    '![blitz_regression](https://user-images.githubusercontent.com/89805167/173907893-be119ab6-45c0-4f42-bf8c-61a5b28e187b.png)': '![blitz_regression](images/blitz_regression.png)',
-    '![rapid_regression](https://user-images.githubusercontent.com/89805167/173907914-f2d1f4c7-e64e-4ef1-a27e-cec18a6167ec.png)': '![rapid_regression](images/rapid_regression.png)',
-    '![classical_regression](https://user-images.githubusercontent.com/89805167/173907947-b99af892-cb76-4d15-b6a5-7723f57d0558.png)': '![classical_regression](images/classical_regression.png)'
-}
-
-for old_url, new_path in image_updates.items():
-    readme_content = readme_content.replace(old_url, new_path)
-
-with open(readme_path, 'w') as f:
-    f.write(readme_content)
-
-print("README.md updated with new image paths.")
\ No newline at end of file
+def plot_regression(x, y, regression, title, filename):
+    """Plots the data points and the regression line."""
+    # A bare Figure renders through the non-interactive Agg canvas, without pyplot's global state.
+    from matplotlib.figure import Figure
+
+    with span(f'render {filename}'):
+        fig = Figure()
+        _draw(fig.add_subplot(), x, y, regression, title)
+        fig.savefig(f'images/{filename}')
+
+def plot_combined(plots, filename):
+    """Plots every category as one panel of a single image."""
+    from matplotlib.figure import Figure
+
+    with span(f'render {filename}'):
+        fig = Figure(figsize=(12, 9), layout='constrained')
+        axes = fig.subplots(2, (len(plots) + 1) // 2, squeeze=False).flat
+        for ax, (x, y, regression, title, _) in zip(axes, plots):
+            _draw(ax, x, y, regression, title)
+        fig.savefig(f'images/{filename}')
+
+def plot_hash(x, y, regression, title):
+    """Hash of everything that affects a rendered plot."""
+    digest = hashlib.sha256(f'{PLOT_VERSION}:{title}:{json.dumps(regression, sort_keys=True)}'.encode())
+    digest.update(np.ascontiguousarray(x, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+def _load_plot_cache():
+    try:
+        with open(PLOT_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def render_plots(plots, combined=None, force=False, workers=None):
+    """Renders (x, y, regression, title, filename) plots in a process pool, skipping images whose data and model are unchanged.
+
+    When combined is a filename, all plots are also drawn as panels of that image.
+    Returns the filenames that were rendered.
+    """
+    cache = {} if force else _load_plot_cache()
+    hashes = {filename: plot_hash(x, y, regression, title) for x, y, regression, title, filename in plots}
+    stale = [p for p in plots if cache.get(p[4]) != hashes[p[4]] or not os.path.exists(f'images/{p[4]}')]
+
+    jobs = [(plot_regression, p) for p in stale]
+    if combined:
+        hashes[combined] = hashlib.sha256(''.join(hashes[p[4]] for p in plots).encode()).hexdigest()
+        if cache.get(combined) != hashes[combined] or not os.path.exists(f'images/{combined}'):
+            jobs.append((plot_combined, (plots, combined)))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            for future in [executor.submit(function, *args) for function, args in jobs]:
+                future.result()
+
+    cache.update(hashes)
+    with open(PLOT_CACHE_PATH, 'w') as f:
+        json.dump(cache, f, indent=2)
+    return [args[-1] for _, args in jobs]
+
+def main():
+    parser = argparse.ArgumentParser(description='Renders the regression plots used in the README.')
+    parser.add_argument('--combined', action='store_true', help='Also render every category into images/all_regressions.png')
+    parser.add_argument('--force', action='store_true', help='Re-render images even if their data and model are unchanged')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for rendering')
+    args = parser.parse_args()
+
+    # Load the datasets
+    with span('load data'):
+        datasets = load_datasets()
+
+    with open('regressions.json', 'r') as f:
+        regressions = json.load(f)
+
+    # --- Generate Plots ---
+    plots = [(*datasets[category], regressions[category], title, f'{category.lower()}_regression.png')
+             for category, title in PLOT_TITLES.items()]
+
+    with span('render plots', plots=len(plots)):
+        rendered = render_plots(plots, 'all_regressions.png' if args.combined else None, args.force, args.workers)
+    if rendered:
+        print(f"Successfully generated and saved regression plots: {', '.join(rendered)}.")
+    else:
+        print("Regression plots are already up to date.")
+
+    # --- Update README.md with new image paths ---
+    readme_path = 'README.md'
+    with open(readme_path, 'r') as f:
+        original_readme = readme_content = f.read()
+
+    # Define a mapping of old image URLs to new local paths
+    image_updates = {
+        '![bullet_regression](https://user-images.githubusercontent.com/89805167/173907866-57c8af0d-5985-44ea-ae53-2a1ae08a8d57.png)': '![bullet_regression](images/bullet_regression.png)',
+        '![blitz_regression](https://user-images.githubusercontent.com/89805167/173907893-be119ab6-45c0-4f42-bf8c-61a5b28e187b.png)': '![blitz_regression](images/blitz_regression.png)',
+        '![rapid_regression](https://user-images.githubusercontent.com/89805167/173907914-f2d1f4c7-e64e-4ef1-a27e-cec18a6167ec.png)': '![rapid_regression](images/rapid_regression.png)',
+        '![classical_regression](https://user-images.githubusercontent.com/89805167/173907947-b99af892-cb76-4d15-b6a5-7723f57d0558.png)': '![classical_regression](images/classical_regression.png)'
+    }
+
+    for old_url, new_path in image_updates.items():
+        readme_content = readme_content.replace(old_url, new_path)
+
+    if readme_content != original_readme:
+        with open(readme_path, 'w') as f:
+            f.write(readme_content)
+        print("README.md updated with new image paths.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+import argparse
+import atexit
+import contextlib
+import functools
+import glob
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Set to a directory to record spans; each process writes <script>-<pid>.json into it on exit.
+PROFILE_ENV = 'LICHESS2CHESS_PROFILE'
+TRACE_PATH = 'profile_trace.json'
+
+_events = []
+_lock = threading.Lock()
+_directory = None
+_worker = False
+# Per thread: how many import spans are open, so the import hook only times the outermost import
+_local = threading.local()
+_NULL_SPAN = contextlib.nullcontext()
+
+def _peak_rss_mb():
+    """High-water resident set size of this process and its waited-for children, in MB."""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    scale = 1 / (1024 * 1024) if sys.platform == 'darwin' else 1 / 1024
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return round(peak * scale, 1)
+
+def _cpu_seconds():
+    """CPU time of this process and its finished children (e.g. process pool workers)."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+class _Span:
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        if self.category == 'import':
+            _local.imports = getattr(_local, 'imports', 0) + 1
+        self.start_us = time.time_ns() // 1000
+        self.wall = time.perf_counter()
+        self.cpu = _cpu_seconds()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter() - self.wall
+        if self.category == 'import':
+            _local.imports -= 1
+        event = {
+            'name': self.name, 'cat': self.category, 'ph': 'X',
+            'ts': self.start_us, 'dur': round(duration * 1e6),
+            'pid': os.getpid(), 'tid': threading.get_native_id(),
+            'args': {'wall_ms': round(duration * 1000, 3),
+                     'cpu_ms': round((_cpu_seconds() - self.cpu) * 1000, 3),
+                     'peak_rss_mb': _peak_rss_mb(), **self.args},
+        }
+        with _lock:
+            _events.append(event)
+        return False
+
+class _TimedLoader:
+    """Wraps a module's loader to record its execution as an import span."""
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        try:
+            with span(f'import {module.__name__}', 'import'):
+                self.loader.exec_module(module)
+        finally:
+            # Once imported, the module only refers to its real loader
+            module.__loader__ = self.loader
+            if module.__spec__ is not None:
+                module.__spec__.loader = self.loader
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Records every import that is not already inside an import span, e.g. numpy or matplotlib.
+
+    Modules the outermost import pulls in are counted in its span rather than recorded on their own.
+    """
+    def find_spec(self, name, path=None, target=None):
+        if getattr(_local, 'imports', 0):
+            return None
+        for finder in sys.meta_path:
+            if finder is not self and hasattr(finder, 'find_spec'):
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader)
+        return spec
+
+def enabled():
+    return _directory is not None
+
+def enable(directory):
+    """Starts recording spans and import times in this process and in child processes started afterwards."""
+    global _directory
+    os.makedirs(directory, exist_ok=True)
+    os.environ[PROFILE_ENV] = os.path.abspath(directory)
+    if _directory is None:
+        atexit.register(write_events)
+    if not any(isinstance(finder, _ImportTimer) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _ImportTimer())
+    _directory = os.path.abspath(directory)
+
+def init_worker():
+    """ProcessPoolExecutor initializer that makes each worker write its own spans when it exits.
+
+    Pool workers leave through os._exit, which skips atexit, and forked ones start with a copy
+    of the parent's spans.
+    """
+    global _lock, _worker
+    if _directory is None:
+        return
+    from multiprocessing import util
+
+    _lock = threading.Lock()
+    _events.clear()
+    _worker = True
+    util.Finalize(None, write_events, exitpriority=0)
+
+def span(name, category='stage', **args):
+    """Context manager timing a named block: wall time, CPU time and peak RSS.
+
+    Does nothing unless profiling is enabled, so it can stay in the scripts.
+    """
+    if _directory is None:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+def traced(name=None, category='stage'):
+    """Decorator recording every call of a function as a span."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name or function.__name__, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def _script_name():
+    """The running script, or the package name for python -m runs (e.g. pytest)."""
+    path = sys.argv[0] if sys.argv and sys.argv[0] not in ('', '-c') else 'python'
+    name = os.path.splitext(os.path.basename(path))[0]
+    if name == '__main__':
+        name = os.path.basename(os.path.dirname(path)) or name
+    return name
+
+def write_events():
+    """Writes this process's spans as a Chrome trace into the profile directory."""
+    if _directory is None or not _events:
+        return None
+    script = _script_name()
+    path = os.path.join(_directory, f'{script}-{os.getpid()}.json')
+    name = f'{script} worker' if _worker else script
+    metadata = {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'args': {'name': name}}
+    with _lock:
+        events = [metadata] + list(_events)
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events}, f)
+    return path
+
+def load_events(directory):
+    events = []
+    for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(path, 'r') as f:
+            events.extend(json.load(f)['traceEvents'])
+    return events
+
+def merge_traces(directory, output=TRACE_PATH):
+    """Combines every process's spans into one Chrome trace (open it in chrome://tracing or Perfetto)."""
+    events = load_events(directory)
+    with open(output, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    return events
+
+def summarize(events):
+    """Totals per (process, span name): count, wall ms, CPU ms and the highest peak RSS, slowest first."""
+    names = {e['pid']: e['args']['name'] for e in events if e['ph'] == 'M'}
+    rows = {}
+    for event in events:
+        if event['ph'] != 'X':
+            continue
+        key = (names.get(event['pid'], str(event['pid'])), event['name'])
+        row = rows.setdefault(key, {'process': key[0], 'name': key[1], 'category': event['cat'],
+                                    'count': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'peak_rss_mb': None})
+        row['count'] += 1
+        row['wall_ms'] += event['args']['wall_ms']
+        row['cpu_ms'] += event['args']['cpu_ms']
+        peak = event['args'].get('peak_rss_mb')
+        if peak is not None:
+            row['peak_rss_mb'] = max(peak, row['peak_rss_mb'] or 0)
+    return sorted(rows.values(), key=lambda r: -r['wall_ms'])
+
+def print_summary(rows, file=None):
+    file = file or sys.stdout
+    print(f"\n{'Process':<22} {'Span':<32} {'Count':>5} {'Wall':>10} {'CPU':>10} {'Peak RSS':>10}", file=file)
+    for row in rows:
+        peak = f"{row['peak_rss_mb']:.0f} MB" if row['peak_rss_mb'] is not None else '-'
+        print(f"{row['process']:<22} {row['name']:<32} {row['count']:>5} {row['wall_ms']:>8.1f}ms "
+              f"{row['cpu_ms']:>8.1f}ms {peak:>10}", file=file)
+
+def main():
+    parser = argparse.ArgumentParser(description='Merges recorded spans into a Chrome trace and prints a summary.')
+    parser.add_argument('directory', help=f'Directory the scripts wrote their spans to (the {PROFILE_ENV} value)')
+    parser.add_argument('-o', '--output', default=TRACE_PATH, help='Chrome trace JSON to write')
+    args = parser.parse_args()
+
+    events = merge_traces(args.directory, args.output)
+    print_summary(summarize(events))
+    print(f"\nWrote {args.output}; open it in chrome://tracing or https://ui.perfetto.dev")
+
+if os.environ.get(PROFILE_ENV):
+    enable(os.environ[PROFILE_ENV])
+
+if __name__ == '__main__':
+    main()
@@ -7,153 +7,240 @@ const GAME_TYPES = {
   UNKNOWN: 'Unknown'
 }
 
-// Fetches regression data from the local JSON file.
-const getRegressionData = async () => {
-  try {
-    const url = chrome.runtime.getURL('regressions.json');
-    const response = await fetch(url);
-    if (!response.ok) {
-      throw new Error(`Failed to fetch regressions: ${response.statusText}`);
-    }
-    return await response.json();
-  } catch (error) {
-    console.error("Error loading regression data:", error);
-    return null;
+// Layout of the prediction-interval table in COMPILED_MODELS (see lichess2chess_models.js):
+// one int16 row of LUT_MAX_RATING + 1 entries per category, in LUT_CATEGORIES order.
+const LUT_CATEGORIES = ['BLITZ', 'BULLET', 'RAPID', 'CLASSICAL'];
+const LUT_MAX_RATING = 4000;
+
+// Maps a Lichess perf icon (data-icon) to the game type
+const gameTypeFromIcon = (dataIcon) => {
+  if (dataIcon === '') {
+      return GAME_TYPES.BLITZ;
+  } else if (dataIcon === '') {
+      return GAME_TYPES.BULLET;
+  } else if (dataIcon === '') {
+      return GAME_TYPES.RAPID;
+  } else if (dataIcon === '') {
+      return GAME_TYPES.CLASSICAL;
+  } else if (dataIcon === '') {
+      return GAME_TYPES.CORRESPONDENCE;
   }
+  return GAME_TYPES.UNKNOWN;
 }
 
 // Finds out whether the game is blitz/bullet/rapid or classical
 const findGameType = () => {
-  let type = document.querySelector('.game__meta__infos');
-
-  if (type !== null) {
-    const dataIcon = type.getAttribute('data-icon');
-    if (dataIcon === '') {
-        return GAME_TYPES.BLITZ;
-    } else if (dataIcon === '') {
-        return GAME_TYPES.BULLET;
-    } else if (dataIcon === '') {
-        return GAME_TYPES.RAPID;
-    } else if (dataIcon === '') {
-        return GAME_TYPES.CLASSICAL;
-    } else if (dataIcon === '') {
-        return GAME_TYPES.CORRESPONDENCE;
-    }
-  } 
-  return GAME_TYPES.UNKNOWN;
+  const type = document.querySelector('.game__meta__infos');
+  return type === null ? GAME_TYPES.UNKNOWN : gameTypeFromIcon(type.getAttribute('data-icon'));
 }
 
-// Finds all both ratings in a game
-const getLichessRatingsFromGame = () => {
-  const rating = document.querySelectorAll('.ruser > rating')
-  return rating
+// Category used for a game type; correspondence games use the classical model.
+const categoryFromGameType = (gameType) => {
+  if (gameType === GAME_TYPES.BLITZ) return 'BLITZ';
+  if (gameType === GAME_TYPES.BULLET) return 'BULLET';
+  if (gameType === GAME_TYPES.RAPID) return 'RAPID';
+  if (gameType === GAME_TYPES.UNKNOWN) return null;
+  return 'CLASSICAL';
 }
 
-const getLichessRatingsFromProfile = () => {
-  const ratings = document.querySelectorAll('.sub-ratings rating')
-  return ratings
+// Category from a perf link such as /@/user/perf/blitz or /player/top/200/blitz.
+const categoryFromHref = (href) => {
+  const match = /\/(?:perf|top\/\d+)\/(bullet|blitz|rapid|classical)(?:[/?#]|$)/.exec(href || '');
+  return match ? match[1].toUpperCase() : null;
 }
 
-// Calculates the chess.com rating based on the regression model
-const calculateRegression = (regression, lichessRating) => {
-    const [p1, p2, p3] = regression.params;
-    let result;
-    
-    switch (regression.type) {
-        case 'linear':
-            result = Math.round(p1 * lichessRating + p2);
-            break;
-        case 'quadratic':
-            result = Math.round(p2 * lichessRating + p1 * (lichessRating ** 2) + p3);
-            break;
-        case 'log':
-            result = Math.round(p1 * Math.log(lichessRating) + p2);
-            break;
-        default:
-            return null;
-    }
-    
-    // Return 0 if the result is negative (can't have negative ratings)
-    return Math.max(0, result);
+// Category of a tournament page, from the perf icon in its sidebar.
+const findTournamentCategory = () => {
+  const meta = document.querySelector('.tour__meta [data-icon], .swiss__meta [data-icon]');
+  return meta && categoryFromGameType(gameTypeFromIcon(meta.getAttribute('data-icon')));
 }
 
-// Adds ratings to the left-most sidebar.
-const addChessComRatingToProfile = (lichessRatings, regressions) => {
-  for (const rating of lichessRatings) {
-    let regression;
-    const link = rating.parentElement.parentElement; // This is the <a> tag
-    if (!link || link.tagName !== 'A') continue;
-    const href = link.getAttribute('href');
-
-    if (href.includes('/perf/bullet')) {
-      regression = regressions.BULLET;
-    } else if (href.includes('/perf/blitz')) {
-      regression = regressions.BLITZ;
-    } else if (href.includes('/perf/rapid')) {
-      regression = regressions.RAPID;
-    } else if (href.includes('/perf/classical')) {
-      regression = regressions.CLASSICAL;
-    }
-
-    if (regression && !rating.textContent.includes('?')) {
-      const lichessRating = parseInt(rating.textContent);
-      if (isNaN(lichessRating)) continue;
-      const chessComRating = calculateRegression(regression, lichessRating);
-      if (chessComRating === null) continue;
-      let chessComRatingDiv = document.createElement('span');
-      chessComRatingDiv.style.setProperty('color', '#769656');
-      chessComRatingDiv.innerText = ` (${chessComRating})`;
-      if (rating.firstChild) {
-        rating.firstChild.appendChild(chessComRatingDiv);
-      }
-    }
+// The first text node after the element matching selector that holds a number. Lists render
+// "<a class="user-link">name</a> 1500" with the rating as bare text rather than an element.
+const ratingTextAfter = (row, selector) => {
+  let node = row.querySelector(selector);
+  while (node && (node = node.nextSibling)) {
+    if (node.nodeType === Node.TEXT_NODE && /\d/.test(node.textContent)) return node;
   }
+  return null;
 }
 
-// Adds the chess.com rating equivalent beside the lichess rating.
-const addChessComRatingToGame = (gameType, lichessRatings, regressions) => {
-  let regression
-
-  if (gameType === GAME_TYPES.BLITZ) {
-    regression = regressions.BLITZ
-  } else if (gameType === GAME_TYPES.BULLET) {
-    regression = regressions.BULLET
-  } else if (gameType === GAME_TYPES.RAPID) {
-    regression = regressions.RAPID
-  } else {
-    regression = regressions.CLASSICAL
+// Notes are cloned from one styled element per tag instead of being created and styled one at a time.
+const noteTemplates = new Map();
+
+const createRatingNote = (tag, text) => {
+  if (!noteTemplates.has(tag)) {
+    const template = document.createElement(tag);
+    template.style.setProperty('color', '#769656');
+    noteTemplates.set(tag, template);
   }
+  const note = noteTemplates.get(tag).cloneNode(false);
+  note.textContent = text;
+  return note;
+}
 
-  for (rating of lichessRatings) {
-    const lichessRating = parseInt(rating.innerText)
-    const chessComRating = calculateRegression(regression, lichessRating)
-    if (chessComRating === null) continue;
-    let chessComRatingDiv = document.createElement('div')
-    chessComRatingDiv.style.setProperty('color', '#769656')
-    chessComRatingDiv.innerText = `(${chessComRating})`
-    rating.parentNode.appendChild(chessComRatingDiv)
-    rating.parentNode.insertBefore(chessComRatingDiv, rating.nextSibling)
+// Every place Lichess shows ratings. selector matches the node that is marked once handled;
+// read returns the rating text and category (undefined while the page has not rendered enough
+// to tell, which retries with the next batch; null to skip); write inserts the formatted estimate.
+const RATING_SOURCES = [
+  {
+    // Both players in a game
+    selector: '.ruser > rating',
+    read: (rating) => ({ text: rating.textContent, category: categoryFromGameType(findGameType()) ?? undefined }),
+    write: (rating, chessComRating) => rating.after(createRatingNote('div', `(${chessComRating})`)),
+  },
+  {
+    // The profile sidebar
+    selector: '.sub-ratings rating',
+    read: (rating) => {
+      const link = rating.parentElement.parentElement; // This is the <a> tag
+      if (!link || link.tagName !== 'A' || rating.textContent.includes('?')) return { category: null };
+      return { text: rating.textContent, category: categoryFromHref(link.getAttribute('href')) };
+    },
+    write: (rating, chessComRating) => {
+      if (rating.firstChild) rating.firstChild.appendChild(createRatingNote('span', ` (${chessComRating})`));
+    },
+  },
+  {
+    // Arena, team battle and Swiss standings
+    selector: '.tour__standing .user-link .rating, .swiss__standing .user-link .rating',
+    read: (rating) => ({ text: rating.textContent, category: findTournamentCategory() ?? undefined }),
+    write: (rating, chessComRating) => rating.appendChild(createRatingNote('span', ` (${chessComRating})`)),
+  },
+  {
+    // The /player leaderboards, one list per category
+    selector: '.user-top li',
+    read: (row) => ({
+      text: ratingTextAfter(row, '.user-link')?.textContent,
+      category: categoryFromHref(row.closest('.user-top').querySelector('h2 a')?.getAttribute('href')),
+    }),
+    write: (row, chessComRating) => ratingTextAfter(row, '.user-link')?.after(createRatingNote('span', ` (${chessComRating})`)),
+  },
+  {
+    // Game lists on /@/user/all and friends
+    selector: '.game-row .player',
+    read: (player) => {
+      const icon = player.closest('.game-row').querySelector('.game-row__infos .header[data-icon]');
+      return {
+        text: ratingTextAfter(player, '.user-link')?.textContent,
+        category: icon && categoryFromGameType(gameTypeFromIcon(icon.getAttribute('data-icon'))),
+      };
+    },
+    write: (player, chessComRating) => ratingTextAfter(player, '.user-link')?.after(createRatingNote('span', ` (${chessComRating})`)),
+  },
+];
+const RATING_SELECTOR = RATING_SOURCES.map((source) => source.selector).join(', ');
+// Set on every rating node once it is handled so it is never annotated twice.
+const PROCESSED_ATTRIBUTE = 'data-l2c';
+
+// The prediction-interval half-width for a rating, or 0 when there is none.
+const intervalFor = (models, row, lichessRating) => {
+  if (!models.intervalTable || row === -1 || !Number.isInteger(lichessRating)
+      || lichessRating < 0 || lichessRating > LUT_MAX_RATING) {
+    return 0;
   }
+  return models.intervalTable[row * (LUT_MAX_RATING + 1) + lichessRating];
+}
 
-  return lichessRatings
+// Formats a batch of ratings of one category, resolving its model and table row once.
+const formatChessComRatings = (models, category, lichessRatings) => {
+  const model = models.convert[category];
+  if (!model) return lichessRatings.map(() => null);
+  const row = LUT_CATEGORIES.indexOf(category);
+  return lichessRatings.map((lichessRating) => {
+    const chessComRating = model(lichessRating);
+    const interval = chessComRating > 0 ? intervalFor(models, row, lichessRating) : 0;
+    return interval > 0 ? `${chessComRating} ±${interval}` : `${chessComRating}`;
+  });
 }
 
-const main = async () => {
-    const regressions = await getRegressionData();
-    if (!regressions) {
-        return;
+// Annotates rating nodes in three passes so the page is laid out at most once: read every
+// node's rating and category, convert each category's ratings together, then write all notes.
+// Each note goes right after its own rating, so the notes have no common parent that a
+// DocumentFragment could insert them into at once.
+// Returns the nodes whose category could not be determined yet.
+const annotateRatings = (nodes, models) => {
+  const groups = new Map();
+  const deferred = [];
+  for (const node of nodes) {
+    const source = RATING_SOURCES.find((candidate) => node.matches(candidate.selector));
+    const { text, category } = source.read(node);
+    if (category === undefined) {
+      deferred.push(node);
+      continue;
+    }
+    const lichessRating = parseInt(text);
+    if (!category || isNaN(lichessRating)) {
+      node.setAttribute(PROCESSED_ATTRIBUTE, '');
+      continue;
     }
+    if (!groups.has(category)) groups.set(category, { nodes: [], sources: [], ratings: [] });
+    const group = groups.get(category);
+    group.nodes.push(node);
+    group.sources.push(source);
+    group.ratings.push(lichessRating);
+  }
 
-    const gameType = findGameType()
-    if (gameType === GAME_TYPES.UNKNOWN) {
-      // check if on a profile
-      const profileRatings = getLichessRatingsFromProfile()
-      addChessComRatingToProfile(profileRatings, regressions)
-    } else {
-      // in a game, add the chess.com rating to the game
-      const lichessRatings = getLichessRatingsFromGame()
-      addChessComRatingToGame(gameType, lichessRatings, regressions)
+  const writes = [];
+  for (const [category, group] of groups) {
+    const formatted = formatChessComRatings(models, category, group.ratings);
+    group.nodes.forEach((node, i) => writes.push([group.sources[i], node, formatted[i]]));
+  }
+  for (const [source, node, chessComRating] of writes) {
+    node.setAttribute(PROCESSED_ATTRIBUTE, '');
+    if (chessComRating !== null) source.write(node, chessComRating);
+  }
+  return deferred;
+}
+
+// Adds the unprocessed rating nodes in (or below) node to the pending set.
+const collectRatings = (node, pending) => {
+  if (node.nodeType !== Node.ELEMENT_NODE) return;
+  if (node.matches(RATING_SELECTOR)) {
+    if (!node.hasAttribute(PROCESSED_ATTRIBUTE)) pending.add(node);
+    return;
+  }
+  // Most inserted subtrees (moves, chat lines, clocks) hold no ratings; skip the query for them.
+  if (!node.firstElementChild) return;
+  for (const rating of node.querySelectorAll(RATING_SELECTOR)) {
+    if (!rating.hasAttribute(PROCESSED_ATTRIBUTE)) pending.add(rating);
+  }
+}
+
+// Annotates ratings as Lichess inserts them, so in-place navigation (profile to game,
+// new games, standings pages) is handled without rescanning the page. Newly added
+// ratings are collected per mutation batch and written in one animation frame.
+const observeRatings = (models, root = document.body) => {
+  const pending = new Set();
+  let scheduled = false;
+
+  const flush = () => {
+    scheduled = false;
+    const ratings = [...pending].filter((rating) => rating.isConnected);
+    pending.clear();
+    // Ratings whose page header is not rendered yet are retried with the next batch of mutations.
+    annotateRatings(ratings, models).forEach((rating) => pending.add(rating));
+  }
+
+  const schedule = () => {
+    if (scheduled || pending.size === 0) return;
+    scheduled = true;
+    requestAnimationFrame(flush);
+  }
+
+  const observer = new MutationObserver((mutations) => {
+    for (const mutation of mutations) {
+      for (const node of mutation.addedNodes) collectRatings(node, pending);
     }
+    schedule();
+  });
+  observer.observe(root, { childList: true, subtree: true });
+
+  collectRatings(root, pending);
+  schedule();
+  return observer;
 }
 
-main();
+// COMPILED_MODELS is defined by lichess2chess_models.js, which calculate_regressions.py
+// generates and the manifest loads first, so the ratings are annotated without waiting on a fetch.
+observeRatings(COMPILED_MODELS);
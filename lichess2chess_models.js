@@ -0,0 +1,38 @@
+// Generated by calculate_regressions.py from regressions.json; do not edit.
+const segment = (knots, x) => {
+  let i = 0;
+  while (i < knots.length - 2 && knots[i + 1] <= x) i++;
+  return i;
+};
+
+const piecewiseLinear = (knots, values) => (x) => {
+  const i = segment(knots, x);
+  const h = knots[i + 1] - knots[i];
+  return Math.max(0, Math.round(values[i] + (values[i + 1] - values[i]) / h * (x - knots[i])));
+};
+
+const pchip = (knots, values, slopes) => (x) => {
+  if (x < knots[0] || x > knots[knots.length - 1]) {
+    const end = x < knots[0] ? 0 : knots.length - 1;
+    return Math.max(0, Math.round(values[end] + slopes[end] * (x - knots[end])));
+  }
+  const i = segment(knots, x);
+  const h = knots[i + 1] - knots[i];
+  const t = (x - knots[i]) / h;
+  return Math.max(0, Math.round(values[i] * (1 + 2 * t) * (1 - t) ** 2 + h * slopes[i] * t * (1 - t) ** 2
+    + values[i + 1] * t ** 2 * (3 - 2 * t) + h * slopes[i + 1] * t ** 2 * (t - 1)));
+};
+
+const decodeBase64 = (base64) => Uint8Array.from(atob(base64), (c) => c.charCodeAt(0));
+
+const MODEL_ARTIFACT = readModelArtifact(decodeBase64('TDJDTQEAAgAEAAMAoA8AAKh9AAAhtEzvAAAAAAAAAABCTElUWgAAAAAAAAACAAMAQlVMTEVUAAAAAAAAAQACAFJBUElEAAAAAAAAAAIAAwBDTEFTU0lDQUwAAAABAAIAJXQ8Cyd8icBpuJYDHP7zP7FYgRo/0QI/Nmj5y0jOhMADRKrwsx7zPwAAAAAAAAAAYd7jTFMFkMARRPwU3q34P+99YWYS8BO/herm4o8UpMDuAMkg6RYBQAAAAAAAAAAA0wDSANIA0gDSANEA0QDRANEA0QDQANAA0ADQANAAzwDPAM8AzwDPAM4AzgDOAM4AzgDNAM0AzQDNAM0AzQDMAMwAzADMAMwAzADLAMsAywDLAMsAygDKAMoAygDJAMkAyQDJAMkAyADIAMgAyADIAMcAxwDHAMcAxwDGAMYAxgDGAMYAxQDFAMUAxQDFAMQAxADEAMQAxADEAMMAwwDDAMMAwwDCAMIAwgDCAMIAwgDBAMEAwQDBAMEAwADAAMAAwADAAMAAvwC/AL8AvwC/AL4AvgC+AL4AvgC9AL0AvQC9AL0AvAC8ALwAvAC8ALsAuwC7ALsAuwC7ALoAugC6ALoAugC6ALkAuQC5ALkAuQC4ALgAuAC4ALgAtwC3ALcAtwC3ALcAtgC2ALYAtgC2ALUAtQC1ALUAtQC0ALQAtAC0ALQAtACzALMAswCzALMAsgCyALIAsgCyALIAsQCxALEAsQCxALEAsACwALAAsACwALAArwCvAK8ArwCvAK8ArgCuAK4ArgCuAK4ArQCtAK0ArQCtAK0ArACsAKwArACsAKwArACrAKsAqwCrAKsAqgCqAKoAqgCqAKoAqQCpAKkAqQCpAKgAqACoAKgAqACoAKcApwCnAKcApwCnAKcApgCmAKYApgCmAKYApQClAKUApQClAKUApQCkAKQApACkAKQAowCjAKMAowCjAKMAogCiAKIAogCiAKEAoQChAKEAoQChAKAAoACgAKAAoACgAJ8AnwCfAJ8AnwCfAJ4AngCeAJ4AngCeAJ0AnQCdAJ0AnQCdAJwAnACcAJwAnACcAJsAmwCbAJsAmwCbAJoAmgCaAJoAmgCaAJoAmQCZAJkAmQCZAJkAmQCYAJgAmACYAJgAmACXAJcAlwCXAJcAlwCXAJYAlgCWAJYAlgCWAJUAlQCVAJUAlQCVAJQAlACUAJQAlACUAJQAkwCTAJMAkwCTAJMAkwCSAJIAkgCSAJIAkgCSAJEAkQCRAJEAkQCRAJAAkACQAJAAkACQAJAAjwCPAI8AjwCPAI8AjgCOAI4AjgCOAI4AjgCNAI0AjQCNAI0AjQCNAIwAjACMAIwAjACMAIwAiwCLAIsAiwCLAIsAigCKAIoAigCKAIoAigCKAIkAiQCJAIkAiQCJAIkAiACIAIgAiACIAIgAiACHAIcAhwCHAIcAhwCGAIYAhgCGAIYAhgCFAIUAhQCFAIUAhQCEAIQAhACEAIQAhACEAIQAgwCDAIMAgwCDAIMAgwCCAIIAggCCAIIAggCCAIEAgQCBAIEAgQCBAIEAgQCAAIAAgACAAIAAgACAAH8AfwB/AH8AfwB/AH8AfwB+AH4AfgB+AH4AfgB+AH0AfQB9AH0AfQB9AH0AfAB8AHwAfAB8AHwAfAB7AHsAewB7AHsAewB7AHsAegB6AHoAegB6AHoAegB5AHkAeQB5AHkAeQB5AHgAeAB4AHgAeAB4AHgAeAB3AHcAdwB3AHcAdwB3AHcAdgB2AHYAdgB2AHYAdgB2AHUAdQB1AHUAdQB1AHUAdQB0AHQAdAB0AHQAdAB0AHQAcwBzAHMAcwBzAHMAcwBzAHMAcgByAHIAcgByAHIAcgByAHEAcQBxAHEAcQBxAHEAcQBwAHAAcABwAHAAcABwAG8AbwBvAG8AbwBvAG8AbwBvAG4AbgBuAG4AbgBuAG4AbgBtAG0AbQBtAG0AbQBtAG0AbQBsAGwAbABsAGwAbABsAGsAawBrAGsAawBrAGsAawBrAGoAagBqAGoAagBqAGoAagBpAGkAaQBpAGkAaQBpAGkAaQBoAGgAaABoAGgAaABoAGgAZwBnAGcAZwBnAGcAZwBnAGcAZgBmAGYAZgBmAGYAZgBmAGYAZQBlAGUAZQBlAGUAZQBlAGQAZABkAGQAZABkAGQAZABkAGQAYwBjAGMAYwBjAGMAYwBjAGMAYgBiAGIAYgBiAGIAYgBiAGIAYgBhAGEAYQBhAGEAYQBhAGEAYQBhAGEAYABgAGAAYABgAGAAYABgAGAAYABgAF8AXwBfAF8AXwBfAF8AXwBfAF8AXgBeAF4AXgBeAF4AXgBeAF4AXgBdAF0AXQBdAF0AXQBdAF0AXQBdAFwAXABcAFwAXABcAFwAXABcAFwAXABbAFsAWwBbAFsAWwBbAFsAWgBaAFoAWgBaAFoAWgBaAFoAWgBZAFkAWQBZAFkAWQBZAFkAWQBZAFkAWABYAFgAWABYAFgAWABYAFgAWABYAFcAVwBXAFcAVwBXAFcAVwBXAFcAVwBXAFYAVgBWAFYAVgBWAFYAVgBWAFYAVgBVAFUAVQBVAFUAVQBVAFUAVQBVAFUAVABUAFQAVABUAFQAVABUAFQAVABUAFMAUwBTAFMAUwBTAFMAUwBTAFMAUwBTAFIAUgBSAFIAUgBSAFIAUgBSAFIAUgBSAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBMAEwATABMAEwATABMAEwATABMAEwATABMAEwASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASABIAEgASABIAEgASABIAEgASABIAEgASABIAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMwA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANAA0ADQANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2ADYANgA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3ADcANwA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAOwA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8AQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEgASABIAEgASABIAEgASABIAEgASABIAEgASABJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEwATABMAEwATABMAEwATABMAEwATABMAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBPAE8ATwBPAE8ATwBPAE8ATwBQAFAAUABQAFAAUABQAFAAUABQAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBSAFIAUgBSAFIAUgBSAFIAUgBSAFIAUwBTAFMAUwBTAFMAUwBTAFMAUwBTAFQAVABUAFQAVABUAFQAVABUAFQAVQBVAFUAVQBVAFUAVQBVAFUAVgBWAFYAVgBWAFYAVgBWAFYAVgBXAFcAVwBXAFcAVwBXAFcAVwBXAFgAWABYAFgAWABYAFgAWABYAFgAWQBZAFkAWQBZAFkAWQBZAFkAWgBaAFoAWgBaAFoAWgBaAFoAWgBbAFsAWwBbAFsAWwBbAFsAXABcAFwAXABcAFwAXABcAFwAXQBdAF0AXQBdAF0AXQBdAF0AXgBeAF4AXgBeAF4AXgBeAF4AXwBfAF8AXwBfAF8AXwBfAF8AYABgAGAAYABgAGAAYABgAGAAYQBhAGEAYQBhAGEAYQBhAGEAYgBiAGIAYgBiAGIAYgBiAGMAYwBjAGMAYwBjAGMAYwBkAGQAZABkAGQAZABkAGQAZABkAGUAZQBlAGUAZQBlAGUAZQBlAGUAZQBmAGYAZgBmAGYAZgBmAGYAZwBnAGcAZwBnAGcAZwBnAGgAaABoAGgAaABoAGgAaABpAGkAaQBpAGkAaQBpAGkAagBqAGoAagBqAGoAagBqAGsAawBrAGsAawBrAGsAawBsAGwAbABsAGwAbABsAGwAbQBtAG0AbQBtAG0AbQBtAG4AbgBuAG4AbgBuAG4AbgBvAG8AbwBvAG8AbwBvAHAAcABwAHAAcABwAHAAcABwAHEAcQBxAHEAcQBxAHEAcgByAHIAcgByAHIAcgByAHMAcwBzAHMAcwBzAHMAcwB0AHQAdAB0AHQAdAB0AHQAdAB1AHUAdQB1AHUAdQB2AHYAdgB2AHYAdgB2AHYAdwB3AHcAdwB3AHcAdwB4AHgAeAB4AHgAeAB4AHkAeQB5AHkAeQB5AHkAegB6AHoAegB6AHoAegB6AHsAewB7AHsAewB7AHsAfAB8AHwAfAB8AHwAfAB8AH0AfQB9AH0AfQB9AH0AfgB+AH4AfgB+AH4AfgB+AH8AfwB/AH8AfwB/AH8AgACAAIAAgACAAIAAgQCBAIEAgQCBAIEAgQCCAIIAggCCAIIAggCCAIIAgwCDAIMAgwCDAIMAgwCEAIQAhACEAIQAhACEAIUAhQCFAIUAhQCFAIUAhgCGAIYAhgCGAIYAhwCHAIcAhwCHAIcAhwCIAIgAiACIAIgAiACIAIkAiQCJAIkAiQCJAIoAigCKAIoAigCKAIoAiwCLAIsAiwCLAIsAiwCMAIwAjACMAIwAjACMAI0AjQCNAI0AjQCNAI4AjgCOAI4AjgCOAI8AjwCPAI8AjwCPAI8AkACQAJAAkACQAJAAkQCRAJEAkQCRAJEAkQCSAJIAkgCSAJIAkgCSAJMAkwCTAJMAkwCTAJQAlACUAJQAlACUAJQAlQCVAJUAlQCVAJUAlgCWAJYAlgCWAJYAlwCXAJcAlwCXAJcAmACYAJgAmACYAJgAmQCZAJkAmQCZAJkAmgCaAJoAmgCaAJoAmgCbAJsAmwCbAJsAmwCcAJwAnACcAJwAnACcAJ0AnQCdAJ0AnQCeAJ4AngCeAJ4AngCfAJ8AnwCfAJ8AoACgAKAAoACgAKAAoQChAKEAoQChAKIAogCiAKIAogCjAKMAowCjAKMAowCkAKQApACkAKQApAClAKUApQClAKUApgCmAKYApgCmAKYApgCnAKcApwCnAKcApwCoAKgAqACoAKgAqQCpAKkAqQCpAKoAqgCqAKoAqgCrAKsAqwCrAKsAqwCsAKwArACsAKwArQCtAK0ArQCtAK4ArgCuAK4ArgCuAK8ArwCvAK8ArwCwALAAsACwALAAsQCxALEAsQCxALIAsgCyALIAsgCzALMAswCzALMAswC0ALQAtAC0ALQAtQC1ALUAtQC1ALUAtgC2ALYAtgC2ALcAtwC3ALcAtwC4ALgAuAC4ALkAuQC5ALkAuQC6ALoAugC6ALoAuwC7ALsAuwC7ALsAvAC8ALwAvAC8AL0AvQC9AL0AvQC+AL4AvgC+AL4AvwC/AL8AvwDAAMAAwADAAMAAwQDBAMEAwQDBAMIAwgDCAMIAwgDDAMMAwwDDAMMAxADEAMQAxADEAMUAxQDFAMUAxQDGAMYAxgDGAMYAxwDHAMcAxwDHAMgAyADIAMgAyADJAMkAyQDJAMkAygDKAMoAygDKAMsAywDLAMsAywDMAMwAzADMAMwAzQDNAM0AzQDNAM4AzgDOAM4AzgDOAM8AzwDPAM8A0ADQANAA0ADQANEA0QDRANEA0gDSANIA0gDSANMA0wDTANMA0wDUANQA1ADUANQA1QDVANUA1QDVANYA1gDWANYA1gDXANcA1wDXANcA2ADYANgA2ADYANkA2QDZANkA2QDaANoA2gDaANoA2wDbANsA2wDbANwA3ADcANwA3QDdAN0A3QDdAN4A3gDeAN4A3wDfAN8A3wDfAOAA4ADgAOAA4ADhAOEA4QDhAOEA4QDiAOIA4gDiAOIA4wDjAOMA4wDkAOQA5ADkAOQA5QDlAOUA5QDlAOYA5gDmAOYA5gDnAOcA5wDnAOcA6ADoAOgA6ADoAOkA6QDpAOkA6gDqAOoA6gDqAOsA6wDrAOsA7ADsAOwA7ADtAO0A7QDtAO0A7gDuAO4A7gDvAO8A7wDvAPAA8ADwAPAA8ADxAPEA8QDxAPIA8gDyAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQAA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9AD0APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA+AD4APgA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwBAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUABQAFAAUQBRAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBZAVkBWAFYAVgBVwFXAVcBVgFWAVYBVQFVAVUBVAFUAVQBUwFTAVIBUgFSAVEBUQFRAVABUAFQAU8BTwFPAU4BTgFOAU0BTQFNAUwBTAFLAUsBSwFKAUoBSgFJAUkBSQFIAUgBSAFHAUcBRwFHAUYBRgFGAUUBRQFFAUQBRAFEAUMBQwFDAUMBQgFCAUIBQQFBAUEBQAFAAUABPwE/AT8BPgE+AT4BPQE9AT0BPQE8ATwBPAE7ATsBOwE6AToBOgE5ATkBOQE4ATgBOAE3ATcBNwE2ATYBNgE2ATUBNQE1ATQBNAE0ATMBMwEzATIBMgEyATIBMQExATEBMAEwATABLwEvAS8BLwEuAS4BLgEtAS0BLQEtASwBLAEsASsBKwErASoBKgEqASkBKQEpASkBKAEoASgBJwEnAScBJgEmASYBJQElASUBJAEkASQBJAEjASMBIwEiASIBIgEhASEBIQEhASABIAEgAR8BHwEfAR4BHgEeAR4BHQEdAR0BHAEcARwBGwEbARsBGwEaARoBGgEaARkBGQEZARgBGAEYARcBFwEXARcBFgEWARYBFgEVARUBFQEUARQBFAEUARMBEwETARMBEgESARIBEQERAREBEQEQARABEAEQAQ8BDwEPAQ8BDgEOAQ4BDgENAQ0BDQEMAQwBDAEMAQsBCwELAQsBCgEKAQoBCgEJAQkBCQEJAQgBCAEIAQgBBwEHAQcBBwEGAQYBBgEGAQUBBQEFAQUBBAEEAQQBAwEDAQMBAwECAQIBAgECAQEBAQEBAQEBAAEAAQABAAH/AP8A/wD+AP4A/gD+AP0A/QD9APwA/AD8APwA+wD7APsA+wD6APoA+gD6APkA+QD5APkA+AD4APgA+AD3APcA9wD2APYA9gD2APUA9QD1APQA9AD0APQA8wDzAPMA8wDyAPIA8gDyAPEA8QDxAPEA8ADwAPAA8ADvAO8A7wDvAO4A7gDuAO4A7QDtAO0A7ADsAOwA7ADrAOsA6wDrAOoA6gDqAOoA6QDpAOkA6QDoAOgA6ADoAOcA5wDnAOcA5gDmAOYA5QDlAOUA5QDkAOQA5ADkAOMA4wDjAOMA4gDiAOIA4gDhAOEA4QDhAOAA4ADgAOAA3wDfAN8A3wDeAN4A3gDeAN0A3QDdAN0A3ADcANwA3ADbANsA2wDbANoA2gDaANoA2QDZANkA2QDYANgA2ADYANcA1wDXANcA1gDWANYA1QDVANUA1QDUANQA1ADUANMA0wDTANMA0wDSANIA0gDSANEA0QDRANEA0ADQANAA0ADPAM8AzwDPAM4AzgDOAM4AzQDNAM0AzQDNAMwAzADMAMwAywDLAMsAywDLAMoAygDKAMoAyQDJAMkAyQDJAMgAyADIAMgAxwDHAMcAxwDGAMYAxgDGAMUAxQDFAMUAxADEAMQAxADDAMMAwwDDAMMAwgDCAMIAwgDBAMEAwQDBAMEAwADAAMAAwAC/AL8AvwC/AL8AvgC+AL4AvgC9AL0AvQC9AL0AvAC8ALwAvAC7ALsAuwC6ALoAugC6ALkAuQC5ALkAuAC4ALgAuAC4ALcAtwC3ALcAtwC2ALYAtgC2ALYAtQC1ALUAtQC0ALQAtAC0ALQAswCzALMAswCyALIAsgCyALIAsQCxALEAsQCwALAAsACwALAArwCvAK8ArwCvAK4ArgCuAK4ArQCtAK0ArQCtAKwArACsAKwAqwCrAKsAqwCrAKoAqgCqAKoAqgCpAKkAqQCpAKkAqACoAKgAqACnAKcApwCnAKcApwCmAKYApgCmAKYApQClAKUApQCkAKQApACkAKQAowCjAKMAowCjAKIAogCiAKIAogChAKEAoQChAKEAoACgAKAAoACgAJ8AnwCfAJ8AnwCeAJ4AngCeAJ4AnQCdAJ0AnQCdAJ0AnACcAJwAnACcAJsAmwCbAJsAmwCaAJoAmgCaAJoAmQCZAJkAmQCZAJkAmACYAJgAmACYAJgAlwCXAJcAlwCXAJcAlgCWAJYAlgCWAJYAlQCVAJUAlQCVAJUAlACUAJQAlACUAJQAkwCTAJMAkwCTAJMAkgCSAJIAkgCSAJEAkQCRAJEAkQCRAJAAkACQAJAAkACQAI8AjwCPAI8AjwCOAI4AjgCOAI4AjQCNAI0AjQCNAI0AjACMAIwAjACMAIsAiwCLAIsAiwCKAIoAigCKAIoAigCJAIkAiQCJAIkAiQCIAIgAiACIAIgAiACHAIcAhwCHAIcAhwCGAIYAhgCGAIYAhgCGAIUAhQCFAIUAhQCFAIQAhACEAIQAhACEAIQAgwCDAIMAgwCDAIMAgwCCAIIAggCCAIIAggCBAIEAgQCBAIEAgQCBAIAAgACAAIAAgACAAH8AfwB/AH8AfwB/AH8AfgB+AH4AfgB+AH4AfgB9AH0AfQB9AH0AfQB9AHwAfAB8AHwAfAB8AHwAewB7AHsAewB7AHsAegB6AHoAegB6AHoAeQB5AHkAeQB5AHkAeQB4AHgAeAB4AHgAeAB4AHgAdwB3AHcAdwB3AHcAdwB3AHYAdgB2AHYAdgB2AHUAdQB1AHUAdQB1AHUAdAB0AHQAdAB0AHQAdABzAHMAcwBzAHMAcwBzAHIAcgByAHIAcgByAHIAcgBxAHEAcQBxAHEAcQBxAHEAcABwAHAAcABwAHAAcABwAG8AbwBvAG8AbwBvAG8AbwBvAG4AbgBuAG4AbgBuAG4AbQBtAG0AbQBtAG0AbQBtAGwAbABsAGwAbABsAGwAbABrAGsAawBrAGsAawBrAGsAawBqAGoAagBqAGoAagBqAGoAagBpAGkAaQBpAGkAaQBpAGgAaABoAGgAaABoAGgAZwBnAGcAZwBnAGcAZwBnAGYAZgBmAGYAZgBmAGYAZgBmAGYAZQBlAGUAZQBlAGUAZQBlAGUAZABkAGQAZABkAGQAZABkAGQAZABjAGMAYwBjAGMAYwBjAGMAYgBiAGIAYgBiAGIAYgBiAGIAYgBhAGEAYQBhAGEAYQBhAGEAYABgAGAAYABgAGAAYABgAGAAYABfAF8AXwBfAF8AXwBfAF8AXgBeAF4AXgBeAF4AXgBeAF4AXgBdAF0AXQBdAF0AXQBdAF0AXQBcAFwAXABcAFwAXABcAFwAXABcAFsAWwBbAFsAWwBbAFsAWwBbAFoAWgBaAFoAWgBaAFoAWgBaAFoAWQBZAFkAWQBZAFkAWQBZAFkAWQBYAFgAWABYAFgAWABYAFgAWABXAFcAVwBXAFcAVwBXAFcAVwBXAFYAVgBWAFYAVgBWAFYAVgBWAFYAVQBVAFUAVQBVAFUAVQBVAFUAVQBVAFUAVABUAFQAVABUAFQAVABUAFQAVABUAFQAUwBTAFMAUwBTAFMAUwBTAFMAUwBTAFMAUwBSAFIAUgBSAFIAUgBSAFIAUgBSAFEAUQBRAFEAUQBRAFEAUQBRAFEAUQBRAFAAUABQAFAAUABQAFAAUABQAFAAUABQAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAEwATABMAEwATABMAEwATABMAEwATABMAEwATABMAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEkASABIAEgASABIAEgASABIAEgASABIAEgASABIAEgASABIAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAPwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwBAAEAAQAA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AD8APwA/AEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEAAQABAAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQQBBAEEAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBCAEIAQgBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEMAQwBDAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABEAEQARABFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBFAEUARQBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBGAEYARgBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBHAEcARwBIAEgASABIAEgASABIAEgASABIAEgASABIAEgASQBJAEkASQBJAEkASQBJAEkASQBJAEkASQBJAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEoASgBKAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEsASwBLAEwATABMAEwATABMAEwATABMAEwATABMAEwATABNAE0ATQBNAE0ATQBNAE0ATQBNAE0ATQBNAE4ATgBOAE4ATgBOAE4ATgBOAE4ATgBOAE4ATwBPAE8ATwBPAE8ATwBPAE8ATwBPAE8ATwBQAFAAUABQAFAAUABQAFAAUABQAFAAUABRAFEAUQBRAFEAUQBRAFEAUQBRAFEAUgBSAFIAUgBSAFIAUgBSAFIAUwBTAFMAUwBTAFMAUwBTAFMAUwBTAFMAVABUAFQAVABUAFQAVABUAFQAVABUAFQAVABVAFUAVQBVAFUAVQBVAFUAVQBWAFYAVgBWAFYAVgBWAFYAVgBXAFcAVwBXAFcAVwBXAFcAVwBXAFgAWABYAFgAWABYAFgAWABYAFgAWQBZAFkAWQBZAFkAWQBZAFkAWgBaAFoAWgBaAFoAWgBaAFoAWwBbAFsAWwBbAFsAWwBbAFsAXABcAFwAXABcAFwAXABcAFwAXABdAF0AXQBdAF0AXQBdAF0AXQBeAF4AXgBeAF4AXgBeAF4AXgBeAF8AXwBfAF8AXwBfAF8AXwBgAGAAYABgAGAAYABgAGAAYQBhAGEAYQBhAGEAYQBhAGIAYgBiAGIAYgBiAGIAYgBjAGMAYwBjAGMAYwBjAGQAZABkAGQAZABkAGQAZQBlAGUAZQBlAGUAZQBmAGYAZgBmAGYAZgBmAGYAZwBnAGcAZwBnAGcAZwBnAGgAaABoAGgAaABoAGgAaABoAGkAaQBpAGkAaQBpAGkAagBqAGoAagBqAGoAawBrAGsAawBrAGsAawBsAGwAbABsAGwAbABsAGwAbQBtAG0AbQBtAG0AbQBuAG4AbgBuAG4AbgBuAG8AbwBvAG8AbwBvAHAAcABwAHAAcABwAHEAcQBxAHEAcQBxAHEAcgByAHIAcgByAHMAcwBzAHMAcwBzAHQAdAB0AHQAdAB0AHQAdQB1AHUAdQB1AHUAdQB2AHYAdgB2AHYAdgB3AHcAdwB3AHcAdwB4AHgAeAB4AHgAeAB5AHkAeQB5AHkAegB6AHoAegB6AHoAewB7AHsAewB7AHsAfAB8AHwAfAB8AHwAfQB9AH0AfQB9AH4AfgB+AH4AfgB+AH8AfwB/AH8AfwB/AIAAgACAAIAAgACAAIAAgQCBAIEAgQCBAIIAggCCAIIAggCCAIMAgwCDAIMAgwCEAIQAhACEAIQAhQCFAIUAhQCFAIYAhgCGAIYAhgCGAIcAhwCHAIcAhwCIAIgAiACIAIgAiQCJAIkAiQCJAIoAigCKAIoAigCKAIsAiwCLAIsAiwCMAIwAjACMAIwAjACNAI0AjQCNAI0AjgCOAI4AjgCOAI4AjwCPAI8AjwCPAI8AkACQAJAAkACRAJEAkQCRAJEAkgCSAJIAkgCSAJIAkwCTAJMAkwCTAJMAlACUAJQAlACUAJUAlQCVAJUAlQCWAJYAlgCWAJYAlwCXAJcAlwCXAJcAmACYAJgAmACYAJkAmQCZAJkAmQCZAJoAmgCaAJoAmgCbAJsAmwCbAJwAnACcAJwAnACdAJ0AnQCdAJ0AngCeAJ4AngCeAJ8AnwCfAJ8AnwCgAKAAoACgAKEAoQChAKEAoQCiAKIAogCiAKIAowCjAKMAowCjAKQApACkAKQApAClAKUApQClAKUApgCmAKYApgCnAKcApwCnAKcAqACoAKgAqACoAKkAqQCpAKkAqQCqAKoAqgCqAKsAqwCrAKsAqwCsAKwArACsAK0ArQCtAK0ArQCuAK4ArgCuAK8ArwCvAK8AsACwALAAsACxALEAsQCxALEAsgCyALIAsgCzALMAswCzALQAtAC0ALQAtAC1ALUAtQC1ALYAtgC2ALYAtwC3ALcAtwC3ALgAuAC4ALgAuQC5ALkAuQC5ALoAugC6ALoAuwC7ALsAuwC7ALwAvAC8ALwAvQC9AL0AvQC9AL4AvgC+AL4AvwC/AL8AvwDAAMAAwADAAMAAwQDBAMEAwgDCAMIAwgDDAMMAwwDDAMQAxADEAMQAxQDFAMUAxQDGAMYAxgDGAMYAxwDHAMcAxwDIAMgAyADIAMkAyQDJAMkAygDKAMoAygDLAMsAywDLAMwAzADMAMwAzQDNAM0AzQDOAM4AzgDOAM8AzwDPAM8AzwDQANAA0ADQANEA0QDRANEA0gDSANIA0gDTANMA0wDTANQA1ADUANQA1QDVANUA1QDWANYA1gDWANcA1wDXANcA2ADYANgA2QDZANkA2QDaANoA2gDaANsA2wDbANsA3ADcANwA3ADdAN0A3QDdAN4A3gDeAN4A3wDfAN8A4ADgAOAA4ADhAOEA4QDhAOIA4gDiAOIA4wDjAOMA4wDkAOQA5ADkAOUA5QDlAOYA5gDmAOYA5wDnAOcA5wDoAOgA6ADoAOkA6QDpAOoA6gDqAOoA6wDrAOsA6wDsAOwA7ADtAO0A7QDtAO4A7gDuAO4A7wDvAO8A8ADwAPAA8ADxAPEA8QDyAPIA8gDyAPMA8wDzAPMA9AD0APQA9AD1APUA9QD1APYA9gD2APcA9wD3APcA+AD4APgA+AD5APkA+QD6APoA+gD6APsA+wD7APsA/AD8APwA/QD9AP0A/QD+AP4A/gD+AP8A/wD/AP8AAAEAAQABAQEBAQEBAQECAQIBAgECAQMBAwEDAQMBBAEEAQQBBQEFAQUBBQEGAQYBBgEGAQcBBwEHAQgBCAEIAQkBCQEJAQoBCgEKAQoBCwELAQsBDAEMAQwBDQENAQ0BDQEOAQ4BDgEPAQ8BDwEQARABEAEQAREBEQERAREBEgESARIBEwETARMBEwEUARQBFAEVARUBFQEVARYBFgEWARcBFwEXARgBGAEYARgBGQEZARkBGgEaARoBGwEbARsBGwEcARwBHAEdAR0BHQEdAR4BHgEeAR8BHwEfAR8BIAEgASABIQEhASEBIQEiASIBIgEjASMBIwEjASQBJAEkASUBJQElASUBJgEmASYBJgEnAScBJwEoASgBKAEoASkBKQEpASoBKgEqASoBKwErASsBLAEsASwBLAEtAS0BLQEuAS4BLgEvAS8BLwEvATABMAEwATEBMQExATEBMgEyATIBMwEzATMBNAE0ATQBNAE1ATUBNQE2ATYBNgE2ATcBNwE3ATgBOAE4ATkBOQE5ATkBOgE6AToBOwE7ATsBPAE8ATwBPQE9AT0BPgE+AT4BPwE/AT8BPwFAAUABQAFBAUEBQQFCAUIBQgFDAUMBQwFDAUQBRAFEAUUBRQFFAUYBRgFGAUcBRwFHAUgBSAFIAUkBSQFJAUoBSgFLAUsBSwFMAUwBTAFNAU0BTQFNAU4BTgFOAU8BTwFPAVABUAFQAVEBUQFRAVIB+gD6APoA+QD5APkA+QD5APkA+QD5APkA+QD5APgA+AD4APgA+AD4APgA+AD4APgA+AD3APcA9wD3APcA9wD3APcA9wD3APcA9gD2APYA9gD2APYA9gD2APYA9gD2APUA9QD1APUA9QD1APUA9QD1APUA9QD1APUA9AD0APQA9AD0APQA9AD0APQA9AD0APMA8wDzAPMA8wDzAPMA8wDzAPMA8wDzAPIA8gDyAPIA8gDyAPIA8gDyAPIA8gDxAPEA8QDxAPEA8QDxAPEA8QDxAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADvAO8A7wDvAO8A7wDvAO8A7wDvAO8A7gDuAO4A7gDuAO4A7gDuAO4A7gDuAO0A7QDtAO0A7QDtAO0A7QDtAO0A7QDsAOwA7ADsAOwA7ADsAOwA7ADsAOwA6wDrAOsA6wDrAOsA6wDrAOsA6wDrAOoA6gDqAOoA6gDqAOoA6gDqAOoA6QDpAOkA6QDpAOkA6QDpAOkA6QDpAOkA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA5wDnAOcA5wDnAOcA5wDnAOcA5wDnAOcA5gDmAOYA5gDmAOYA5gDmAOYA5gDmAOYA5QDlAOUA5QDlAOUA5QDlAOUA5QDkAOQA5ADkAOQA5ADkAOQA5ADkAOQA4wDjAOMA4wDjAOMA4wDjAOMA4wDiAOIA4gDiAOIA4gDiAOIA4gDiAOEA4QDhAOEA4QDhAOEA4QDhAOEA4QDhAOEA4ADgAOAA4ADgAOAA4ADgAOAA4ADgAOAA3wDfAN8A3wDfAN8A3wDfAN8A3wDfAN4A3gDeAN4A3gDeAN4A3gDeAN4A3gDeAN0A3QDdAN0A3QDdAN0A3QDdAN0A3QDcANwA3ADcANwA3ADcANwA3ADcANwA2wDbANsA2wDbANsA2wDbANsA2wDbANsA2gDaANoA2gDaANoA2gDaANoA2gDZANkA2QDZANkA2QDZANkA2QDZANgA2ADYANgA2ADYANgA2ADYANgA1wDXANcA1wDXANcA1wDXANcA1wDXANYA1gDWANYA1gDWANYA1gDWANYA1gDVANUA1QDVANUA1QDVANUA1QDVANUA1ADUANQA1ADUANQA1ADUANQA1ADTANMA0wDTANMA0wDTANMA0wDTANMA0gDSANIA0gDSANIA0gDSANIA0gDSANIA0gDRANEA0QDRANEA0QDRANEA0QDRANAA0ADQANAA0ADQANAA0ADQANAA0ADQAM8AzwDPAM8AzwDPAM8AzwDPAM8AzwDOAM4AzgDOAM4AzgDOAM4AzgDOAM4AzQDNAM0AzQDNAM0AzQDNAM0AzQDNAMwAzADMAMwAzADMAMwAzADMAMwAzADMAMsAywDLAMsAywDLAMsAywDLAMsAywDKAMoAygDKAMoAygDKAMoAygDKAMoAygDJAMkAyQDJAMkAyQDJAMkAyQDJAMkAyADIAMgAyADIAMgAyADIAMgAyADIAMcAxwDHAMcAxwDHAMcAxwDHAMcAxgDGAMYAxgDGAMYAxgDGAMYAxgDGAMYAxQDFAMUAxQDFAMUAxQDFAMUAxQDFAMUAxADEAMQAxADEAMQAxADEAMQAxADEAMMAwwDDAMMAwwDDAMMAwwDDAMMAwwDDAMIAwgDCAMIAwgDCAMIAwgDCAMIAwgDCAMEAwQDBAMEAwQDBAMEAwQDBAMEAwQDBAMAAwADAAMAAwADAAMAAwADAAMAAwADAAL8AvwC/AL8AvwC/AL8AvwC/AL8AvwC+AL4AvgC+AL4AvgC+AL4AvgC+AL4AvgC9AL0AvQC9AL0AvQC9AL0AvQC9AL0AvQC9AL0AvAC8ALwAvAC8ALwAvAC8ALwAvAC8ALsAuwC7ALsAuwC7ALsAuwC7ALsAuwC7ALoAugC6ALoAugC6ALoAugC6ALoAugC6ALoAugC5ALkAuQC5ALkAuQC5ALkAuQC5ALkAuQC4ALgAuAC4ALgAuAC4ALgAuAC4ALgAuAC4ALcAtwC3ALcAtwC3ALcAtwC3ALcAtwC3ALYAtgC2ALYAtgC2ALYAtgC2ALYAtgC2ALYAtgC2ALUAtQC1ALUAtQC1ALUAtQC1ALUAtQC1ALQAtAC0ALQAtAC0ALQAtAC0ALQAtAC0ALQAswCzALMAswCzALMAswCzALMAswCzALIAsgCyALIAsgCyALIAsgCyALIAsgCyALEAsQCxALEAsQCxALEAsQCxALEAsQCwALAAsACwALAAsACwALAAsACwALAArwCvAK8ArwCvAK8ArwCvAK8ArwCvAK8ArwCvAK4ArgCuAK4ArgCuAK4ArgCuAK4ArgCuAK4ArQCtAK0ArQCtAK0ArQCtAK0ArQCtAK0ArQCtAKwArACsAKwArACsAKwArACsAKwArACsAKwArACrAKsAqwCrAKsAqwCrAKsAqwCrAKsAqwCrAKsAqgCqAKoAqgCqAKoAqgCqAKoAqgCqAKoAqgCpAKkAqQCpAKkAqQCpAKkAqQCpAKkAqQCpAKkAqQCoAKgAqACoAKgAqACoAKgAqACoAKgAqACoAKgAqACnAKcApwCnAKcApwCnAKcApwCnAKcApwCnAKYApgCmAKYApgCmAKYApgCmAKYApgCmAKUApQClAKUApQClAKUApQClAKUApQClAKUApQCkAKQApACkAKQApACkAKQApACkAKQApACkAKQAowCjAKMAowCjAKMAowCjAKMAowCjAKMAowCjAKIAogCiAKIAogCiAKIAogCiAKIAogCiAKEAoQChAKEAoQChAKEAoQChAKEAoQChAKAAoACgAKAAoACgAKAAoACgAKAAoACgAJ8AnwCfAJ8AnwCfAJ8AnwCfAJ8AnwCfAJ8AnwCfAJ4AngCeAJ4AngCeAJ4AngCeAJ4AngCeAJ4AngCeAJ0AnQCdAJ0AnQCdAJ0AnQCdAJ0AnQCdAJ0AnACcAJwAnACcAJwAnACcAJwAnACcAJwAnACcAJwAnACbAJsAmwCbAJsAmwCbAJsAmwCbAJsAmwCbAJsAmwCaAJoAmgCaAJoAmgCaAJoAmgCaAJoAmgCaAJoAmgCZAJkAmQCZAJkAmQCZAJkAmQCZAJkAmQCZAJkAmACYAJgAmACYAJgAmACYAJgAmACYAJgAmACYAJgAmACYAJcAlwCXAJcAlwCXAJcAlwCXAJcAlwCXAJcAlwCWAJYAlgCWAJYAlgCWAJYAlgCWAJYAlgCWAJYAlgCVAJUAlQCVAJUAlQCVAJUAlQCVAJUAlQCVAJQAlACUAJQAlACUAJQAlACUAJQAlACUAJQAkwCTAJMAkwCTAJMAkwCTAJMAkwCTAJMAkwCTAJMAkwCSAJIAkgCSAJIAkgCSAJIAkgCSAJIAkgCSAJIAkgCRAJEAkQCRAJEAkQCRAJEAkQCRAJEAkQCRAJEAkQCQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAI8AjwCPAI8AjwCPAI8AjwCPAI8AjwCPAI8AjwCPAI4AjgCOAI4AjgCOAI4AjgCOAI4AjgCOAI4AjgCOAI4AjgCOAI0AjQCNAI0AjQCNAI0AjQCNAI0AjQCNAI0AjQCNAI0AjQCNAIwAjACMAIwAjACMAIwAjACMAIwAjACMAIwAjACMAIwAjACMAIwAiwCLAIsAiwCLAIsAiwCLAIsAiwCLAIsAiwCLAIsAiwCLAIoAigCKAIoAigCKAIoAigCKAIoAigCKAIoAigCKAIoAiQCJAIkAiQCJAIkAiQCJAIkAiQCJAIkAiQCJAIkAiQCJAIkAiQCIAIgAiACIAIgAiACIAIgAiACIAIgAiACIAIgAiACIAIgAiACIAIcAhwCHAIcAhwCHAIcAhwCHAIcAhwCHAIcAhwCHAIcAhwCHAIcAhwCHAIcAhwCHAIYAhgCGAIYAhgCGAIYAhgCGAIYAhgCGAIYAhgCGAIYAhgCGAIYAhgCGAIYAhQCFAIUAhQCFAIUAhQCFAIUAhQCFAIUAhQCFAIUAhQCFAIUAhQCFAIUAhACEAIQAhACEAIQAhACEAIQAhACEAIQAhACEAIQAhACEAIQAhACEAIMAgwCDAIMAgwCDAIMAgwCDAIMAgwCDAIMAgwCDAIMAgwCDAIMAgwCCAIIAggCCAIIAggCCAIIAggCCAIIAggCCAIIAggCCAIIAggCCAIIAggCCAIIAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgACAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAIAAfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeAB4AHgAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAeQB5AHkAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHoAegB6AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB7AHsAewB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AHwAfAB8AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfQB9AH0AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfgB+AH4AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AfwB/AH8AgACAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAIAAgACAAIAAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIEAgQCBAIIAggCCAIIAggCCAIIAggCCAIIAggCCAIIAggCCAIIAggCCAIIAggCCAIIAgwCDAIMAgwCDAIMAgwCDAIMAgwCDAIMAgwCDAIMAgwCDAIMAgwCDAIMAgwCDAIQAhACEAIQAhACEAIQAhACEAIQAhACEAIQAhACEAIQAhACEAIQAhACEAIUAhQCFAIUAhQCFAIUAhQCFAIUAhQCFAIUAhQCFAIUAhQCFAIUAhQCGAIYAhgCGAIYAhgCGAIYAhgCGAIYAhgCGAIYAhgCGAIYAhgCGAIcAhwCHAIcAhwCHAIcAhwCHAIcAhwCHAIcAhwCHAIcAhwCIAIgAiACIAIgAiACIAIgAiACIAIgAiACIAIgAiACIAIkAiQCJAIkAiQCJAIkAiQCJAIkAiQCJAIkAiQCJAIkAiQCJAIkAiQCJAIoAigCKAIoAigCKAIoAigCKAIoAigCKAIoAigCKAIoAigCKAIoAiwCLAIsAiwCLAIsAiwCLAIsAiwCLAIsAiwCLAIsAiwCLAIwAjACMAIwAjACMAIwAjACMAIwAjACMAIwAjACMAIwAjACMAI0AjQCNAI0AjQCNAI0AjQCNAI0AjQCNAI0AjQCNAI0AjQCOAI4AjgCOAI4AjgCOAI4AjgCOAI4AjgCOAI4AjgCOAI8AjwCPAI8AjwCPAI8AjwCPAI8AjwCPAI8AjwCPAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJEAkQCRAJEAkQCRAJEAkQCRAJEAkQCRAJEAkQCRAJEAkQCSAJIAkgCSAJIAkgCSAJIAkgCSAJIAkgCSAJIAkgCSAJIAkwCTAJMAkwCTAJMAkwCTAJMAkwCTAJMAkwCTAJMAkwCTAJQAlACUAJQAlACUAJQAlACUAJQAlACUAJQAlACUAJQAlACVAJUAlQCVAJUAlQCVAJUAlQCVAJUAlQCVAJUAlQCVAJYAlgCWAJYAlgCWAJYAlgCWAJYAlgCWAJYAlgCWAJYAlwCXAJcAlwCXAJcAlwCXAJcAlwCXAJcAlwCYAJgAmACYAJgAmACYAJgAmACYAJgAmACYAJgAmACZAJkAmQCZAJkAmQCZAJkAmQCZAJkAmQCZAJkAmgCaAJoAmgCaAJoAmgCaAJoAmgCaAJoAmgCaAJsAmwCbAJsAmwCbAJsAmwCbAJsAmwCbAJsAmwCcAJwAnACcAJwAnACcAJwAnACcAJwAnACcAJ0AnQCdAJ0AnQCdAJ0AnQCdAJ0AnQCdAJ0AnQCeAJ4AngCeAJ4AngCeAJ4AngCeAJ4AngCeAJ4AngCeAJ4AngCfAJ8AnwCfAJ8AnwCfAJ8AnwCfAJ8AnwCgAKAAoACgAKAAoACgAKAAoACgAKAAoACgAKAAoAChAKEAoQChAKEAoQChAKEAoQChAKEAoQChAKEAogCiAKIAogCiAKIAogCiAKIAogCiAKIAowCjAKMAowCjAKMAowCjAKMAowCjAKMAowCjAKQApACkAKQApACkAKQApACkAKQApACkAKQApAClAKUApQClAKUApQClAKUApQClAKUApQClAKUApgCmAKYApgCmAKYApgCmAKYApgCmAKYApgCmAKcApwCnAKcApwCnAKcApwCnAKcApwCnAKcApwCoAKgAqACoAKgAqACoAKgAqACoAKgAqACoAKgAqQCpAKkAqQCpAKkAqQCpAKkAqQCpAKkAqQCpAKkAqgCqAKoAqgCqAKoAqgCqAKoAqgCqAKoAqgCrAKsAqwCrAKsAqwCrAKsAqwCrAKsAqwCrAKsAqwCsAKwArACsAKwArACsAKwArACsAKwArACsAKwArACtAK0ArQCtAK0ArQCtAK0ArQCtAK0ArQCtAK0ArgCuAK4ArgCuAK4ArgCuAK4ArgCuAK4ArgCuAK8ArwCvAK8ArwCvAK8ArwCvAK8ArwCvAK8AsACwALAAsACwALAAsACwALAAsACwALAAsACxALEAsQCxALEAsQCxALEAsQCxALEAsQCxALIAsgCyALIAsgCyALIAsgCyALIAsgCyALMAswCzALMAswCzALMAswCzALMAswCzALMAtAC0ALQAtAC0ALQAtAC0ALQAtAC0ALQAtQC1ALUAtQC1ALUAtQC1ALUAtQC1ALUAtQC2ALYAtgC2ALYAtgC2ALYAtgC2ALYAtgC2ALcAtwC3ALcAtwC3ALcAtwC3ALcAtwC3ALgAuAC4ALgAuAC4ALgAuAC4ALgAuAC4ALkAuQC5ALkAuQC5ALkAuQC5ALkAuQC5ALkAugC6ALoAugC6ALoAugC6ALoAugC6ALoAuwC7ALsAuwC7ALsAuwC7ALsAuwC7ALsAvAC8ALwAvAC8ALwAvAC8ALwAvAC8ALwAvAC8ALwAvQC9AL0AvQC9AL0AvQC9AL0AvQC9AL0AvQC+AL4AvgC+AL4AvgC+AL4AvgC+AL4AvgC+AL4AvgC/AL8AvwC/AL8AvwC/AL8AvwC/AL8AvwDAAMAAwADAAMAAwADAAMAAwADAAMAAwADBAMEAwQDBAMEAwQDBAMEAwQDBAMEAwgDCAMIAwgDCAMIAwgDCAMIAwgDCAMIAwwDDAMMAwwDDAMMAwwDDAMMAwwDDAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxQDFAMUAxQDFAMUAxQDFAMUAxQDFAMUAxgDGAMYAxgDGAMYAxgDGAMYAxgDGAMYAxwDHAMcAxwDHAMcAxwDHAMcAxwDHAMgAyADIAMgAyADIAMgAyADIAMgAyADIAMkAyQDJAMkAyQDJAMkAyQDJAMkAyQDJAMoAygDKAMoAygDKAMoAygDKAMoAygDKAMsAywDLAMsAywDLAMsAywDLAMsAywDMAMwAzADMAMwAzADMAMwAzADMAMwAzADNAM0AzQDNAM0AzQDNAM0AzQDNAM0AzgDOAM4AzgDOAM4AzgDOAM4AzwDPAM8AzwDPAM8AzwDPAM8AzwDQANAA0ADQANAA0ADQANAA0ADQANAA0ADRANEA0QDRANEA0QDRANEA0QDRANEA0gDSANIA0gDSANIA0gDSANIA0wDTANMA0wDTANMA0wDTANMA0wDTANMA0wDUANQA1ADUANQA1ADUANQA1ADUANQA1ADVANUA1QDVANUA1QDVANUA1QDVANUA1gDWANYA1gDWANYA1gDWANYA1gDWANYA1wDXANcA1wDXANcA1wDXANcA1wDXANcA2ADYANgA2ADYANgA2ADYANgA2ADYANgA2QDZANkA2QDZANkA2QDZANkA2QDZANoA2gDaANoA2gDaANoA2gDaANoA2gDaANsA2wDbANsA2wDbANsA2wDbANsA3ADcANwA3ADcANwA3ADcANwA3ADcANwA3QDdAN0A3QDdAN0A3QDdAN0A3QDdAN0A3gDeAN4A3gDeAN4A3gDeAN4A3gDeAN4A3gDeAN8A3wDfAN8A3wDfAN8A3wDfAN8A3wDgAOAA4ADgAOAA4ADgAOAA4ADgAOAA4QDhAOEA4QDhAOEA4QDhAOEA4QDhAOIA4gDiAOIA4gDiAOIA4gDiAOIA4gDiAOIA4wDjAOMA4wDjAOMA4wDjAOMA4wDjAOMA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOQA5ADkAOUA5QDlAOUA5QDlAOUA5QDlAOUA5QDlAOUA5QDmAOYA5gDmAOYA5gDmAOYA5gDmAOYA5wDnAOcA5wDnAOcA5wDnAOcA5wDnAOcA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOkA6QDpAOkA6QDpAOkA6QDpAOkA6QDqAOoA6gDqAOoA6gDqAOoA6gDqAOoA6wDrAOsA6wDrAOsA6wDrAOsA6wDrAOwA7ADsAOwA7ADsAOwA7ADsAOwA7ADsAO0A7QDtAO0A7QDtAO0A7QDtAO0A7QDuAO4A7gDuAO4A7gDuAO4A7gDuAO4A7gDvAO8A7wDvAO8A7wDvAO8A7wDvAO8A8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPEA8QDxAPEA8QDxAPEA8QDxAPEA8QDxAPIA8gDyAPIA8gDyAPIA8gDyAPIA8gDzAPMA8wDzAPMA8wDzAPMA8wDzAPMA9AD0APQA9AD0APQA9AD0APQA9AD0APQA9QD1APUA9QD1APUA9QD1AA=='));
+
+const COMPILED_MODELS = {
+  convert: {
+    BLITZ: (x) => Math.max(0, Math.round(1.249538435 * x + 3.589128329e-05 * (x ** 2) + -815.5190644)),
+    BULLET: (x) => Math.max(0, Math.round(1.194995823 * x + -665.7855453)),
+    RAPID: (x) => Math.max(0, Math.round(1.542448122 * x + -7.605659775e-05 * (x ** 2) + -1025.331348)),
+    CLASSICAL: (x) => Math.max(0, Math.round(2.136186844 * x + -2570.281028)),
+  },
+  intervalTable: MODEL_ARTIFACT.intervalTable,
+};
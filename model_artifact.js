@@ -0,0 +1,90 @@
+// Reader for the binary model artifact written by model_artifact.py; see the layout there.
+const MODEL_ARTIFACT_MAGIC = 'L2CM';
+const MODEL_ARTIFACT_VERSION = 1;
+const MODEL_ARTIFACT_HEADER_SIZE = 32;
+const MODEL_ARTIFACT_RECORD_SIZE = 16;
+const MODEL_ARTIFACT_TYPES = ['linear', 'quadratic', 'log', 'polynomial', 'piecewise_linear', 'pchip'];
+const MODEL_ARTIFACT_TABLES = [[1, 'lookupTable'], [2, 'intervalTable'], [4, 'inverseTable']];
+// What the tables are indexed by: one row per category in this order (CATEGORIES in
+// convert_ratings.py), with one entry per rating from 0 to MODEL_ARTIFACT_MAX_RATING.
+const MODEL_ARTIFACT_CATEGORIES = ['BLITZ', 'BULLET', 'RAPID', 'CLASSICAL'];
+const MODEL_ARTIFACT_MAX_RATING = 4000;
+
+const CRC32_TABLE = (() => {
+  const table = new Uint32Array(256);
+  for (let n = 0; n < 256; n++) {
+    let c = n;
+    for (let k = 0; k < 8; k++) c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+    table[n] = c;
+  }
+  return table;
+})();
+
+const crc32 = (bytes) => {
+  let crc = 0xffffffff;
+  for (let i = 0; i < bytes.length; i++) crc = CRC32_TABLE[(crc ^ bytes[i]) & 0xff] ^ (crc >>> 8);
+  return (crc ^ 0xffffffff) >>> 0;
+};
+
+const align8 = (size) => size + (-size & 7);
+
+// Validates an artifact held in a Uint8Array and returns views on its coefficients and tables
+// without copying them. Throws on a truncated, corrupt or unsupported artifact, or one whose
+// categories or rating range differ from what the tables are indexed by.
+const readModelArtifact = (bytes) => {
+  if (bytes.length < MODEL_ARTIFACT_HEADER_SIZE) throw new Error('Model artifact is truncated');
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const magic = String.fromCharCode(...bytes.subarray(0, 4));
+  if (magic !== MODEL_ARTIFACT_MAGIC) throw new Error('Not a model artifact');
+  const version = view.getUint16(4, true);
+  if (version !== MODEL_ARTIFACT_VERSION) throw new Error(`Model artifact format ${version} is not supported`);
+  const flags = view.getUint16(6, true);
+  const count = view.getUint16(8, true);
+  const slots = view.getUint16(10, true);
+  const maxRating = view.getUint32(12, true);
+  const payloadSize = view.getUint32(16, true);
+  if (bytes.length !== MODEL_ARTIFACT_HEADER_SIZE + payloadSize) throw new Error('Model artifact is truncated');
+  if (crc32(bytes.subarray(MODEL_ARTIFACT_HEADER_SIZE)) !== view.getUint32(20, true)) {
+    throw new Error('Model artifact checksum mismatch');
+  }
+  if (maxRating !== MODEL_ARTIFACT_MAX_RATING) {
+    throw new Error(`Model artifact covers ratings up to ${maxRating}, expected ${MODEL_ARTIFACT_MAX_RATING}`);
+  }
+
+  const categories = [];
+  const types = [];
+  const paramCounts = [];
+  for (let i = 0; i < count; i++) {
+    const record = MODEL_ARTIFACT_HEADER_SIZE + i * MODEL_ARTIFACT_RECORD_SIZE;
+    const name = String.fromCharCode(...bytes.subarray(record, record + 12)).replace(/\0+$/, '');
+    const type = MODEL_ARTIFACT_TYPES[view.getUint16(record + 12, true) - 1];
+    const params = view.getUint16(record + 14, true);
+    if (!MODEL_ARTIFACT_CATEGORIES.includes(name)) throw new Error(`Unknown category in model artifact: ${name}`);
+    if (name !== MODEL_ARTIFACT_CATEGORIES[i]) {
+      throw new Error(`Model artifact lists ${name} out of order; expected ${MODEL_ARTIFACT_CATEGORIES.join(', ')}`);
+    }
+    if (!type || params === 0 || params > slots) throw new Error(`Invalid model record for ${name}`);
+    categories.push(name);
+    types.push(type);
+    paramCounts.push(params);
+  }
+
+  // Every section starts 8-byte aligned, so the typed arrays view the bytes in place.
+  let offset = bytes.byteOffset + MODEL_ARTIFACT_HEADER_SIZE + align8(count * MODEL_ARTIFACT_RECORD_SIZE);
+  const artifact = {
+    version, categories, types, paramCounts, maxRating,
+    coefficients: new Float64Array(bytes.buffer, offset, count * slots),
+    slots,
+  };
+  offset += count * slots * 8;
+  const tableLength = count * (maxRating + 1);
+  for (const [flag, name] of MODEL_ARTIFACT_TABLES) {
+    artifact[name] = null;
+    if (flags & flag) {
+      artifact[name] = new Int16Array(bytes.buffer, offset, tableLength);
+      offset += align8(tableLength * 2);
+    }
+  }
+  if (offset !== bytes.byteOffset + bytes.length) throw new Error('Model artifact sections do not match its header');
+  return artifact;
+};
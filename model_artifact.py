@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+
+from convert_ratings import CATEGORIES, LUT_MAX_RATING
+
+ARTIFACT_PATH = 'regressions_models.bin'
+
+# Layout (little-endian), every section 8-byte aligned so readers can view it in place:
+#   header      magic, format version, table flags, category count, coefficient slots per
+#               category, LUT_MAX_RATING, payload size and the CRC-32 of the payload
+#   records     per category: ASCII name, model type code, parameter count
+#   coefficients  float64 (categories, slots); unused slots are 0
+#   tables      int16 (categories, LUT_MAX_RATING + 1) for each table flagged in the header
+MAGIC = b'L2CM'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHHHIII8x')
+RECORD = struct.Struct('<12sHH')
+
+# Type codes, in the order written to the file. Bump FORMAT_VERSION when changing them.
+MODEL_TYPES = ['linear', 'quadratic', 'log', 'polynomial', 'piecewise_linear', 'pchip']
+# Polynomial families are stored in ascending powers ([constant, u, u^2, ...] with u = log(x) for log),
+# whatever their order in regressions.json; knot models keep their knots followed by their values.
+ASCENDING_TYPES = {'linear', 'quadratic', 'log', 'polynomial'}
+
+# Optional tables, as (flag, attribute) in file order.
+TABLES = [(1, 'lookup_table'), (2, 'interval_table'), (4, 'inverse_table')]
+
+@dataclass
+class ModelArtifact:
+    """A validated model artifact. The arrays are read-only views into the file (or bytes) it was loaded from."""
+    version: int
+    categories: list
+    types: list
+    param_counts: np.ndarray
+    coefficients: np.ndarray
+    lookup_table: np.ndarray = None
+    interval_table: np.ndarray = None
+    inverse_table: np.ndarray = None
+
+    def regressions(self):
+        """The models as regressions.json dicts, in the parameter order predict_regression expects."""
+        regressions = {}
+        for category, kind, count, coefs in zip(self.categories, self.types, self.param_counts, self.coefficients):
+            params = [float(c) for c in coefs[:count]]
+            regressions[category] = {'type': kind, 'params': params[::-1] if kind in ASCENDING_TYPES else params}
+        return regressions
+
+def _align(size):
+    return -size % 8
+
+def artifact_bytes(regressions, lookup_table=None, interval_table=None, inverse_table=None, categories=CATEGORIES):
+    """Serializes the models, and any tables given, into the artifact format."""
+    params = []
+    for category in categories:
+        regression = regressions[category]
+        if regression['type'] not in MODEL_TYPES:
+            raise ValueError(f"Unknown regression type: {regression['type']}")
+        values = list(regression['params'])
+        params.append(values[::-1] if regression['type'] in ASCENDING_TYPES else values)
+    slots = max(len(p) for p in params)
+
+    records = b''.join(RECORD.pack(category.encode('ascii'), MODEL_TYPES.index(regressions[category]['type']) + 1,
+                                   len(p)) for category, p in zip(categories, params))
+    coefficients = np.zeros((len(categories), slots), dtype='<f8')
+    for row, p in enumerate(params):
+        coefficients[row, :len(p)] = p
+    sections = [records, b'\0' * _align(len(records)), coefficients.tobytes()]
+
+    flags = 0
+    shape = (len(categories), LUT_MAX_RATING + 1)
+    for flag, table in zip((f for f, _ in TABLES), (lookup_table, interval_table, inverse_table)):
+        if table is not None:
+            if np.shape(table) != shape:
+                raise ValueError(f"Expected a table of shape {shape}, got {np.shape(table)}")
+            flags |= flag
+            sections.append(np.ascontiguousarray(table, dtype='<i2').tobytes())
+            sections.append(b'\0' * _align(len(sections[-1])))
+
+    payload = b''.join(sections)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(categories), slots, LUT_MAX_RATING, len(payload),
+                         zlib.crc32(payload))
+    return header + payload
+
+def write_artifact(path, regressions, lookup_table=None, interval_table=None, inverse_table=None):
+    """Writes the artifact atomically, so a reader never sees a half-written file."""
+    data = artifact_bytes(regressions, lookup_table, interval_table, inverse_table)
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+def read_artifact(data):
+    """Validates an artifact held in bytes, a memoryview or a uint8 array and views its sections without copying.
+
+    Raises ValueError for anything that is not a complete, uncorrupted artifact of this format
+    version with the categories and rating range this code expects.
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if len(buffer) < HEADER.size:
+        raise ValueError('Model artifact is truncated')
+    magic, version, flags, count, slots, max_rating, payload_size, checksum = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError('Not a model artifact')
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Model artifact format {version} is not supported (expected {FORMAT_VERSION}); rebuild it")
+    if len(buffer) != HEADER.size + payload_size:
+        raise ValueError('Model artifact is truncated')
+    payload = buffer[HEADER.size:]
+    if zlib.crc32(payload) != checksum:
+        raise ValueError('Model artifact checksum mismatch')
+    if max_rating != LUT_MAX_RATING:
+        raise ValueError(f"Model artifact covers ratings up to {max_rating}, expected {LUT_MAX_RATING}")
+
+    categories, types, counts = [], [], []
+    for i in range(count):
+        name, code, params = RECORD.unpack_from(payload, i * RECORD.size)
+        category = name.rstrip(b'\0').decode('ascii', errors='replace')
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown category in model artifact: {category}")
+        if not 1 <= code <= len(MODEL_TYPES) or not 0 < params <= slots:
+            raise ValueError(f"Invalid model record for {category}")
+        categories.append(category)
+        types.append(MODEL_TYPES[code - 1])
+        counts.append(params)
+
+    offset = count * RECORD.size
+    offset += _align(offset)
+    coefficients = payload[offset:offset + count * slots * 8].view('<f8').reshape(count, slots)
+    offset += count * slots * 8
+    tables = {}
+    table_size = count * (LUT_MAX_RATING + 1) * 2
+    for flag, attribute in TABLES:
+        if flags & flag:
+            tables[attribute] = payload[offset:offset + table_size].view('<i2').reshape(count, LUT_MAX_RATING + 1)
+            offset += table_size + _align(table_size)
+    if offset != payload_size:
+        raise ValueError('Model artifact sections do not match its header')
+    return ModelArtifact(version, categories, types, np.array(counts), coefficients, **tables)
+
+def load_artifact(path=ARTIFACT_PATH):
+    """Memory-maps and validates an artifact file."""
+    return read_artifact(np.memmap(path, dtype=np.uint8, mode='r'))
+
+def load_models(path):
+    """Loads regressions from either an artifact or a regressions.json file."""
+    with open(path, 'rb') as f:
+        is_artifact = f.read(len(MAGIC)) == MAGIC
+    if is_artifact:
+        return load_artifact(path).regressions()
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def main():
+    parser = argparse.ArgumentParser(description='Validates a model artifact and prints its models.')
+    parser.add_argument('path', nargs='?', default=ARTIFACT_PATH, help='Artifact to check')
+    args = parser.parse_args()
+
+    artifact = load_artifact(args.path)
+    tables = [attribute for _, attribute in TABLES if getattr(artifact, attribute) is not None]
+    print(f"{args.path}: format {artifact.version}, tables: {', '.join(tables) or 'none'}")
+    for category, regression in artifact.regressions().items():
+        print(f"{category:<10} {regression['type']:<17} {regression['params']}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from convert_ratings import predict_regression
+from instrumentation import init_worker
+
+CACHE_DIR = os.path.join('.cache', 'model_selection')
+# Bump when a candidate's fitting changes so stale fold scores are not reused.
+CACHE_VERSION = 1
+CV_FOLDS = 5
+POLYNOMIAL_DEGREES = range(1, 5)
+KNOTS = 6
+
+# Candidate name -> fit(x, y) returning a regression dict ({'type': ..., 'params': [...]}).
+CANDIDATES = {}
+
+def register_candidate(name):
+    """Registers a fit function as a model-selection candidate."""
+    def decorator(fit):
+        CANDIDATES[name] = fit
+        return fit
+    return decorator
+
+def fit_polynomial(x, y, degree):
+    """Least-squares polynomial, stored in the same layout the extension already evaluates."""
+    coefs = np.polynomial.Polynomial.fit(x, y, degree).convert().coef[::-1]
+    coefs = [float(c) for c in np.pad(coefs, (degree + 1 - len(coefs), 0))]
+    if degree == 1:
+        return {'type': 'linear', 'params': coefs}
+    if degree == 2:
+        return {'type': 'quadratic', 'params': coefs}
+    return {'type': 'polynomial', 'params': coefs}
+
+for _degree in POLYNOMIAL_DEGREES:
+    register_candidate(f'polynomial{_degree}')(lambda x, y, degree=_degree: fit_polynomial(x, y, degree))
+
+@register_candidate('log')
+def fit_log(x, y):
+    slope, intercept = np.polynomial.Polynomial.fit(np.log(x), y, 1).convert().coef[::-1]
+    return {'type': 'log', 'params': [float(slope), float(intercept)]}
+
+def _knots(x, count=KNOTS):
+    return np.unique(np.quantile(x, np.linspace(0, 1, count)))
+
+def _fit_knot_values(x, y, knots):
+    """Least-squares values at the knots of a piecewise-linear curve (extrapolating past the end knots)."""
+    basis = np.empty((len(x), len(knots)))
+    for k in range(len(knots)):
+        unit = np.zeros(len(knots))
+        unit[k] = 1.0
+        basis[:, k] = predict_regression({'type': 'piecewise_linear', 'params': [*knots, *unit]}, x)
+    values, *_ = np.linalg.lstsq(basis, y, rcond=None)
+    return values
+
+def pool_adjacent_violators(values, weights):
+    """Weighted isotonic (non-decreasing) regression of a sequence."""
+    blocks = []  # [mean, weight, count]
+    for value, weight in zip(values, weights):
+        blocks.append([value, weight, 1])
+        while len(blocks) > 1 and blocks[-2][0] > blocks[-1][0]:
+            mean, weight, count = blocks.pop()
+            previous = blocks[-1]
+            total = previous[1] + weight
+            previous[0] = (previous[0] * previous[1] + mean * weight) / total
+            previous[1] = total
+            previous[2] += count
+    return np.repeat([b[0] for b in blocks], [b[2] for b in blocks])
+
+@register_candidate('piecewise_linear')
+def fit_piecewise_linear(x, y):
+    knots = _knots(x)
+    values = _fit_knot_values(x, y, knots)
+    return {'type': 'piecewise_linear', 'params': [float(v) for v in (*knots, *values)]}
+
+@register_candidate('monotone_spline')
+def fit_monotone_spline(x, y):
+    """Monotone cubic (PCHIP) through isotonic least-squares values at quantile knots."""
+    knots = _knots(x)
+    values = _fit_knot_values(x, y, knots)
+    weights = np.histogram(x, bins=np.concatenate([knots, [np.inf]]))[0] + 1.0
+    values = pool_adjacent_violators(values, weights)
+    return {'type': 'pchip', 'params': [float(v) for v in (*knots, *values)]}
+
+@register_candidate('isotonic')
+def fit_isotonic(x, y):
+    """Isotonic regression, interpolated linearly between the means of its blocks."""
+    order = np.argsort(x, kind='stable')
+    x, y = np.asarray(x, dtype=np.float64)[order], np.asarray(y, dtype=np.float64)[order]
+    fitted = pool_adjacent_violators(y, np.ones(len(y)))
+    knots, inverse = np.unique(x, return_inverse=True)
+    values = np.bincount(inverse, weights=fitted) / np.bincount(inverse)
+    if len(knots) < 2:
+        knots, values = np.array([knots[0], knots[0] + 1]), np.repeat(values, 2)
+    return {'type': 'piecewise_linear', 'params': [float(v) for v in (*knots, *values)]}
+
+def _data_hash(x, y):
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(x, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+def cross_validate(name, x, y, folds=CV_FOLDS, seed=0):
+    """Mean squared error of a candidate on each of k shuffled held-out folds."""
+    fit = CANDIDATES[name]
+    assignment = np.random.default_rng(seed).permutation(len(x)) % folds
+    errors = []
+    for fold in range(folds):
+        test = assignment == fold
+        try:
+            regression = fit(x[~test], y[~test])
+            with np.errstate(all='ignore'):
+                residuals = y[test] - predict_regression(regression, x[test])
+            errors.append(float(np.mean(residuals ** 2)))
+        except (np.linalg.LinAlgError, ValueError, IndexError):
+            errors.append(float('inf'))
+    return [e if np.isfinite(e) else float('inf') for e in errors]
+
+def _cache_path(cache_dir, name, data_hash, folds, seed):
+    key = f'{CACHE_VERSION}:{name}:{folds}:{seed}:{data_hash}'
+    return os.path.join(cache_dir, hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+def select_models(datasets, candidates=None, folds=CV_FOLDS, seed=0, workers=None, cache_dir=CACHE_DIR):
+    """Picks the candidate with the lowest k-fold cross-validated MSE for each {name: (x, y)} dataset.
+
+    Fold scores are cached by a hash of each dataset, so only datasets whose data
+    changed are refitted; the remaining (dataset, candidate) pairs run in a process pool.
+    Returns (regressions, scores) where scores maps dataset -> candidate -> mean CV MSE.
+    """
+    candidates = list(candidates or CANDIDATES)
+    datasets = {k: (np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)) for k, (x, y) in datasets.items()}
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    fold_errors, pending = {}, []
+    for dataset, (x, y) in datasets.items():
+        data_hash = _data_hash(x, y)
+        for name in candidates:
+            path = _cache_path(cache_dir, name, data_hash, folds, seed) if cache_dir else None
+            if path and os.path.exists(path):
+                with open(path, 'r') as f:
+                    fold_errors[dataset, name] = json.load(f)
+            else:
+                pending.append((dataset, name, path))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            results = executor.map(
+                cross_validate,
+                [name for _, name, _ in pending],
+                [datasets[d][0] for d, _, _ in pending],
+                [datasets[d][1] for d, _, _ in pending],
+                [folds] * len(pending),
+                [seed] * len(pending),
+            )
+            for (dataset, name, path), errors in zip(pending, results):
+                fold_errors[dataset, name] = errors
+                if path:
+                    with open(path, 'w') as f:
+                        json.dump(errors, f)
+
+    regressions, scores = {}, {}
+    for dataset, (x, y) in datasets.items():
+        scores[dataset] = {name: float(np.mean(fold_errors[dataset, name])) for name in candidates}
+        best = min(candidates, key=scores[dataset].get)
+        regressions[dataset] = CANDIDATES[best](x, y)
+    return regressions, scores
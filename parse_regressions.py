@@ -1,29 +1,191 @@
-import pandas as pd
-from requests_html import HTMLSession
+# Imported first, so that when profiling its import hook also times numpy
+from instrumentation import span
+import numpy as np
+from array import array
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import math
+import os
 import sys
-import time
-
-def parse_table(table_element):
-    # Extract headers, cleaning up <br> tags
-    headers = []
-    for th in table_element.find('th'):
-        # Replace <br> with a space and then get text, strip extra whitespace
-        header_text = th.text.replace('\n', ' ').strip()
-        headers.append(header_text)
-
-    rows = []
-    # Iterate through rows, skipping the header row (which is the first tr)
-    for tr in table_element.find('tr')[1:]:
-        row_data = [td.text.strip() for td in tr.find('td')]
-        # Filter out empty strings from row_data if any td is empty
-        row_data = [item for item in row_data if item]
-        if row_data: # Only add non-empty rows
-            rows.append(row_data)
-    return pd.DataFrame(rows, columns=headers)
+from collections import Counter
+from dataclasses import dataclass, replace
+
+URL = 'https://chessgoals.com/rating-comparison/'
+# Responses with their ETag/Last-Modified, so unchanged pages are answered with a 304
+HTTP_CACHE_DIR = os.path.join('.cache', 'http')
+
+@dataclass
+class Source:
+    """A page of comparison tables: table id -> (CSV written from it, {header: column} of the columns kept, in order)."""
+    name: str
+    url: str
+    tables: dict
+
+SOURCES = [
+    Source('chessgoals', URL, {
+        # Chess.com vs. FIDE and USCF
+        'tablepress-24': ('chess_com_to_chess_com_data.csv', {
+            'Chess.com Blitz': 'chess_com_blitz',
+            'Bullet (+/- 130) N=9249': 'chess_com_bullet',
+            'Rapid (+/- 115) N=10193': 'chess_com_rapid',
+            'USCF (+/- 130) N=1293': 'uscf',
+            'FIDE (+/- 85) N=1873': 'fide',
+        }),
+        # Lichess vs. Chess.com
+        'tablepress-27': ('lichess_to_chess_com_data.csv', {
+            'Chess.com Blitz': 'chess_com_blitz',
+            'Lichess Blitz (+/- 75) N=2489': 'lichess_blitz',
+            'Lichess Bullet (+/- 120) N=1945': 'lichess_bullet',
+            'Lichess Rapid (+/- 100) N=1344': 'lichess_rapid',
+            'Lichess Classical (+/- 85) N=314': 'lichess_classical',
+        }),
+    }),
+]
+
+def _cell_value(text, table_id, row):
+    # Empty cells are kept as NaN so every later cell stays in its own column
+    text = text.strip().replace(',', '')
+    if not text:
+        return math.nan
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"Non-numeric cell {text!r} in row {row} of #{table_id}") from None
+
+def parse_tables(source, table_ids):
+    """Parses the given tables from an HTML file or bytes in one streaming pass.
+
+    Cells go straight into typed float columns (integer columns are narrowed to int64)
+    and each row is discarded once read, so memory stays bounded by the columns.
+    Returns {table_id: DataFrame} for the tables that were found.
+    """
+    with span('import lxml', 'import'):
+        from lxml import etree
+    with span('import pandas', 'import'):
+        import pandas as pd
+
+    if isinstance(source, (bytes, str)):
+        source = io.BytesIO(source.encode() if isinstance(source, str) else source)
+
+    tables = {}
+    table_id = None
+    headers, columns, row, rows = [], [], [], 0
+    for event, elem in etree.iterparse(source, events=('start', 'end'), html=True, tag=('table', 'tr', 'th', 'td')):
+        if elem.tag == 'table':
+            if event == 'start' and table_id is None and elem.get('id') in table_ids:
+                table_id = elem.get('id')
+                headers, columns, rows = [], [], 0
+            elif event == 'end':
+                if table_id is not None and elem.get('id') == table_id:
+                    frame = pd.DataFrame({h: np.frombuffer(c, dtype=np.float64) for h, c in zip(headers, columns)})
+                    for header in headers:
+                        values = frame[header]
+                        if not values.isna().any() and (values == values.round()).all():
+                            frame[header] = values.astype(np.int64)
+                    tables[table_id] = frame
+                    table_id = None
+                # Every table is dropped once read, whether or not it was one of ours
+                elem.clear()
+            continue
+        if event == 'start':
+            continue
+
+        if elem.tag == 'th' and table_id is not None:
+            # Collapse <br> line breaks and whitespace into single spaces
+            headers.append(' '.join(''.join(elem.itertext()).split()))
+        elif elem.tag == 'td' and table_id is not None:
+            row.append(''.join(elem.itertext()))
+        elif elem.tag == 'tr':
+            if table_id is not None and row and any(cell.strip() for cell in row):
+                if not headers:
+                    raise ValueError(f"#{table_id} has no <th> header row")
+                if not columns:
+                    columns = [array('d') for _ in headers]
+                rows += 1
+                for i, column in enumerate(columns):
+                    column.append(_cell_value(row[i], table_id, rows) if i < len(row) else math.nan)
+            row = []
+            # Drop the rows already read, in every table, so large pages are parsed in bounded memory
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    return tables
+
+def parse_table(source, table_id):
+    """Parses a single table by id; see parse_tables."""
+    return parse_tables(source, [table_id]).get(table_id)
+
+def _get(url, headers, timeout):
+    import requests
+
+    response = requests.get(url, timeout=timeout, headers={'User-Agent': 'Lichess2Chess', **headers})
+    if response.status_code != 304:
+        response.raise_for_status() # Raise an exception for bad status codes
+    return response
+
+def _cache_paths(url, cache_dir):
+    key = hashlib.sha256(url.encode()).hexdigest()
+    return os.path.join(cache_dir, f'{key}.json'), os.path.join(cache_dir, f'{key}.html')
+
+def _write_atomic(path, data):
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+async def fetch_conditional(url, cache_dir=HTTP_CACHE_DIR, timeout=10):
+    """Fetches a page, revalidating the cached copy with If-None-Match/If-Modified-Since.
+
+    Returns (page, changed). An unchanged page costs one 304 round trip and is read from the
+    cache; a 200 with the same bytes as the cached copy also counts as unchanged. Without a
+    cache_dir the page is always fetched. Raises for connection errors and bad status codes.
+    """
+    meta_path, body_path = _cache_paths(url, cache_dir) if cache_dir else (None, None)
+    meta, cached = {}, None
+    if cache_dir and os.path.exists(meta_path) and os.path.exists(body_path):
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            cached = f.read()
+
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    response = await asyncio.to_thread(_get, url, headers, timeout)
+    if response.status_code == 304:
+        if cached is not None:
+            return cached, False
+        # Nothing to reuse (the server answered 304 unasked), so ask for the page itself
+        response = await asyncio.to_thread(_get, url, {'Cache-Control': 'no-cache'}, timeout)
+        if response.status_code == 304:
+            raise ValueError(f"{url} answered 304 Not Modified without a cached copy to reuse")
+
+    page = response.content
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        # The body goes first, so the validators never describe a page that was not saved
+        _write_atomic(body_path, page)
+        _write_atomic(meta_path, json.dumps({'url': url, 'etag': response.headers.get('ETag'),
+                                             'last_modified': response.headers.get('Last-Modified')}).encode())
+    return page, page != cached
+
+async def fetch_sources(urls, cache_dir=HTTP_CACHE_DIR, timeout=10):
+    """Fetches every URL concurrently with fetch_conditional; returns [(page, changed)] in order."""
+    with span('import requests', 'import'):
+        import requests  # noqa: F401 (imported once here rather than in every worker thread)
+
+    return await asyncio.gather(*(fetch_conditional(url, cache_dir, timeout) for url in urls))
+
+def fetch_rendered(url=URL):
+    """Fetches the page and renders it in headless Chromium, showing 100 entries per table."""
+    from requests_html import HTMLSession
 
-def main():
     session = HTMLSession()
-    url = 'https://chessgoals.com/rating-comparison/'
     try:
         response = session.get(url)
         # Render JavaScript to load dynamic content and tables
@@ -47,72 +209,110 @@ def main():
     except Exception as e:
         print(f"Error executing JavaScript or re-rendering after pagination change: {e}")
         sys.exit(1)
+    return response.html.html.encode()
 
-    # Find tables by their specific IDs
-    tablepress_24 = response.html.find('#tablepress-24', first=True)
-    tablepress_27 = response.html.find('#tablepress-27', first=True)
+def row_hashes(df):
+    """One 64-bit hash per row of a table's values (integer and float columns hash alike)."""
+    import pandas as pd
 
-    if not tablepress_24 or not tablepress_27:
-        print("Error: Could not find both required tables (tablepress-24 and tablepress-27) after pagination update.")
-        sys.exit(1)
+    return pd.util.hash_pandas_object(df.astype(np.float64), index=False).to_numpy()
+
+def diff_rows(old, new):
+    """Rows of new that are not in old and rows of old that are not in new, as (added, removed) DataFrames.
+
+    Rows are matched by their hashes, so rows that only moved are neither added nor removed.
+    """
+    if list(old.columns) != list(new.columns):
+        return new, old
+    old_hashes, new_hashes = row_hashes(old), row_hashes(new)
+    added = Counter(new_hashes) - Counter(old_hashes)
+    removed = Counter(old_hashes) - Counter(new_hashes)
+
+    def take(df, hashes, counts):
+        keep = []
+        for i, h in enumerate(hashes):
+            if counts[h] > 0:
+                counts[h] -= 1
+                keep.append(i)
+        return df.iloc[keep]
+
+    return take(new, new_hashes, added), take(old, old_hashes, removed)
+
+def update_csv(df, filename):
+    """Writes the table unless the CSV already holds the same rows in the same order.
+
+    Prints and returns the row-level diff as (added, removed), or None when the file is unchanged.
+    """
+    import pandas as pd
 
-    # Process tablepress-24 (Chess.com vs. FIDE and USCF)
-    df_24 = parse_table(tablepress_24)
-    filename_24 = 'chess_com_to_chess_com_data.csv'
-    # Rename columns to match the original CSV for consistency
-    df_24 = df_24.rename(columns={
-        'Chess.com Blitz': 'chess_com_blitz',
-        'Bullet (+/- 130) N=9249': 'chess_com_bullet',
-        'Rapid (+/- 115) N=10193': 'chess_com_rapid',
-        'USCF (+/- 130) N=1293': 'uscf',
-        'FIDE (+/- 85) N=1873': 'fide'
-    })
-    # Select only the columns we need and ensure order
-    df_24 = df_24[['chess_com_blitz', 'chess_com_bullet', 'chess_com_rapid', 'uscf', 'fide']]
-    
-    updated_24 = False
-    try:
-        existing_df_24 = pd.read_csv(filename_24)
-        if not df_24.equals(existing_df_24): # Use .equals for DataFrame comparison
-            df_24.to_csv(filename_24, index=False)
-            updated_24 = True
-    except FileNotFoundError:
-        df_24.to_csv(filename_24, index=False)
-        updated_24 = True
-
-    if updated_24:
-        print(f"Updated {filename_24}")
-    else:
-        print(f"{filename_24} is already up to date.")
-
-    # Process tablepress-27 (Lichess vs. Chess.com)
-    df_27 = parse_table(tablepress_27)
-    filename_27 = 'lichess_to_chess_com_data.csv'
-    # Rename columns to match the original CSV for consistency
-    df_27 = df_27.rename(columns={
-        'Chess.com Blitz': 'chess_com_blitz',
-        'Lichess Blitz (+/- 75) N=2489': 'lichess_blitz',
-        'Lichess Bullet (+/- 120) N=1945': 'lichess_bullet',
-        'Lichess Rapid (+/- 100) N=1344': 'lichess_rapid',
-        'Lichess Classical (+/- 85) N=314': 'lichess_classical'
-    })
-    # Select only the columns we need and ensure order
-    df_27 = df_27[['chess_com_blitz', 'lichess_blitz', 'lichess_bullet', 'lichess_rapid', 'lichess_classical']]
-
-    updated_27 = False
     try:
-        existing_df_27 = pd.read_csv(filename_27)
-        if not df_27.equals(existing_df_27): # Use .equals for DataFrame comparison
-            df_27.to_csv(filename_27, index=False)
-            updated_27 = True
+        existing = pd.read_csv(filename)
     except FileNotFoundError:
-        df_27.to_csv(filename_27, index=False)
-        updated_27 = True
+        existing = df.iloc[:0]
+    if list(existing.columns) == list(df.columns) and np.array_equal(row_hashes(existing), row_hashes(df)):
+        print(f"{filename} is already up to date.")
+        return None
+
+    df.to_csv(filename, index=False)
+    added, removed = diff_rows(existing, df)
+    print(f"Updated {filename}: {len(added)} rows added, {len(removed)} removed"
+          + ("" if len(added) or len(removed) else " (reordered)"))
+    for sign, rows in (('+', added), ('-', removed)):
+        for row in rows.itertuples(index=False):
+            print(f"  {sign} " + ','.join('' if pd.isna(v) else f'{v:g}' for v in row))
+    return added, removed
+
+def main():
+    parser = argparse.ArgumentParser(description='Fetches the ChessGoals rating comparison tables into CSV files.')
+    parser.add_argument('--url', default=URL, help='Page to read the TablePress tables from')
+    parser.add_argument('--render', action='store_true',
+                        help='Render the page in headless Chromium instead of reading the static HTML')
+    parser.add_argument('--cache-dir', default=HTTP_CACHE_DIR,
+                        help="Where fetched pages are cached for conditional requests ('' to always download)")
+    parser.add_argument('--snapshots', default='snapshots.arrow',
+                        help="Snapshot store every new version of the tables is appended to ('' to skip)")
+    args = parser.parse_args()
+    sources = [replace(source, url=args.url) if source.name == 'chessgoals' else source for source in SOURCES]
+
+    with span('fetch', mode='rendered' if args.render else 'static'):
+        if args.render:
+            pages = [(fetch_rendered(source.url), True) for source in sources]
+        else:
+            try:
+                pages = asyncio.run(fetch_sources([source.url for source in sources], args.cache_dir or None))
+            except Exception as e:
+                print(f"Error fetching URL: {e}")
+                sys.exit(1)
+
+    for source, (page, changed) in zip(sources, pages):
+        filenames = [filename for filename, _ in source.tables.values()]
+        if not changed and all(os.path.exists(filename) for filename in filenames):
+            # The page is the one these CSVs were written from, so there is nothing to parse
+            for filename in filenames:
+                print(f"{filename} is already up to date.")
+            continue
+
+        # Find tables by their specific IDs
+        with span('parse tables', bytes=len(page)):
+            tables = parse_tables(page, list(source.tables))
+
+        if len(tables) != len(source.tables):
+            print(f"Error: Could not find the required tables ({', '.join(source.tables)}) on {source.url}."
+                  + ("" if args.render else " Try --render if the page now builds them with JavaScript."))
+            sys.exit(1)
+
+        frames = {}
+        for table_id, (filename, columns) in source.tables.items():
+            # Rename the columns to match the original CSVs, keeping only the ones we need in order
+            frames[filename] = tables[table_id].rename(columns=columns)[list(columns.values())]
+            update_csv(frames[filename], filename)
+
+        if args.snapshots:
+            from snapshot_store import append_snapshot, table_name
 
-    if updated_27:
-        print(f"Updated {filename_27}")
-    else:
-        print(f"{filename_27} is already up to date.")
+            snapshot = append_snapshot({table_name(f): df for f, df in frames.items()}, args.snapshots, source.url)
+            if snapshot is not None:
+                print(f"Added snapshot {snapshot['id']} to {args.snapshots}")
 
 if __name__ == '__main__':
     main()
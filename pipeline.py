@@ -0,0 +1,216 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+import instrumentation
+from instrumentation import span
+
+STATE_PATH = '.pipeline_state.json'
+PROFILE_DIR = os.path.join('.cache', 'profile')
+PREPARED_DIR = os.path.join('.cache', 'datasets')
+PACKAGE_PATH = 'Lichess2Chess.zip'
+PACKAGE_FILES = ['manifest.json', 'model_artifact.js', 'lichess2chess_models.js', 'lichess2chess.js', 'images/*']
+
+@dataclass
+class Stage:
+    """A pipeline step: a command (argv list) or Python callable, and the files it reads and writes.
+
+    A stage is skipped when the content hash of its inputs and outputs matches the last
+    successful run. Stages marked always run every time (e.g. network fetches).
+    """
+    name: str
+    action: object
+    inputs: list = field(default_factory=list)
+    outputs: list = field(default_factory=list)
+    deps: list = field(default_factory=list)
+    always: bool = False
+
+def expand(patterns):
+    """Expands glob patterns into a sorted list of existing files."""
+    paths = set()
+    for pattern in patterns:
+        paths.update(p for p in glob.glob(pattern) if os.path.isfile(p))
+    return sorted(paths)
+
+def hash_files(patterns):
+    """Content hash over the matched files' paths and bytes."""
+    digest = hashlib.sha256()
+    for path in expand(patterns):
+        digest.update(path.encode() + b'\0')
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+def load_state(path=STATE_PATH):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_state(state, path=STATE_PATH):
+    with open(path, 'w') as f:
+        json.dump(state, f, indent=2)
+
+def _run_action(stage):
+    if callable(stage.action):
+        stage.action()
+    else:
+        subprocess.run(stage.action, check=True)
+
+def _check_graph(stages):
+    """Raises ValueError for unknown dependencies or cycles, which would otherwise never be scheduled."""
+    names = {s.name for s in stages}
+    for stage in stages:
+        unknown = set(stage.deps) - names
+        if unknown:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {sorted(unknown)}")
+    ordered = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [s for s in remaining if set(s.deps) <= ordered]
+        if not ready:
+            raise ValueError(f"Dependency cycle between stages: {sorted(s.name for s in remaining)}")
+        ordered.update(s.name for s in ready)
+        remaining = [s for s in remaining if s not in ready]
+
+def run_pipeline(stages, state_path=STATE_PATH, force=False, skip=(), jobs=None):
+    """Runs the stages in dependency order, independent stages in parallel, skipping unchanged ones.
+
+    Returns a list of (name, status, seconds) with status 'ran', 'skipped', 'failed' or 'blocked'.
+    """
+    _check_graph(stages)
+    state = load_state(state_path)
+    results = {}
+    timings = []
+
+    def execute(stage):
+        start = time.perf_counter()
+        if stage.name in skip:
+            return 'skipped', time.perf_counter() - start
+        inputs_hash = hash_files(stage.inputs)
+        recorded = state.get(stage.name, {})
+        if (not force and not stage.always and recorded.get('inputs') == inputs_hash
+                and recorded.get('outputs') == hash_files(stage.outputs)):
+            return 'skipped', time.perf_counter() - start
+        try:
+            with span(stage.name, 'pipeline'):
+                _run_action(stage)
+        except Exception as e:
+            print(f"[{stage.name}] failed: {e}", file=sys.stderr)
+            state.pop(stage.name, None)
+            return 'failed', time.perf_counter() - start
+        # Hash the inputs again: a stage may rewrite one of its own inputs (e.g. README.md).
+        state[stage.name] = {'inputs': hash_files(stage.inputs), 'outputs': hash_files(stage.outputs)}
+        return 'ran', time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=jobs or len(stages)) as executor:
+        running = {}
+        pending = list(stages)
+        while pending or running:
+            for stage in list(pending):
+                dep_results = [results.get(d) for d in stage.deps]
+                if any(r in ('failed', 'blocked') for r in dep_results):
+                    results[stage.name] = 'blocked'
+                    timings.append((stage.name, 'blocked', 0.0))
+                    pending.remove(stage)
+                elif all(r is not None for r in dep_results):
+                    running[executor.submit(execute, stage)] = stage
+                    pending.remove(stage)
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                status, seconds = future.result()
+                results[stage.name] = status
+                timings.append((stage.name, status, seconds))
+                print(f"[{stage.name}] {status} in {seconds:.2f}s", flush=True)
+
+    save_state(state, state_path)
+    return timings
+
+def package_extension(path=PACKAGE_PATH, files=PACKAGE_FILES):
+    """Zips the extension files for upload."""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for file in expand(files):
+            archive.write(file)
+
+def default_stages(offline=False):
+    python = sys.executable
+    data = ['lichess_to_chess_com_data.csv', 'chess_com_to_chess_com_data.csv']
+    models = ['regressions.json', 'regressions_lut.bin', 'regressions_inverse.bin', 'regressions_interval.bin',
+              'regressions_models.bin', 'lichess2chess_models.js']
+    extension = ['manifest.json', 'model_artifact.js', 'lichess2chess.js', 'lichess2chess_models.js']
+    # The prepared datasets are named by the hash of the CSVs, so the CSVs stand for them as inputs,
+    # along with the modules that build them (and that every later stage imports too).
+    prepared = data + ['prepared_data.py', 'rating_graph.py', 'convert_ratings.py', 'model_artifact.py', 'instrumentation.py']
+    stages = [
+        Stage('prepare', [python, 'prepared_data.py'], inputs=prepared,
+              outputs=[os.path.join(PREPARED_DIR, '*.npz')], deps=[] if offline else ['fetch']),
+        Stage('fit', [python, 'calculate_regressions.py'],
+              inputs=prepared + ['calculate_regressions.py', 'model_selection.py', 'streaming_fit.py'],
+              outputs=models, deps=['prepare']),
+        Stage('plots', [python, 'generate_plots.py'],
+              inputs=prepared + ['generate_plots.py', 'regressions.json'],
+              outputs=['images/*_regression.png', 'README.md'], deps=['fit']),
+        # The tests check the committed data and model files, so they wait for fit to finish writing
+        # them and rerun whenever any of them changed.
+        Stage('test_regressions', [python, '-m', 'pytest', '-q', 'tests', '--ignore=tests/test_extension.py'],
+              inputs=['*.py', 'tests/*.py', 'tests/*.csv'] + data + models + ['snapshots.arrow'], deps=['fit']),
+        Stage('test_extension', [python, '-m', 'pytest', '-q', 'tests/test_extension.py'],
+              inputs=extension + ['tests/test_extension.py', 'tests/fixtures/lichess/*'], deps=['fit']),
+        Stage('package', package_extension,
+              inputs=PACKAGE_FILES, outputs=[PACKAGE_PATH],
+              deps=['fit', 'plots', 'test_regressions', 'test_extension']),
+    ]
+    if not offline:
+        # The upstream page has no local content to hash, so fetching always runs;
+        # unchanged CSVs still let every later stage skip.
+        stages.insert(0, Stage('fetch', [python, 'parse_regressions.py'], inputs=['parse_regressions.py'],
+                               outputs=data + ['snapshots.arrow'], always=True))
+    return stages
+
+def print_summary(timings, total):
+    print("\nStage               Status     Time")
+    for name, status, seconds in timings:
+        print(f"{name:<19} {status:<10} {seconds:6.2f}s")
+    print(f"{'total':<19} {'':<10} {total:6.2f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description='Refreshes the data, models, plots and extension package, skipping unchanged stages.')
+    parser.add_argument('--offline', action='store_true', help='Skip fetching ChessGoals and use the CSVs on disk')
+    parser.add_argument('--force', action='store_true', help='Run every stage even if its inputs are unchanged')
+    parser.add_argument('--skip', nargs='+', default=[], help='Stages to skip, e.g. test_extension')
+    parser.add_argument('--jobs', type=int, default=None, help='Maximum stages run in parallel')
+    parser.add_argument('--profile', nargs='?', const=instrumentation.TRACE_PATH, metavar='TRACE',
+                        help='Record wall time, CPU time, peak RSS and import times of every stage and script step, '
+                             f'written as a Chrome trace (default {instrumentation.TRACE_PATH})')
+    args = parser.parse_args()
+
+    if args.profile:
+        for path in glob.glob(os.path.join(PROFILE_DIR, '*.json')):
+            os.remove(path)
+        # The stage scripts inherit the setting and write their own spans next to the pipeline's.
+        instrumentation.enable(PROFILE_DIR)
+
+    start = time.perf_counter()
+    timings = run_pipeline(default_stages(args.offline), force=args.force, skip=set(args.skip), jobs=args.jobs)
+    print_summary(timings, time.perf_counter() - start)
+
+    if args.profile:
+        instrumentation.write_events()
+        events = instrumentation.merge_traces(PROFILE_DIR, args.profile)
+        instrumentation.print_summary(instrumentation.summarize(events))
+        print(f"\nWrote the trace to {args.profile}")
+    if any(status in ('failed', 'blocked') for _, status, _ in timings):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
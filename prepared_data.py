@@ -0,0 +1,66 @@
+import argparse
+import hashlib
+import json
+import os
+
+# Imported first, so that when profiling its import hook also times numpy
+from instrumentation import span
+import numpy as np
+
+from rating_graph import CATEGORY_SYSTEMS, DATA_PATHS, RatingGraph
+
+CACHE_DIR = os.path.join('.cache', 'datasets')
+# Bump when the preparation changes so stale datasets are not reused.
+CACHE_VERSION = 1
+
+def data_hash(paths=DATA_PATHS, categories=CATEGORY_SYSTEMS):
+    """Hash of the CSVs' bytes and of how the datasets are built from them."""
+    digest = hashlib.sha256(f'{CACHE_VERSION}:{json.dumps(categories, sort_keys=True)}'.encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+def cache_path(paths=DATA_PATHS, cache_dir=CACHE_DIR, categories=CATEGORY_SYSTEMS):
+    return os.path.join(cache_dir, f'{data_hash(paths, categories)}.npz')
+
+def prepare_datasets(paths=DATA_PATHS, cache_dir=CACHE_DIR, categories=CATEGORY_SYSTEMS):
+    """Builds the {category: (x, y)} training pairs from the CSVs and caches them; returns the cache file."""
+    path = cache_path(paths, cache_dir, categories)
+    with span('prepare datasets'):
+        datasets = RatingGraph.from_csv(paths).datasets(categories)
+    arrays = {}
+    for category, (x, y) in datasets.items():
+        arrays[f'{category}_x'] = np.asarray(x, dtype=np.float64)
+        arrays[f'{category}_y'] = np.asarray(y, dtype=np.float64)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Written under a temporary name first, so a reader never sees a half-written cache
+    temporary = f'{path}.tmp.npz'
+    np.savez(temporary, **arrays)
+    os.replace(temporary, path)
+    return path
+
+def load_datasets(paths=DATA_PATHS, cache_dir=CACHE_DIR, categories=CATEGORY_SYSTEMS):
+    """{category: (x, y)} float64 training pairs, prepared from the CSVs only when they changed."""
+    path = cache_path(paths, cache_dir, categories)
+    if not os.path.exists(path):
+        path = prepare_datasets(paths, cache_dir, categories)
+    with np.load(path) as arrays:
+        return {category: (arrays[f'{category}_x'], arrays[f'{category}_y']) for category in categories}
+
+def main():
+    parser = argparse.ArgumentParser(description='Prepares the per-category training pairs once for fitting, plotting and tests.')
+    parser.add_argument('--data', nargs='+', default=DATA_PATHS, help='Comparison table CSVs')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='Where the prepared datasets are cached')
+    parser.add_argument('--force', action='store_true', help='Prepare the datasets even if they are cached')
+    args = parser.parse_args()
+
+    path = cache_path(args.data, args.cache_dir)
+    if args.force or not os.path.exists(path):
+        prepare_datasets(args.data, args.cache_dir)
+        print(f"Prepared the datasets into {path}")
+    else:
+        print(f"{path} is already up to date.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+import argparse
+from collections import deque
+
+import numpy as np
+
+from convert_ratings import LUT_MAX_RATING
+from instrumentation import span
+
+DATA_PATHS = ['lichess_to_chess_com_data.csv', 'chess_com_to_chess_com_data.csv']
+
+# Category -> (Lichess rating system, chess.com rating system its model predicts).
+# chess.com has no classical pool, so Lichess classical is compared with chess.com blitz.
+CATEGORY_SYSTEMS = {
+    'BLITZ': ('lichess_blitz', 'chess_com_blitz'),
+    'BULLET': ('lichess_bullet', 'chess_com_bullet'),
+    'RAPID': ('lichess_rapid', 'chess_com_rapid'),
+    'CLASSICAL': ('lichess_classical', 'chess_com_blitz'),
+}
+
+# Every transform is tabulated at each integer rating from 0 to LUT_MAX_RATING.
+GRID = np.arange(LUT_MAX_RATING + 1, dtype=np.float64)
+
+class RatingGraph:
+    """Conversions between every rating system of the comparison tables.
+
+    Each column of a table is a rating system (lichess_blitz, chess_com_rapid, fide, ...) and
+    every two columns of the same table are joined by an edge that interpolates linearly
+    between the rows rating both. A conversion follows the shortest path between two systems,
+    e.g. lichess_bullet -> chess_com_blitz -> fide. The path is composed once into a single
+    table over GRID, so converting between any two systems is one table lookup.
+    """
+
+    def __init__(self, tables):
+        """tables: DataFrames (or mappings of column -> array) whose columns are rating systems."""
+        self._edges = {}
+        self._neighbours = {}
+        self._transforms = {}
+        for table in tables:
+            columns = {name: np.asarray(table[name], dtype=np.float64) for name in table}
+            for a in columns:
+                self._neighbours.setdefault(a, [])
+                for b in columns:
+                    if a == b or (a, b) in self._edges:
+                        continue
+                    rated = ~np.isnan(columns[a]) & ~np.isnan(columns[b])
+                    if rated.sum() < 2:
+                        continue
+                    self._edges[a, b] = (columns[a][rated], columns[b][rated])
+                    self._neighbours[a].append(b)
+
+    @classmethod
+    def from_csv(cls, paths=DATA_PATHS):
+        with span('import pandas', 'import'):
+            import pandas as pd
+
+        return cls([pd.read_csv(path) for path in paths])
+
+    @property
+    def systems(self):
+        return list(self._neighbours)
+
+    def path(self, source, target):
+        """The shortest chain of systems from source to target, both included."""
+        for system in (source, target):
+            if system not in self._neighbours:
+                raise KeyError(f"Unknown rating system: {system}")
+        previous = {source: None}
+        queue = deque([source])
+        while queue:
+            system = queue.popleft()
+            if system == target:
+                path = []
+                while system is not None:
+                    path.append(system)
+                    system = previous[system]
+                return path[::-1]
+            for neighbour in self._neighbours[system]:
+                if neighbour not in previous:
+                    previous[neighbour] = system
+                    queue.append(neighbour)
+        raise ValueError(f"No conversion from {source} to {target}")
+
+    def _interpolate(self, source, target, ratings):
+        x, y = self._edges[source, target]
+        order = np.argsort(x, kind='stable')
+        return np.interp(ratings, x[order], y[order])
+
+    def transform(self, source, target):
+        """The source -> target conversion at every GRID rating, composing the path's edges on first use."""
+        key = (source, target)
+        if key not in self._transforms:
+            path = self.path(source, target)
+            table = GRID.copy()
+            for a, b in zip(path, path[1:]):
+                table = self._interpolate(a, b, table)
+            table.flags.writeable = False
+            self._transforms[key] = table
+        return self._transforms[key]
+
+    def precompose(self):
+        """Composes the transform between every pair of connected systems up front."""
+        for source in self._neighbours:
+            for target in self._neighbours:
+                try:
+                    self.transform(source, target)
+                except ValueError:
+                    pass
+        return self
+
+    def convert(self, ratings, source, target):
+        """Converts ratings from one system to another with a single lookup into the composed table.
+
+        Ratings between grid points are interpolated; ratings outside 0 to LUT_MAX_RATING are
+        clamped, as are ratings outside the data (like np.interp). Missing ratings stay NaN.
+        """
+        table = self.transform(source, target)
+        x = np.clip(np.asarray(ratings, dtype=np.float64), 0, LUT_MAX_RATING)
+        missing = np.isnan(x)
+        x[missing] = 0
+        i = np.minimum(x.astype(np.intp), LUT_MAX_RATING - 1)
+        result = table[i] + (table[i + 1] - table[i]) * (x - i)
+        result[missing] = np.nan
+        return result
+
+    def pairs(self, source, target):
+        """Paired (x, y) ratings for fitting a source -> target model.
+
+        x comes from the rows that rate source. When target is in another table, each row's
+        rating in the next system on the path (e.g. chess_com_blitz) is converted to target.
+        """
+        via = self.path(source, target)[1]
+        x, ratings = self._edges[source, via]
+        if via == target:
+            return x, ratings
+        return x, self.convert(ratings, via, target)
+
+    def datasets(self, categories=CATEGORY_SYSTEMS):
+        """{category: (x, y)} training pairs for every category's model."""
+        return {category: self.pairs(source, target) for category, (source, target) in categories.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description='Converts ratings between any two rating systems of the comparison tables.')
+    parser.add_argument('ratings', nargs='+', type=float, help='Ratings to convert')
+    parser.add_argument('--from', dest='source', required=True, help='Source system, e.g. lichess_bullet')
+    parser.add_argument('--to', dest='target', required=True, help='Target system, e.g. fide')
+    parser.add_argument('--data', nargs='+', default=DATA_PATHS, help='Comparison table CSVs')
+    args = parser.parse_args()
+
+    graph = RatingGraph.from_csv(args.data)
+    print(f"Path: {' -> '.join(graph.path(args.source, args.target))}")
+    for rating, converted in zip(args.ratings, graph.convert(args.ratings, args.source, args.target)):
+        print(f"{rating:g} -> {converted:.0f}")
+
+if __name__ == '__main__':
+    main()
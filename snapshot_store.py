@@ -0,0 +1,207 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+
+from calculate_regressions import FAMILIES, fit_candidates
+from instrumentation import span
+from rating_graph import CATEGORY_SYSTEMS, DATA_PATHS, RatingGraph
+
+# Every ingested version of the comparison tables, in one Arrow IPC file
+STORE_PATH = 'snapshots.arrow'
+# Schema metadata key holding the list of snapshots
+METADATA_KEY = b'lichess2chess.snapshots'
+COEFFICIENT_COLUMNS = ['c0', 'c1', 'c2']
+
+def table_name(path):
+    """The name a CSV's table is stored under, e.g. lichess_to_chess_com_data."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+def table_hash(df):
+    """Hash of a table's column names and values (integer and float columns hash alike)."""
+    digest = hashlib.sha256(json.dumps(list(df.columns)).encode())
+    digest.update(np.ascontiguousarray(df.to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()
+
+def _read(path):
+    """The whole store as an Arrow table, memory-mapped so columns are not copied, or None."""
+    with span('import pyarrow', 'import'):
+        import pyarrow as pa
+
+    if not os.path.exists(path):
+        return None
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all()
+
+def list_snapshots(path=STORE_PATH):
+    """[{id, taken_at, source, tables: {name: {rows, hash}}}] for every snapshot, oldest first."""
+    store = _read(path)
+    if store is None:
+        return []
+    return json.loads(store.schema.metadata[METADATA_KEY])
+
+def append_snapshot(tables, path=STORE_PATH, source=None, taken_at=None):
+    """Appends {name: DataFrame} tables as a new snapshot and returns its metadata.
+
+    Returns None without writing when every table is identical to the latest snapshot's.
+    Columns are rating systems; a column new to the store is null in older snapshots.
+    """
+    with span('import pyarrow', 'import'):
+        import pyarrow as pa
+
+    store = _read(path)
+    snapshots = [] if store is None else json.loads(store.schema.metadata[METADATA_KEY])
+    hashes = {name: table_hash(df) for name, df in tables.items()}
+    if snapshots and {name: t['hash'] for name, t in snapshots[-1]['tables'].items()} == hashes:
+        return None
+
+    snapshot = {
+        'id': snapshots[-1]['id'] + 1 if snapshots else 1,
+        'taken_at': (taken_at or datetime.now(timezone.utc)).isoformat(timespec='seconds'),
+        'source': source,
+        'tables': {name: {'rows': len(df), 'hash': hashes[name]} for name, df in tables.items()},
+    }
+    parts = [] if store is None else [store.replace_schema_metadata(None)]
+    for name, df in tables.items():
+        columns = {'snapshot': pa.array(np.full(len(df), snapshot['id'], dtype=np.int32)),
+                   'table': pa.array([name] * len(df), type=pa.string())}
+        for column in df.columns:
+            columns[column] = pa.array(df[column].to_numpy(dtype=np.float64), from_pandas=True)
+        parts.append(pa.table(columns))
+    combined = pa.concat_tables(parts, promote_options='default')
+    combined = combined.replace_schema_metadata({METADATA_KEY: json.dumps(snapshots + [snapshot])})
+
+    # Written under a temporary name first, so a reader never sees a half-written store
+    temporary = f'{path}.tmp'
+    with pa.OSFile(temporary, 'wb') as sink, pa.ipc.new_file(sink, combined.schema) as writer:
+        writer.write_table(combined)
+    os.replace(temporary, path)
+    return snapshot
+
+def _as_datetime(value):
+    if value is None or isinstance(value, datetime):
+        moment = value
+    else:
+        moment = datetime.fromisoformat(value)
+    # Snapshots are taken in UTC, so times without a zone are read as UTC
+    if moment is not None and moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+def select_snapshots(snapshots, ids=None, since=None, until=None):
+    """The snapshots with one of the ids, taken between since and until (both inclusive)."""
+    since, until = _as_datetime(since), _as_datetime(until)
+    return [s for s in snapshots
+            if (ids is None or s['id'] in ids)
+            and (since is None or _as_datetime(s['taken_at']) >= since)
+            and (until is None or _as_datetime(s['taken_at']) <= until)]
+
+def read_snapshots(path=STORE_PATH, ids=None, since=None, until=None):
+    """The rows of the selected snapshots as one Arrow table, from a single memory-mapped read.
+
+    ids selects snapshots by id; since and until (datetimes or ISO strings) select them by
+    when they were taken. With no selection every snapshot is returned.
+    """
+    with span('import pyarrow', 'import'):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+    store = _read(path)
+    if store is None:
+        raise FileNotFoundError(f"No snapshot store at {path}")
+    snapshots = json.loads(store.schema.metadata[METADATA_KEY])
+    if ids is None and since is None and until is None:
+        return store
+    selected = [s['id'] for s in select_snapshots(snapshots, ids, since, until)]
+    return store.filter(pc.is_in(store['snapshot'], value_set=pa.array(selected, type=pa.int32())))
+
+def snapshot_tables(rows, snapshot):
+    """{name: DataFrame} of one snapshot's tables from read_snapshots rows, with the columns each table had."""
+    tables = {}
+    for name in snapshot['tables']:
+        mask = (rows['snapshot'] == snapshot['id']) & (rows['table'] == name)
+        df = rows[mask].drop(columns=['snapshot', 'table']).dropna(axis=1, how='all')
+        tables[name] = df.reset_index(drop=True)
+    return tables
+
+def refit_snapshots(path=STORE_PATH, categories=CATEGORY_SYSTEMS, ids=None, since=None, until=None):
+    """Refits every category's model on each selected snapshot in one batched solve.
+
+    Returns the coefficient time series as a DataFrame with one row per snapshot and category:
+    the family chosen by AIC like find_best_regression, and its [constant, u, u^2] coefficients
+    c0, c1, c2 (u = x for linear and quadratic, u = log(x) for log), with the fit's MSE and AIC.
+    """
+    import pandas as pd
+
+    with span('read snapshots'):
+        store = read_snapshots(path, ids, since, until)
+    # The rows keep the store's metadata, so the snapshots are selected from it again without a second read
+    snapshots = select_snapshots(json.loads(store.schema.metadata[METADATA_KEY]), ids, since, until)
+    rows = store.to_pandas()
+
+    keys, xs, ys = [], [], []
+    with span('prepare snapshot datasets', snapshots=len(snapshots)):
+        for snapshot in snapshots:
+            graph = RatingGraph(snapshot_tables(rows, snapshot).values())
+            for category, (x, y) in graph.datasets(categories).items():
+                keys.append((snapshot, category))
+                xs.append(x)
+                ys.append(y)
+    if not keys:
+        return pd.DataFrame(columns=['snapshot', 'taken_at', 'category', 'type', *COEFFICIENT_COLUMNS, 'mse', 'aic'])
+
+    with span('refit snapshots', datasets=len(keys)):
+        coefs, mse, aic = fit_candidates(xs, ys)
+    best = np.argmin(aic, axis=1)
+    index = np.arange(len(keys))
+    series = pd.DataFrame({
+        'snapshot': [snapshot['id'] for snapshot, _ in keys],
+        'taken_at': pd.to_datetime([snapshot['taken_at'] for snapshot, _ in keys]),
+        'category': [category for _, category in keys],
+        'type': [FAMILIES[b] for b in best],
+    })
+    for i, column in enumerate(COEFFICIENT_COLUMNS):
+        series[column] = coefs[index, best, i]
+    series['mse'] = mse[index, best]
+    series['aic'] = aic[index, best]
+    return series
+
+def append_csvs(paths=DATA_PATHS, path=STORE_PATH, source=None):
+    """Appends the comparison CSVs as a snapshot; see append_snapshot."""
+    with span('import pandas', 'import'):
+        import pandas as pd
+
+    return append_snapshot({table_name(p): pd.read_csv(p) for p in paths}, path, source)
+
+def main():
+    parser = argparse.ArgumentParser(description='Keeps every version of the comparison tables and refits the models across them.')
+    parser.add_argument('--store', default=STORE_PATH, help='Snapshot store (Arrow IPC file)')
+    parser.add_argument('--append', nargs='*', metavar='CSV',
+                        help='Append the comparison CSVs (default: the ones the models are fitted on) as a snapshot')
+    parser.add_argument('--refit', action='store_true', help='Print the coefficient time series of every category as CSV')
+    parser.add_argument('--since', help='Only snapshots taken at or after this ISO date/time')
+    parser.add_argument('--until', help='Only snapshots taken at or before this ISO date/time')
+    parser.add_argument('-o', '--output', default='-', help="Where --refit writes the CSV, or '-' for stdout (default)")
+    args = parser.parse_args()
+
+    if args.append is not None:
+        snapshot = append_csvs(args.append or DATA_PATHS, args.store)
+        if snapshot is None:
+            print(f"{args.store} is already up to date.", file=sys.stderr)
+        else:
+            print(f"Added snapshot {snapshot['id']} to {args.store}", file=sys.stderr)
+
+    if args.refit:
+        series = refit_snapshots(args.store, since=args.since, until=args.until)
+        series.to_csv(sys.stdout if args.output == '-' else args.output, index=False)
+    elif args.append is None:
+        for snapshot in select_snapshots(list_snapshots(args.store), since=args.since, until=args.until):
+            tables = ', '.join(f"{name} ({t['rows']} rows)" for name, t in snapshot['tables'].items())
+            print(f"{snapshot['id']}  {snapshot['taken_at']}  {tables}")
+
+if __name__ == '__main__':
+    main()
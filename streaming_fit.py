@@ -0,0 +1,181 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calculate_regressions import FAMILIES, PARAM_COUNTS, batched_aic, regression_from_coefs, unstandardize
+from instrumentation import init_worker, span
+from rating_graph import CATEGORY_SYSTEMS
+
+CHUNK_ROWS = 1_000_000
+# Ratings are shifted and scaled by these fixed constants before the sums are accumulated. A
+# single pass cannot standardize by the data's own mean, but this keeps the quadratic normal
+# equations as well conditioned for typical ratings, and lets statistics from any chunk merge.
+RATING_CENTER = 1500.0
+RATING_SCALE = 500.0
+LOG_CENTER = np.log(RATING_CENTER)
+
+class SufficientStatistics:
+    """Running XᵀX, Xᵀy and yᵀy of the linear, quadratic and log bases over paired (x, y) ratings.
+
+    Each basis is [1, t, t^2] (unused columns zero) with t = (x - RATING_CENTER) / RATING_SCALE,
+    or t = log(x) - log(RATING_CENTER) for log, and y is shifted by RATING_CENTER. Memory is
+    constant however many ratings are added, and statistics built from separate chunks (or in
+    separate processes) add up to those of the whole dataset, so fitting from them gives the
+    same models as fit_regressions on all the data at once.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.gram = np.zeros((len(FAMILIES), 3, 3))
+        self.moments = np.zeros((len(FAMILIES), 3))
+        self.yy = 0.0
+        # Ratings of 0 or less have no log, which rules out the log family.
+        self.nonpositive = 0
+
+    def update(self, x, y):
+        """Adds paired ratings, skipping pairs with a missing rating."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        rated = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[rated], y[rated] - RATING_CENTER
+        positive = x > 0
+        t = (x - RATING_CENTER) / RATING_SCALE
+        t_log = np.log(np.where(positive, x, RATING_CENTER)) - LOG_CENTER
+        ones, zeros = np.ones_like(x), np.zeros_like(x)
+        for family, basis in enumerate((np.stack([ones, t, zeros], axis=1), np.stack([ones, t, t * t], axis=1),
+                                        np.stack([ones, t_log, zeros], axis=1))):
+            self.gram[family] += basis.T @ basis
+            self.moments[family] += basis.T @ y
+        self.yy += float(y @ y)
+        self.n += len(x)
+        self.nonpositive += int((~positive).sum())
+        return self
+
+    def __iadd__(self, other):
+        self.n += other.n
+        self.gram += other.gram
+        self.moments += other.moments
+        self.yy += other.yy
+        self.nonpositive += other.nonpositive
+        return self
+
+    def fit(self):
+        """Solves every family's normal equations.
+
+        Returns (coefs, mse, aic) like fit_candidates for one dataset: coefs has shape (family, 3)
+        holding [constant, u, u^2] with u = x for linear/quadratic and u = log(x) for log.
+        """
+        if self.n == 0:
+            raise ValueError('No paired ratings to fit')
+        gram = self.gram.copy()
+        # Pin the coefficients of unused columns to zero.
+        gram[[0, 2], 2, 2] = 1.0
+        try:
+            beta = np.linalg.solve(gram, self.moments[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            beta = (np.linalg.pinv(gram) @ self.moments[..., None])[..., 0]
+
+        # Residual sum of squares, expanded in the accumulated sums
+        rss = self.yy - 2 * np.einsum('fi,fi->f', beta, self.moments) + np.einsum('fi,fij,fj->f', beta, self.gram, beta)
+        mse = np.maximum(rss, 0.0) / self.n
+        aic = batched_aic(self.n, mse, PARAM_COUNTS)
+        if self.nonpositive:
+            aic[FAMILIES.index('log')] = np.inf
+
+        coefs = np.empty_like(beta)
+        coefs[:2] = unstandardize(beta[None, :2], np.array([RATING_CENTER]), np.array([RATING_SCALE]))[0]
+        coefs[2] = unstandardize(beta[None, 2:], np.array([LOG_CENTER]), np.array([1.0]))[0, 0]
+        coefs[:, 0] += RATING_CENTER
+        return coefs, mse, aic
+
+    def regression(self):
+        """The best family by AIC, as a regressions.json entry."""
+        coefs, _, aic = self.fit()
+        best = int(np.argmin(aic))
+        return regression_from_coefs(FAMILIES[best], coefs[best])
+
+def read_paired_chunks(path, columns, chunk_rows=CHUNK_ROWS, row_groups=None):
+    """Yields {column: float64 array} chunks of the given columns present in a CSV or Parquet file.
+
+    Missing values are NaN. row_groups limits a Parquet file to some of its row groups.
+    """
+    if path.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        present = [c for c in columns if c in parquet.schema_arrow.names]
+        for batch in parquet.iter_batches(batch_size=chunk_rows, row_groups=row_groups, columns=present):
+            yield {name: batch.column(name).cast(pa.float64()).to_numpy(zero_copy_only=False) for name in present}
+    else:
+        import pandas as pd
+
+        for chunk in pd.read_csv(path, usecols=lambda c: c in columns, chunksize=chunk_rows):
+            yield {name: pd.to_numeric(chunk[name], errors='coerce').to_numpy(dtype=np.float64) for name in chunk}
+
+def accumulate(chunks, categories=CATEGORY_SYSTEMS):
+    """{category: SufficientStatistics} over chunks holding the categories' (Lichess, Chess.com) columns."""
+    stats = {category: SufficientStatistics() for category in categories}
+    for chunk in chunks:
+        for category, (source, target) in categories.items():
+            if source in chunk and target in chunk:
+                stats[category].update(chunk[source], chunk[target])
+    return stats
+
+def _accumulate_part(path, row_groups, categories, chunk_rows):
+    columns = {column for pair in categories.values() for column in pair}
+    return accumulate(read_paired_chunks(path, columns, chunk_rows, row_groups), categories)
+
+def _parts(paths):
+    """Splits Parquet files into one task per row group; CSV files are read whole."""
+    for path in paths:
+        if path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+
+            for row_group in range(pq.ParquetFile(path).num_row_groups):
+                yield path, [row_group]
+        else:
+            yield path, None
+
+def accumulate_files(paths, categories=CATEGORY_SYSTEMS, workers=None, chunk_rows=CHUNK_ROWS):
+    """Accumulates the statistics of CSV/Parquet files across a process pool and merges them."""
+    parts = list(_parts(paths))
+    stats = {category: SufficientStatistics() for category in categories}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        for part_stats in executor.map(_accumulate_part, *zip(*parts), [categories] * len(parts),
+                                       [chunk_rows] * len(parts)):
+            for category, part in part_stats.items():
+                stats[category] += part
+    return stats
+
+def fit_statistics(stats):
+    """{category: regression} for every category with paired ratings."""
+    return {category: s.regression() for category, s in stats.items() if s.n}
+
+def main():
+    parser = argparse.ArgumentParser(description='Fits the regression models in one pass over large paired-rating files.')
+    parser.add_argument('paths', nargs='+', help='CSV or Parquet files with lichess_<category> and chess_com_<category> columns')
+    parser.add_argument('-o', '--output', default='-', help="Where to write the models as JSON, or '-' for stdout (default)")
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per CPU)')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='Rows read per chunk')
+    args = parser.parse_args()
+
+    with span('accumulate statistics', files=len(args.paths)):
+        stats = accumulate_files(args.paths, workers=args.workers, chunk_rows=args.chunk_rows)
+    for category, s in stats.items():
+        print(f"{category}: {s.n} paired ratings", file=sys.stderr)
+    regressions = fit_statistics(stats)
+
+    if args.output == '-':
+        json.dump(regressions, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(regressions, f, indent=2)
+
+if __name__ == '__main__':
+    main()
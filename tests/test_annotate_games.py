@@ -0,0 +1,120 @@
+import unittest
+import io
+import json
+import os
+import sys
+import tempfile
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from annotate_games import (annotate_chunks, annotate_file, annotate_ndjson, annotate_pgn, classify_time_control,
+                            read_chunks)
+from convert_ratings import convert, load_regressions
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+TIME_CONTROLS = ['60+0', '180+0', '300+3', '600+0', '900+10', '1800+0', '-', '15+0']
+
+
+def pgn_game(i, time_control, white_elo=None, black_elo=None):
+    white_elo = white_elo or str(1000 + 7 * i % 1800)
+    black_elo = black_elo or str(1100 + 13 * i % 1700)
+    return (f'[Event "Rated game"]\n[Site "https://lichess.org/{i:08d}"]\n[White "a{i}"]\n[Black "b{i}"]\n'
+            f'[Result "1-0"]\n[WhiteElo "{white_elo}"]\n[BlackElo "{black_elo}"]\n[TimeControl "{time_control}"]\n'
+            f'[Termination "Normal"]\n\n1. e4 {{ [%clk 0:03:00] }} e5 2. Qh5 Nc6 3. Bc4 Nf6 4. Qxf7# 1-0\n\n')
+
+
+def pgn_dump(games):
+    return ''.join(pgn_game(i, TIME_CONTROLS[i % len(TIME_CONTROLS)]) for i in range(games)).encode()
+
+
+class TestAnnotateGames(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cls.regressions = load_regressions(os.path.join(cls.root_dir, 'regressions.json'))
+
+    def expected(self, category, rating):
+        return int(convert([rating], category, self.regressions)[0])
+
+    def test_classifies_time_controls_like_lichess(self):
+        cases = {'15+0': 'BULLET', '60+1': 'BULLET', '120+1': 'BULLET', '120+2': 'BLITZ', '180+0': 'BLITZ', '300+3': 'BLITZ',
+                 '300+5': 'RAPID', '480+0': 'RAPID', '900+10': 'RAPID', '1500+0': 'CLASSICAL', '-': 'CLASSICAL', '?': None, '': None}
+        for time_control, category in cases.items():
+            with self.subTest(time_control=time_control):
+                self.assertEqual(classify_time_control(time_control), category)
+
+    def test_adds_converted_tags_after_the_elo_tags(self):
+        annotated, games = annotate_pgn(pgn_game(0, '600+0', '1500', '1800').encode(), self.regressions)
+        self.assertEqual(games, 1)
+        lines = annotated.decode().splitlines()
+        white = lines.index('[WhiteElo "1500"]')
+        self.assertEqual(lines[white + 1], f'[WhiteChessComElo "{self.expected("RAPID", 1500)}"]')
+        self.assertEqual(lines[white + 2], '[BlackElo "1800"]')
+        self.assertEqual(lines[white + 3], f'[BlackChessComElo "{self.expected("RAPID", 1800)}"]')
+        self.assertIn('\n\n1. e4 { [%clk 0:03:00] }', annotated.decode())
+
+    def test_leaves_unrated_games_alone(self):
+        game = pgn_game(0, '?').encode() + pgn_game(1, '180+0', '?', '1500').encode()
+        annotated, games = annotate_pgn(game, self.regressions)
+        self.assertEqual(games, 2)
+        self.assertNotIn(b'WhiteChessComElo', annotated)
+        self.assertEqual(annotated.count(b'BlackChessComElo'), 1)
+        self.assertEqual(annotated.replace(b'[BlackChessComElo "%d"]\n' % self.expected('BLITZ', 1500), b''), game)
+
+    def test_chunks_end_at_game_boundaries(self):
+        dump = pgn_dump(50)
+        chunks = list(read_chunks(io.BytesIO(dump), 'pgn', chunk_size=700))
+        self.assertGreater(len(chunks), 10)
+        self.assertEqual(b''.join(chunks), dump)
+        for chunk in chunks:
+            self.assertTrue(chunk.startswith(b'[Event '))
+            self.assertTrue(chunk.endswith(b'1-0\n\n'))
+
+    def test_process_pool_keeps_the_order(self):
+        dump = pgn_dump(400)
+        single, games = annotate_pgn(dump, self.regressions)
+        self.assertEqual(games, 400)
+        results = list(annotate_chunks(read_chunks(io.BytesIO(dump), 'pgn', chunk_size=4096), 'pgn',
+                                       self.regressions, workers=2))
+        self.assertGreater(len(results), 4)
+        self.assertEqual(b''.join(annotated for annotated, _ in results), single)
+        self.assertEqual(sum(count for _, count in results), 400)
+
+    def test_annotates_ndjson_games(self):
+        games = [
+            {'id': 'a', 'speed': 'blitz', 'players': {'white': {'user': {'name': 'x'}, 'rating': 1500},
+                                                      'black': {'aiLevel': 3}}},
+            {'id': 'b', 'clock': {'initial': 60, 'increment': 0}, 'players': {'white': {'rating': 2000}, 'black': {'rating': 1200}}},
+            {'id': 'c', 'players': {'white': {'rating': 1500}}},
+        ]
+        data = ''.join(json.dumps(game) + '\n' for game in games).encode()
+        annotated, count = annotate_ndjson(data, self.regressions)
+        result = [json.loads(line) for line in annotated.splitlines()]
+        self.assertEqual(count, 3)
+        self.assertEqual(result[0]['players']['white']['chessComRating'], self.expected('BLITZ', 1500))
+        self.assertNotIn('chessComRating', result[0]['players']['black'])
+        self.assertEqual(result[1]['players']['black']['chessComRating'], self.expected('BULLET', 1200))
+        self.assertEqual(result[2], games[2])
+
+    @unittest.skipIf(zstandard is None, 'zstandard is not installed')
+    def test_annotates_compressed_dump(self):
+        dump = pgn_dump(200)
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'games.pgn.zst')
+            output_path = os.path.join(tmp, 'annotated.pgn.zst')
+            with open(input_path, 'wb') as f:
+                f.write(zstandard.ZstdCompressor().compress(dump))
+            games = annotate_file(input_path, output_path, regressions=self.regressions, workers=2, chunk_size=2048)
+            with open(output_path, 'rb') as f:
+                annotated = zstandard.ZstdDecompressor().stream_reader(f).read()
+        self.assertEqual(games, 200)
+        self.assertEqual(annotated, annotate_pgn(dump, self.regressions)[0])
+
+if __name__ == '__main__':
+    unittest.main()
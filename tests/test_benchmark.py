@@ -0,0 +1,67 @@
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import BENCHMARKS, autorange, compare, register_benchmark, run_benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_covers_every_path(self):
+        for prefix in ['fit.', 'convert.', 'annotate.', 'parse.', 'plot.', 'js.']:
+            self.assertTrue(any(name.startswith(prefix) for name in BENCHMARKS), prefix)
+
+    def test_run_benchmark(self):
+        calls = []
+
+        @register_benchmark('test.counter')
+        def setup():
+            return lambda: calls.append(1), 10
+        try:
+            result = run_benchmark('test.counter', repeats=3, min_time=0)
+        finally:
+            del BENCHMARKS['test.counter']
+        self.assertEqual(len(calls), 4)  # one warm-up run
+        self.assertEqual(result['loops'], 1)
+        self.assertEqual(result['items'], 10)
+        self.assertGreater(result['items_per_second'], 0)
+        self.assertLessEqual(result['min'], result['median'])
+
+    def test_autorange_loops_fast_benchmarks(self):
+        calls = []
+
+        def run():
+            calls.append(1)
+            return 0.004  # seconds, as reported by a run that times itself
+        # 1, 2, 5 and 10 runs take 4, 8, 20 and 40 ms; 20 runs reach 50 ms
+        self.assertEqual(autorange(run, min_time=0.05), 20)
+        self.assertEqual(len(calls), 1 + 2 + 5 + 10 + 20)
+        self.assertEqual(autorange(lambda: 1.0, min_time=0.05), 1)
+
+    def test_unavailable_benchmarks_are_skipped(self):
+        BENCHMARKS['test.unavailable'] = lambda: None
+        try:
+            self.assertIsNone(run_benchmark('test.unavailable'))
+        finally:
+            del BENCHMARKS['test.unavailable']
+
+    def test_compare_flags_slowdowns_beyond_tolerance(self):
+        baseline = {'a': {'min': 1.0}, 'b': {'min': 1.0}}
+        results = {'a': {'min': 1.4}, 'b': {'min': 1.6}, 'new': {'min': 9.0}}
+        # A benchmark without a baseline is reported rather than passing unchecked
+        self.assertEqual(compare(results, baseline, tolerance=0.5), [('b', 1.0, 1.6), ('new', None, 9.0)])
+
+    def test_compare_uses_per_benchmark_tolerance(self):
+        baseline = {'a': {'min': 1.0, 'tolerance': 1.0}, 'b': {'min': 1.0}}
+        results = {'a': {'min': 1.9}, 'b': {'min': 1.9}}
+        self.assertEqual(compare(results, baseline, tolerance=0.5), [('b', 1.0, 1.9)])
+
+    def test_conversion_benchmark_runs(self):
+        result = run_benchmark('convert.linear', repeats=1, min_time=0)
+        self.assertEqual(result['items'], 1_000_000)
+
+if __name__ == '__main__':
+    unittest.main()
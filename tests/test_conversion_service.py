@@ -0,0 +1,175 @@
+import unittest
+import asyncio
+import http.client
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convert_ratings import convert, load_regressions
+from conversion_service import ConversionService, serve
+
+
+class TestConversionService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cls.regressions_path = os.path.join(cls.root_dir, 'regressions.json')
+        cls.regressions = load_regressions(cls.regressions_path)
+        ready = threading.Event()
+
+        def on_ready(server, service):
+            cls.loop = asyncio.get_running_loop()
+            cls.server, cls.service = server, service
+            ready.set()
+
+        def run():
+            try:
+                asyncio.run(serve('127.0.0.1', 0, cls.regressions_path, ready=on_ready))
+            except asyncio.CancelledError:
+                pass  # serve_forever is cancelled when tearDownClass closes the server
+
+        cls.thread = threading.Thread(target=run, daemon=True)
+        cls.thread.start()
+        ready.wait(10)
+        cls.port = cls.server.sockets[0].getsockname()[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.call_soon_threadsafe(cls.server.close)
+        cls.thread.join(5)
+
+    def request(self, method, path, body=None, headers=None):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+        try:
+            headers = headers or {}
+            connection.request(method, path, body, headers, encode_chunked='Transfer-Encoding' in headers)
+            response = connection.getresponse()
+            return response.status, response.read()
+        finally:
+            connection.close()
+
+    def expected(self, category, rating):
+        return int(convert([rating], category, self.regressions)[0])
+
+    def test_get_single_rating(self):
+        status, body = self.request('GET', '/convert?category=blitz&rating=1500')
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {'category': 'BLITZ', 'rating': 1500, 'chess_com': self.expected('BLITZ', 1500)})
+
+    def test_post_json_batches(self):
+        records = [{'category': 'rapid', 'rating': 1500, 'id': 1}, {'category': 'bullet', 'rating': None}]
+        status, body = self.request('POST', '/convert', json.dumps(records))
+        self.assertEqual(status, 200)
+        result = json.loads(body)
+        self.assertEqual(result[0], {'category': 'RAPID', 'rating': 1500, 'id': 1, 'chess_com': self.expected('RAPID', 1500)})
+        self.assertIsNone(result[1]['chess_com'])
+
+        status, body = self.request('POST', '/convert', json.dumps({'category': 'classical', 'ratings': [1200, 2200]}))
+        self.assertEqual(json.loads(body)['ratings'], [self.expected('CLASSICAL', r) for r in (1200, 2200)])
+
+    def test_post_ndjson_stream(self):
+        def lines():
+            for rating in range(1000, 1010):
+                yield (json.dumps({'category': 'blitz', 'rating': rating}) + '\n').encode()
+        status, body = self.request('POST', '/convert', lines(),
+                                    {'Content-Type': 'application/x-ndjson', 'Transfer-Encoding': 'chunked'})
+        self.assertEqual(status, 200)
+        results = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([r['chess_com'] for r in results], [self.expected('BLITZ', r) for r in range(1000, 1010)])
+
+    def test_errors(self):
+        self.assertEqual(self.request('GET', '/convert?category=correspondence&rating=1500')[0], 400)
+        self.assertEqual(self.request('POST', '/convert', '{not json')[0], 400)
+        self.assertEqual(self.request('POST', '/convert', json.dumps({'category': 'blitz', 'ratings': ['high']}))[0], 400)
+        self.assertEqual(self.request('GET', '/missing')[0], 404)
+        status, body = self.request('GET', '/convert?category=blitz&rating=inf')
+        self.assertEqual((status, json.loads(body)), (400, {'error': 'Ratings must be finite'}))
+        self.assertEqual(self.request('POST', '/convert', '{"category": "blitz", "ratings": [-Infinity]}')[0], 400)
+
+    def raw_request(self, data, close_write=False):
+        with socket.create_connection(('127.0.0.1', self.port), timeout=10) as sock:
+            sock.sendall(data)
+            if close_write:
+                sock.shutdown(socket.SHUT_WR)
+            response = b''
+            while chunk := sock.recv(65536):
+                response += chunk
+        return response
+
+    def test_malformed_bodies_are_answered(self):
+        response = self.raw_request(b'POST /convert HTTP/1.1\r\nContent-Length: ten\r\n\r\n{}')
+        self.assertTrue(response.startswith(b'HTTP/1.1 400 '))
+        self.assertIn(b'Invalid Content-Length', response)
+        response = self.raw_request(b'POST /convert HTTP/1.1\r\nContent-Length: 100\r\n\r\n{"category"', close_write=True)
+        self.assertTrue(response.startswith(b'HTTP/1.1 400 '))
+        self.assertIn(b'Incomplete request body', response)
+
+    def test_unread_bodies_are_skipped_on_kept_alive_connections(self):
+        """A body the handler ignores (a GET's, or a 405's) is not read as the next request."""
+        follow_up = b'GET /convert?category=blitz&rating=1500 HTTP/1.1\r\nConnection: close\r\n\r\n'
+        for first in (b'PUT /convert HTTP/1.1\r\nContent-Length: 13\r\n\r\n{"rating": 1}',
+                      b'GET /convert?category=blitz&rating=1500 HTTP/1.1\r\nContent-Length: 13\r\n\r\n{"rating": 1}',
+                      b'DELETE /convert HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n4\r\nbody\r\n0\r\n\r\n'):
+            with self.subTest(request=first.split(b' ')[0]):
+                response = self.raw_request(first + follow_up)
+                statuses = [part[:3] for part in response.split(b'HTTP/1.1 ')[1:]]
+                self.assertEqual(statuses[-1], b'200')
+                self.assertEqual(len(statuses), 2)
+
+    def test_repeated_requests_hit_the_cache(self):
+        hits = self.service.cache.hits
+        first = self.request('GET', '/convert?category=bullet&rating=1777')
+        second = self.request('GET', '/convert?category=bullet&rating=1777')
+        self.assertEqual(first, second)
+        self.assertEqual(self.service.cache.hits, hits + 1)
+
+
+class TestConversionBatching(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'regressions.json')
+        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        shutil.copy(os.path.join(root_dir, 'regressions.json'), self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_concurrent_requests_share_one_evaluation(self):
+        service = ConversionService(self.path)
+
+        async def run():
+            return await asyncio.gather(*(service.convert(category, np.array([float(rating)]))
+                                          for rating in range(1000, 1100) for category in ('blitz', 'rapid')))
+
+        results = asyncio.run(run())
+        self.assertEqual(service.batcher.flushes, 1)
+        regressions = load_regressions(self.path)
+        self.assertEqual(int(results[0][0]), int(convert([1000], 'BLITZ', regressions)[0]))
+        self.assertEqual(int(results[1][0]), int(convert([1000], 'RAPID', regressions)[0]))
+
+    def test_reloads_changed_model_file(self):
+        service = ConversionService(self.path, reload_interval=0)
+        service.cache.put(('GET', '/convert?category=blitz&rating=1500'), b'stale')
+        with open(self.path, 'w') as f:
+            json.dump({category: {'type': 'linear', 'params': [1.0, 100.0]} for category in service.regressions}, f)
+        os.utime(self.path, ns=(service.mtime + 10 ** 9, service.mtime + 10 ** 9))
+
+        service.maybe_reload()
+        self.assertEqual(service.reloads, 1)
+        self.assertEqual(len(service.cache.entries), 0)
+        converted = asyncio.run(service.convert('blitz', np.array([1500.0])))
+        self.assertEqual(int(converted[0]), 1600)
+
+if __name__ == '__main__':
+    unittest.main()
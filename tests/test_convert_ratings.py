@@ -0,0 +1,239 @@
+import unittest
+import numpy as np
+import pandas as pd
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convert_ratings import (CATEGORIES, INTERVAL_PATH, INVERSE_PATH, LUT_MAX_RATING, MODELS_JS_PATH, build_inverse_table,
+                             build_lookup_table, convert, convert_file, js_round, load_lookup_table, load_regressions, lookup,
+                             non_monotone_ratings, reverse_lookup, write_lookup_table, write_models_module)
+
+
+def calculate_regression_value(regression, lichess_rating):
+    """Calculate regression value one rating at a time, the same way as the JavaScript extension."""
+    p = regression['params']
+    if regression['type'] == 'linear':
+        value = p[0] * lichess_rating + p[1]
+    elif regression['type'] == 'quadratic':
+        value = p[1] * lichess_rating + p[0] * (lichess_rating ** 2) + p[2]
+    else:
+        value = p[0] * np.log(lichess_rating) + p[1]
+    # Math.round rounds halves up
+    return max(0, int(np.floor(value + 0.5)))
+
+
+class TestConvertRatings(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cls.regressions = load_regressions(os.path.join(cls.root_dir, 'regressions.json'))
+
+    def test_matches_scalar_calculation(self):
+        """Vectorized conversion matches the per-rating calculation for every category."""
+        ratings = np.arange(600, 3200)
+        for category, regression in self.regressions.items():
+            with self.subTest(category=category):
+                converted = convert(ratings, category, self.regressions)
+                expected = [calculate_regression_value(regression, int(r)) for r in ratings]
+                self.assertEqual(converted.dtype, np.int64)
+                np.testing.assert_array_equal(converted, expected)
+
+    def test_js_rounding(self):
+        """Halves round towards +infinity like Math.round, not to even."""
+        values = np.array([0.5, 1.5, 2.5, -0.5, -1.5, 2.4999, -2.5001])
+        np.testing.assert_array_equal(js_round(values), [1, 2, 3, 0, -1, 2, -3])
+
+    def test_clamps_at_zero(self):
+        """Negative results are clamped to 0."""
+        converted = convert([0, 100, 1200], 'CLASSICAL', self.regressions)
+        self.assertEqual(converted[0], 0)
+        self.assertEqual(converted[1], 0)
+
+    def test_log_model(self):
+        """Log models clamp log(0) to 0 and match the scalar calculation."""
+        regression = {'type': 'log', 'params': [500.0, -2000.0]}
+        regressions = {'BLITZ': regression}
+        converted = convert([0, 1000, 1500], 'blitz', regressions)
+        self.assertEqual(list(converted), [0] + [calculate_regression_value(regression, r) for r in (1000, 1500)])
+
+    def test_missing_ratings_stay_missing(self):
+        converted = convert([1500, np.nan], 'BLITZ', self.regressions)
+        self.assertEqual(converted[0], calculate_regression_value(self.regressions['BLITZ'], 1500))
+        self.assertTrue(np.isnan(converted[1]))
+
+    def test_single_rating(self):
+        """A scalar rating converts to a scalar, like the per-rating path it replaces."""
+        converted = convert(1500, 'BLITZ', self.regressions)
+        self.assertEqual(np.ndim(converted), 0)
+        self.assertEqual(converted, calculate_regression_value(self.regressions['BLITZ'], 1500))
+        self.assertEqual(convert(np.float64(0), 'classical', self.regressions), 0)
+        self.assertTrue(np.isnan(convert(np.nan, 'BLITZ', self.regressions)))
+
+    def test_infinite_ratings_are_missing(self):
+        """Non-finite and overflowing ratings come out as NaN instead of wrapping to INT64_MIN."""
+        for category in CATEGORIES:
+            with self.subTest(category=category):
+                converted = convert([1500, np.inf, -np.inf, 1e300], category, self.regressions)
+                self.assertEqual(converted[0], calculate_regression_value(self.regressions[category], 1500))
+                self.assertTrue(np.isnan(converted[1:3]).all())
+                # Too large for an int64 (missing), or clamped at 0 by a model that turns down
+                self.assertTrue(np.isnan(converted[3]) or converted[3] == 0)
+
+    def test_unknown_category(self):
+        with self.assertRaises(KeyError):
+            convert([1500], 'CORRESPONDENCE', self.regressions)
+
+    def test_convert_csv_file_in_chunks(self):
+        """The CLI path streams chunks and adds a converted column per Lichess column."""
+        df = pd.DataFrame({'lichess_blitz': [1500, 1800, None, 2100, 900], 'name': list('abcde')})
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'in.csv')
+            output_path = os.path.join(tmp, 'out.csv')
+            df.to_csv(input_path, index=False)
+            rows = convert_file(input_path, output_path, chunksize=2, regressions=self.regressions)
+            result = pd.read_csv(output_path)
+
+        self.assertEqual(rows, 5)
+        self.assertEqual(list(result.columns), ['lichess_blitz', 'name', 'lichess_blitz_chess_com'])
+        self.assertTrue(pd.isna(result['lichess_blitz_chess_com'][2]))
+        self.assertEqual(result['lichess_blitz_chess_com'][0], calculate_regression_value(self.regressions['BLITZ'], 1500))
+
+    def test_convert_ndjson_file(self):
+        df = pd.DataFrame({'player': ['a', 'b'], 'bullet': [1300, 2200]})
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'in.ndjson')
+            output_path = os.path.join(tmp, 'out.ndjson')
+            df.to_json(input_path, orient='records', lines=True)
+            convert_file(input_path, output_path, columns={'bullet': 'BULLET'}, regressions=self.regressions)
+            result = pd.read_json(output_path, lines=True)
+
+        expected = [calculate_regression_value(self.regressions['BULLET'], r) for r in (1300, 2200)]
+        self.assertEqual(list(result['bullet_chess_com']), expected)
+
+    def test_lookup_table_matches_convert(self):
+        """Every entry of the compiled table equals the evaluated model."""
+        table = build_lookup_table(self.regressions)
+        self.assertEqual(table.shape, (len(CATEGORIES), LUT_MAX_RATING + 1))
+        self.assertEqual(table.dtype, np.dtype('<i2'))
+        ratings = np.arange(LUT_MAX_RATING + 1)
+        for row, category in enumerate(CATEGORIES):
+            np.testing.assert_array_equal(table[row], convert(ratings, category, self.regressions))
+
+    def test_lookup_table_round_trip(self):
+        """The written table memory-maps back and converts with a single index."""
+        table = build_lookup_table(self.regressions)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'lut.bin')
+            write_lookup_table(table, path)
+            self.assertEqual(os.path.getsize(path), table.size * 2)
+            loaded = load_lookup_table(path)
+            ratings = [0, 1500, 2100, LUT_MAX_RATING]
+            np.testing.assert_array_equal(lookup(ratings, 'rapid', loaded), convert(ratings, 'RAPID', self.regressions))
+            del loaded
+
+    def test_lookup_clamps_out_of_range_ratings(self):
+        """Ratings below 0 or above LUT_MAX_RATING use the table's ends instead of wrapping or raising."""
+        table = build_lookup_table(self.regressions)
+        row = CATEGORIES.index('BLITZ')
+        np.testing.assert_array_equal(lookup([-1, -4001, 0, LUT_MAX_RATING, LUT_MAX_RATING + 1, 10 ** 6], 'blitz', table),
+                                      table[row][[0, 0, 0, LUT_MAX_RATING, LUT_MAX_RATING, LUT_MAX_RATING]])
+
+    def test_committed_lookup_table_is_current(self):
+        """The shipped regressions_lut.bin was compiled from the shipped regressions.json."""
+        path = os.path.join(self.root_dir, 'regressions_lut.bin')
+        np.testing.assert_array_equal(load_lookup_table(path), build_lookup_table(self.regressions))
+
+    def test_inverse_table_round_trips(self):
+        """Converting the reverse lookup forward lands within one rounding step of the Chess.com rating."""
+        table = build_lookup_table(self.regressions)
+        inverse = build_inverse_table(self.regressions)
+        ratings = np.arange(LUT_MAX_RATING + 1)
+        for row, category in enumerate(CATEGORIES):
+            with self.subTest(category=category):
+                self.assertEqual(len(non_monotone_ratings(self.regressions[category])), 0)
+                self.assertTrue(np.all(np.diff(inverse[row]) >= 0))
+                reached = (ratings >= table[row][1]) & (ratings <= table[row].max())
+                # One Lichess point moves the estimate by the model's slope, so round trips are off by at most half of it.
+                tolerance = np.ceil(np.diff(table[row].astype(np.int64)).max() / 2)
+                round_trip = table[row][reverse_lookup(ratings[reached], category, inverse)]
+                self.assertLessEqual(np.abs(round_trip - ratings[reached]).max(), tolerance)
+
+    def test_inverse_clamps_and_rounds(self):
+        inverse = build_inverse_table(self.regressions)
+        row = CATEGORIES.index('BLITZ')
+        np.testing.assert_array_equal(reverse_lookup([-50, 1499.5, 9000], 'blitz', inverse),
+                                      inverse[row][[0, 1500, LUT_MAX_RATING]])
+
+    def test_inverse_treats_non_finite_ratings_as_missing(self):
+        inverse = build_inverse_table(self.regressions)
+        row = CATEGORIES.index('BLITZ')
+        result = reverse_lookup([1500, np.nan, np.inf, -np.inf], 'blitz', inverse)
+        self.assertEqual(result[0], inverse[row][1500])
+        self.assertTrue(np.isnan(result[1:]).all())
+
+    def test_non_monotone_model(self):
+        """A model that turns down is detected and inverted through the lowest rating reaching each estimate."""
+        regressions = {category: {'type': 'quadratic', 'params': [-0.001, 4.0, 0.0]} for category in CATEGORIES}
+        decreasing = non_monotone_ratings(regressions['BLITZ'])
+        self.assertEqual(decreasing[0], 2001)
+        self.assertEqual(decreasing[-1], LUT_MAX_RATING)
+        inverse = build_inverse_table(regressions)[0]
+        self.assertTrue(np.all(np.diff(inverse) >= 0))
+        self.assertEqual(inverse[3000], 1000)
+        self.assertEqual(inverse[LUT_MAX_RATING], 2000)
+
+    def test_committed_inverse_table_is_current(self):
+        path = os.path.join(self.root_dir, INVERSE_PATH)
+        np.testing.assert_array_equal(load_lookup_table(path), build_inverse_table(self.regressions))
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_compiled_models_match_convert(self):
+        """The generated per-category JavaScript functions return exactly what convert does, for every model type."""
+        regressions = {
+            'BLITZ': {'type': 'polynomial', 'params': [1e-08, -5e-05, 1.2, -400.0]},
+            'BULLET': {'type': 'log', 'params': [900.0, -5600.0]},
+            'RAPID': {'type': 'piecewise_linear', 'params': [800.0, 1500.0, 2200.0, 300.0, 1150.0, 2000.5]},
+            'CLASSICAL': {'type': 'pchip', 'params': [800.0, 1300.0, 1900.0, 2600.0, 200.0, 820.0, 1500.0, 2350.0]},
+        }
+        intervals = np.arange(len(CATEGORIES) * (LUT_MAX_RATING + 1), dtype='<i2').reshape(len(CATEGORIES), -1) % 97
+        script = (
+            "const fs = require('fs');\n"
+            "const source = [process.argv[2], process.argv[1]].map((path) => fs.readFileSync(path, 'utf8')).join('\\n');\n"
+            "eval(source + '\\n;globalThis.models = COMPILED_MODELS;');\n"
+            "const ratings = [...Array(%d).keys()];\n"
+            "console.log(JSON.stringify({\n"
+            "  converted: Object.fromEntries(Object.entries(models.convert).map(([c, f]) => [c, ratings.map(f)])),\n"
+            "  intervals: Array.from(models.intervalTable),\n"
+            "}));\n" % (LUT_MAX_RATING + 1)
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'models.js')
+            write_models_module(regressions, intervals, path)
+            reader = os.path.join(self.root_dir, 'model_artifact.js')
+            output = subprocess.run(['node', '-e', script, path, reader], capture_output=True, text=True, check=True).stdout
+        result = json.loads(output)
+
+        ratings = np.arange(LUT_MAX_RATING + 1)
+        for category in CATEGORIES:
+            with self.subTest(category=category):
+                np.testing.assert_array_equal(result['converted'][category], convert(ratings, category, regressions))
+        np.testing.assert_array_equal(result['intervals'], intervals.ravel())
+
+    def test_committed_models_module_is_current(self):
+        """The shipped lichess2chess_models.js was generated from the shipped models."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'models.js')
+            write_models_module(self.regressions, load_lookup_table(os.path.join(self.root_dir, INTERVAL_PATH)), path)
+            with open(path) as generated, open(os.path.join(self.root_dir, MODELS_JS_PATH)) as committed:
+                self.assertEqual(generated.read(), committed.read())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,23 +1,83 @@
 import pytest
 from playwright.sync_api import sync_playwright
+import functools
+import json
+import math
 import os
 import re
+import statistics
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
 
 # Define the path to your unpacked extension
 EXTENSION_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'lichess')
+LATENCY_PATH = os.path.join(EXTENSION_PATH, 'extension_latency.json')
+# Page loads timed per page type
+LATENCY_RUNS = int(os.environ.get('LICHESS2CHESS_LATENCY_RUNS', '20'))
+
+# Page type -> (lichess.org path, saved page, rating nodes the extension handles, estimates it adds).
+# Profile ratings marked '?' and the non-standard perfs are handled without adding an estimate.
+PAGES = {
+    'profile': ('/@/DrNykterstein', 'profile.html', 7, 2),
+    'game': ('/q7ZvsdUF', 'game.html', 2, 2),
+    'standings': ('/tournament/JfLXYOsC', 'standings.html', 500, 500),
+}
+
+# Runs in the page's main world before any script. The content script marks every rating it
+# handles with data-l2c; the observer callback runs right after each annotation batch is written.
+LATENCY_PROBE = """
+window.__l2cHandled = 0;
+new MutationObserver((mutations) => {
+  window.__l2cHandled += mutations.length;
+  window.__l2cLastAnnotation = performance.now();
+}).observe(document, { subtree: true, attributes: true, attributeFilter: ['data-l2c'] });
+"""
+
+ESTIMATE_SELECTOR = '[style*="color: rgb(118, 150, 86)"]'
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def fixture_server():
+    handler = functools.partial(QuietHandler, directory=FIXTURES_DIR)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
 
 @pytest.fixture(scope="session")
-def browser_context():
+def browser_context(fixture_server):
+    fixtures = {path: fixture for path, fixture, _, _ in PAGES.values()}
+
+    def serve_fixture(route):
+        # The content script only matches lichess.org, so its pages are answered from the local server.
+        fixture = fixtures.get(urlsplit(route.request.url).path)
+        if fixture is None:
+            route.fulfill(status=404)
+        else:
+            route.fulfill(response=route.fetch(url=f'{fixture_server}/{fixture}'))
+
     with sync_playwright() as p:
-        # Launch Chromium with the extension loaded
+        # Launch Chromium with the extension loaded. The full chromium channel runs headless
+        # with extensions, which the default headless shell does not load.
         context = p.chromium.launch_persistent_context(
             "", # Use a temporary user data directory
-            headless=False, # Set to True for CI/CD, False for debugging
+            channel="chromium",
+            headless=True,
             args=[
                 f"--disable-extensions-except={EXTENSION_PATH}",
                 f"--load-extension={EXTENSION_PATH}",
             ]
         )
+        context.route(re.compile(r'^https?://lichess\.org/'), serve_fixture)
+        context.add_init_script(LATENCY_PROBE)
         yield context
         context.close()
 
@@ -27,18 +87,56 @@ def page(browser_context):
     yield page
     page.close()
 
+@pytest.fixture(scope="session")
+def latency_report(pytestconfig):
+    """Collects per page type latencies, then writes them to extension_latency.json and prints p50/p95."""
+    report = {}
+    yield report
+    if not report:
+        return
+    with open(LATENCY_PATH, 'w') as f:
+        json.dump(report, f, indent=2)
+    reporter = pytestconfig.pluginmanager.getplugin('terminalreporter')
+    reporter.write_line(f"\nAnnotation latency from DOMContentLoaded ({LATENCY_RUNS} loads per page)")
+    for page_type, result in report.items():
+        reporter.write_line(f"{page_type:<10} {result['ratings']:>5} ratings  "
+                            f"p50 {result['p50_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms")
+
+def load_and_wait(page, page_type):
+    """Opens a saved page and returns the ms from DOMContentLoaded until its last rating was annotated."""
+    path, _, handled, _ = PAGES[page_type]
+    page.goto(f'https://lichess.org{path}')
+    page.wait_for_function('handled => window.__l2cHandled >= handled', arg=handled, timeout=10000)
+    return page.evaluate("""() => window.__l2cLastAnnotation
+        - performance.getEntriesByType('navigation')[0].domContentLoadedEventStart""")
+
 def test_extension_loads_and_displays_ratings_on_profile_page(page):
-    # Navigate to a Lichess profile page
-    page.goto("https://lichess.org/@/DrNykterstein")
+    load_and_wait(page, 'profile')
 
-    # Wait for the extension to process and display ratings
     # Look for a rating element that contains the Chess.com equivalent in green
     # This assumes the extension adds a span with color #769656 and text in parentheses
-    chess_com_rating_span = page.locator('span[style*="color: rgb(118, 150, 86)"]:has-text("(")').first
-    
+    chess_com_rating_span = page.locator(f'span{ESTIMATE_SELECTOR}:has-text("(")').first
+
     # Assert that the element is visible, meaning the rating was added
     assert chess_com_rating_span.is_visible(), "Chess.com equivalent rating not found on profile page."
 
     # Optional: Further check the content of the rating (e.g., it's a number)
     rating_text = chess_com_rating_span.text_content()
-    assert re.search(r'\(\d+\)', rating_text), f"Rating text format incorrect: {rating_text}"
+    assert re.search(r'\(\d+( ±\d+)?\)', rating_text), f"Rating text format incorrect: {rating_text}"
+
+@pytest.mark.parametrize('page_type', list(PAGES))
+def test_annotation_latency(page, page_type, latency_report):
+    """Every rating on the saved page is annotated exactly once; reports p50/p95 over repeated loads."""
+    estimates = PAGES[page_type][3]
+    latencies = []
+    for _ in range(LATENCY_RUNS):
+        latencies.append(load_and_wait(page, page_type))
+        assert page.locator(ESTIMATE_SELECTOR).count() == estimates
+
+    latency_report[page_type] = {
+        'ratings': estimates,
+        'runs': len(latencies),
+        'p50_ms': round(statistics.median(latencies), 2),
+        # Nearest-rank 95th percentile
+        'p95_ms': round(sorted(latencies)[math.ceil(0.95 * len(latencies)) - 1], 2),
+    }
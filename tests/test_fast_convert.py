@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import convert_ratings
+import fast_convert
+from fast_convert import convert_rating
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Imported only by the functions that need them
+HEAVY_MODULES = ['pandas', 'matplotlib', 'sklearn', 'requests', 'lxml', 'pyarrow', 'zstandard']
+
+
+def import_in_empty_directory(module):
+    """Imports a module in a fresh interpreter from an empty directory.
+
+    Returns the heavy modules and NumPy it loaded, and the files it created.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        script = (f"import sys; import {module}; "
+                  f"print(' '.join(m for m in {HEAVY_MODULES + ['numpy']!r} if m in sys.modules))")
+        env = {**os.environ, 'PYTHONPATH': ROOT_DIR, 'PYTHONDONTWRITEBYTECODE': '1'}
+        env.pop('LICHESS2CHESS_PROFILE', None)
+        output = subprocess.run([sys.executable, '-c', script], cwd=tmp, env=env, capture_output=True, text=True,
+                                check=True).stdout
+        return output.split(), os.listdir(tmp)
+
+
+class TestFastConvert(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.regressions = convert_ratings.load_regressions(os.path.join(ROOT_DIR, 'regressions.json'))
+        cls.table_path = os.path.join(ROOT_DIR, 'regressions_lut.bin')
+
+    def convert(self, rating, category):
+        return convert_rating(rating, category, self.table_path, os.path.join(ROOT_DIR, 'regressions.json'))
+
+    def test_matches_convert(self):
+        ratings = [0, 1, 600, 1234, 1500, 2000, 2750, 3999, 4000, 4500, 1500.5]
+        for category in convert_ratings.CATEGORIES:
+            expected = convert_ratings.convert(ratings, category, self.regressions)
+            self.assertEqual([self.convert(r, category.lower()) for r in ratings], expected.tolist())
+
+    def test_missing_and_unknown(self):
+        self.assertIsNone(self.convert(None, 'BLITZ'))
+        self.assertIsNone(self.convert(float('nan'), 'BLITZ'))
+        with self.assertRaises(KeyError):
+            self.convert(1500, 'CORRESPONDENCE')
+
+    def test_constants_match_convert_ratings(self):
+        for name in ['REGRESSIONS_PATH', 'LUT_PATH', 'CATEGORIES', 'LUT_MAX_RATING']:
+            self.assertEqual(getattr(fast_convert, name), getattr(convert_ratings, name), name)
+
+
+class TestImportSafety(unittest.TestCase):
+
+    def test_fast_convert_imports_nothing_heavy(self):
+        loaded, created = import_in_empty_directory('fast_convert')
+        self.assertEqual(loaded, [])
+        self.assertEqual(created, [])
+
+    def test_modules_import_without_side_effects(self):
+        """Importing any module only defines it: no files are written and no heavy library is loaded."""
+        modules = sorted(os.path.basename(p)[:-3] for p in glob.glob(os.path.join(ROOT_DIR, '*.py')))
+        self.assertIn('calculate_regressions', modules)
+        for module in modules:
+            with self.subTest(module=module):
+                loaded, created = import_in_empty_directory(module)
+                self.assertEqual([m for m in loaded if m != 'numpy'], [])
+                self.assertEqual(created, [])
+
+if __name__ == '__main__':
+    unittest.main()
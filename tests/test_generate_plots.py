@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+import os
+import sys
+import tempfile
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generate_plots import render_plots
+
+
+class TestGeneratePlots(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        os.mkdir('images')
+        x = np.array([1000.0, 1500.0, 2000.0, 2500.0])
+        self.plots = [
+            (x, x * 1.1 - 300, {'type': 'linear', 'params': [1.1, -300.0]}, 'Blitz', 'blitz_regression.png'),
+            (x, x * 0.9, {'type': 'linear', 'params': [0.9, 0.0]}, 'Bullet', 'bullet_regression.png'),
+        ]
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_renders_then_skips_unchanged_plots(self):
+        rendered = render_plots(self.plots, 'all_regressions.png', workers=1)
+        self.assertEqual(rendered, ['blitz_regression.png', 'bullet_regression.png', 'all_regressions.png'])
+        for filename in rendered:
+            self.assertTrue(os.path.getsize(os.path.join('images', filename)) > 0)
+
+        self.assertEqual(render_plots(self.plots, 'all_regressions.png', workers=1), [])
+
+    def test_rerenders_changed_model_only(self):
+        render_plots(self.plots, workers=1)
+        x, y, _, title, filename = self.plots[1]
+        self.plots[1] = (x, y, {'type': 'linear', 'params': [0.95, 0.0]}, title, filename)
+        self.assertEqual(render_plots(self.plots, workers=1), ['bullet_regression.png'])
+        self.assertEqual(render_plots(self.plots, force=True, workers=1), ['blitz_regression.png', 'bullet_regression.png'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import instrumentation
+from instrumentation import PROFILE_ENV, load_events, merge_traces, span, summarize
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+from instrumentation import span, traced
+
+with span('import json', 'import'):
+    import json
+
+@traced('work')
+def work():
+    return sum(i * i for i in range(200000))
+
+with span('outer', rows=3):
+    work()
+    work()
+"""
+
+POOL_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+from concurrent.futures import ProcessPoolExecutor
+from instrumentation import init_worker, span
+
+def work(n):
+    import fractions
+    with span('task'):
+        return n * 2
+
+if __name__ == '__main__':
+    import colorsys
+    with ProcessPoolExecutor(max_workers=1, initializer=init_worker) as executor:
+        print(list(executor.map(work, range(3))))
+"""
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_disabled_spans_do_nothing(self):
+        if instrumentation.enabled():
+            self.skipTest(f'{PROFILE_ENV} is set')
+        with span('ignored'):
+            pass
+        self.assertEqual(instrumentation._events, [])
+
+    def test_records_spans_as_chrome_trace(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = os.path.join(tmp, 'profile')
+            script = os.path.join(tmp, 'refresh.py')
+            with open(script, 'w') as f:
+                f.write(SCRIPT.format(root=ROOT_DIR))
+            subprocess.run([sys.executable, script], check=True, env={**os.environ, PROFILE_ENV: directory})
+
+            self.assertEqual(len(os.listdir(directory)), 1)
+            output = os.path.join(tmp, 'trace.json')
+            merge_traces(directory, output)
+            with open(output) as f:
+                events = json.load(f)['traceEvents']
+            self.assertEqual(events, load_events(directory))
+
+        spans = [e for e in events if e['ph'] == 'X']
+        self.assertEqual(sorted(e['name'] for e in spans), ['import json', 'outer', 'work', 'work'])
+        outer = next(e for e in spans if e['name'] == 'outer')
+        self.assertEqual(outer['args']['rows'], 3)
+        for work in (e for e in spans if e['name'] == 'work'):
+            self.assertGreaterEqual(work['ts'], outer['ts'])
+            self.assertLessEqual(work['ts'] + work['dur'], outer['ts'] + outer['dur'] + 1)
+
+        rows = {row['name']: row for row in summarize(events)}
+        self.assertEqual(rows['work']['count'], 2)
+        self.assertEqual(rows['work']['process'], 'refresh')
+        self.assertEqual(rows['import json']['category'], 'import')
+        self.assertGreater(rows['outer']['wall_ms'], 0)
+        if instrumentation.resource is not None:
+            self.assertGreater(rows['outer']['peak_rss_mb'], 0)
+
+    def test_times_imports_and_collects_worker_spans(self):
+        """Unwrapped imports are recorded, and spans in pool workers reach the trace."""
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = os.path.join(tmp, 'profile')
+            script = os.path.join(tmp, 'render.py')
+            with open(script, 'w') as f:
+                f.write(POOL_SCRIPT.format(root=ROOT_DIR))
+            subprocess.run([sys.executable, script], check=True, capture_output=True,
+                           env={**os.environ, PROFILE_ENV: directory})
+            events = load_events(directory)
+
+        names = {e['pid']: e['args']['name'] for e in events if e['ph'] == 'M'}
+        self.assertEqual(sorted(names.values()), ['render', 'render worker'])
+        spans = {(names[e['pid']], e['name']): e for e in events if e['ph'] == 'X'}
+        self.assertEqual(spans['render', 'import colorsys']['cat'], 'import')
+        self.assertEqual(spans['render worker', 'import fractions']['cat'], 'import')
+        self.assertEqual(sum(e['name'] == 'task' for e in events), 3)
+        # The worker does not write the parent's spans again
+        self.assertNotIn(('render worker', 'import colorsys'), spans)
+
+if __name__ == '__main__':
+    unittest.main()
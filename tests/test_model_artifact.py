@@ -0,0 +1,187 @@
+import unittest
+import numpy as np
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import zlib
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convert_ratings import (CATEGORIES, INTERVAL_PATH, LUT_MAX_RATING, build_inverse_table, build_lookup_table,
+                             load_lookup_table, load_regressions)
+from model_artifact import ARTIFACT_PATH, HEADER, artifact_bytes, load_artifact, load_models, read_artifact, write_artifact
+
+# One model of every stored type
+REGRESSIONS = {
+    'BLITZ': {'type': 'quadratic', 'params': [3.5e-05, 1.25, -815.5]},
+    'BULLET': {'type': 'log', 'params': [900.0, -5600.0]},
+    'RAPID': {'type': 'pchip', 'params': [800.0, 1300.0, 1900.0, 2600.0, 200.0, 820.0, 1500.0, 2350.0]},
+    'CLASSICAL': {'type': 'polynomial', 'params': [1e-08, -5e-05, 1.2, -400.0]},
+}
+
+
+class TestModelArtifact(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cls.lookup_table = build_lookup_table(REGRESSIONS)
+        cls.inverse_table = build_inverse_table(REGRESSIONS)
+        cls.data = artifact_bytes(REGRESSIONS, cls.lookup_table, inverse_table=cls.inverse_table)
+
+    def corrupt(self, offset, value):
+        data = bytearray(self.data)
+        data[offset] = value
+        return bytes(data)
+
+    def test_round_trip(self):
+        artifact = read_artifact(self.data)
+        self.assertEqual(artifact.regressions(), REGRESSIONS)
+        self.assertEqual(artifact.categories, CATEGORIES)
+        np.testing.assert_array_equal(artifact.lookup_table, self.lookup_table)
+        np.testing.assert_array_equal(artifact.inverse_table, self.inverse_table)
+        self.assertIsNone(artifact.interval_table)
+
+    def test_coefficients_are_in_ascending_powers(self):
+        artifact = read_artifact(self.data)
+        np.testing.assert_array_equal(artifact.coefficients[0, :3], [-815.5, 1.25, 3.5e-05])
+        np.testing.assert_array_equal(artifact.coefficients[1], [-5600.0, 900.0] + [0.0] * 6)
+
+    def test_loads_without_copying(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'models.bin')
+            write_artifact(path, REGRESSIONS, self.lookup_table)
+            artifact = load_artifact(path)
+            self.assertIsInstance(artifact.lookup_table.base, np.ndarray)
+            self.assertTrue(np.shares_memory(artifact.lookup_table, artifact.coefficients.base))
+            self.assertFalse(artifact.lookup_table.flags.writeable)
+            del artifact
+
+    def test_rejects_corrupt_data(self):
+        for offset in (HEADER.size + 3, HEADER.size + 100, len(self.data) - 1):
+            with self.subTest(offset=offset), self.assertRaisesRegex(ValueError, 'checksum'):
+                read_artifact(self.corrupt(offset, self.data[offset] ^ 0xff))
+
+    def test_rejects_truncated_data(self):
+        for size in (0, 10, HEADER.size, len(self.data) - 8):
+            with self.subTest(size=size), self.assertRaisesRegex(ValueError, 'truncated'):
+                read_artifact(self.data[:size])
+
+    def test_rejects_other_files_and_versions(self):
+        with self.assertRaisesRegex(ValueError, 'Not a model artifact'):
+            read_artifact(json.dumps(REGRESSIONS).encode())
+        with self.assertRaisesRegex(ValueError, 'format 2'):
+            read_artifact(self.data[:4] + struct.pack('<H', 2) + self.data[6:])
+
+    def test_validates_records(self):
+        # A record naming an unknown category, with a correct checksum
+        payload = bytearray(self.data[HEADER.size:])
+        payload[:12] = b'BLINDFOLD\0\0\0'
+        header = bytearray(self.data[:HEADER.size])
+        struct.pack_into('<I', header, 20, zlib.crc32(payload))
+        with self.assertRaisesRegex(ValueError, 'Unknown category'):
+            read_artifact(bytes(header + payload))
+
+    def test_load_models_reads_either_format(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path, artifact_path = os.path.join(tmp, 'models.json'), os.path.join(tmp, 'models.bin')
+            with open(json_path, 'w') as f:
+                json.dump(REGRESSIONS, f)
+            write_artifact(artifact_path, REGRESSIONS)
+            self.assertEqual(load_models(json_path), REGRESSIONS)
+            self.assertEqual(load_models(artifact_path), REGRESSIONS)
+
+    def test_committed_artifact_is_current(self):
+        """The shipped artifact holds the shipped models and tables."""
+        artifact = load_artifact(os.path.join(self.root_dir, ARTIFACT_PATH))
+        regressions = load_regressions(os.path.join(self.root_dir, 'regressions.json'))
+        self.assertEqual(artifact.regressions(), regressions)
+        np.testing.assert_array_equal(artifact.lookup_table, build_lookup_table(regressions))
+        np.testing.assert_array_equal(artifact.inverse_table, build_inverse_table(regressions))
+        np.testing.assert_array_equal(artifact.interval_table, load_lookup_table(os.path.join(self.root_dir, INTERVAL_PATH)))
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_javascript_reader(self):
+        """model_artifact.js reads the same models and tables, and rejects a corrupt artifact."""
+        script = (
+            "const fs = require('fs');\n"
+            "eval(fs.readFileSync(process.argv[1], 'utf8') + '\\n;globalThis.read = readModelArtifact;');\n"
+            "const bytes = new Uint8Array(fs.readFileSync(process.argv[2]));\n"
+            "const artifact = read(bytes);\n"
+            "const result = {\n"
+            "  categories: artifact.categories, types: artifact.types, paramCounts: artifact.paramCounts,\n"
+            "  coefficients: Array.from(artifact.coefficients), lookup: Array.from(artifact.lookupTable),\n"
+            "  inverse: Array.from(artifact.inverseTable), interval: artifact.intervalTable, error: null,\n"
+            "};\n"
+            "// The tables are views into bytes, so corrupt it only after copying them out\n"
+            "bytes[bytes.length - 1] ^= 0xff;\n"
+            "try { read(bytes); } catch (e) { result.error = e.message; }\n"
+            "console.log(JSON.stringify(result));\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'models.bin')
+            with open(path, 'wb') as f:
+                f.write(self.data)
+            reader = os.path.join(self.root_dir, 'model_artifact.js')
+            output = subprocess.run(['node', '-e', script, reader, path], capture_output=True, text=True, check=True).stdout
+        result = json.loads(output)
+
+        artifact = read_artifact(self.data)
+        self.assertEqual(result['categories'], artifact.categories)
+        self.assertEqual(result['types'], artifact.types)
+        self.assertEqual(result['paramCounts'], list(artifact.param_counts))
+        np.testing.assert_array_equal(result['coefficients'], artifact.coefficients.ravel())
+        np.testing.assert_array_equal(result['lookup'], self.lookup_table.ravel())
+        np.testing.assert_array_equal(result['inverse'], self.inverse_table.ravel())
+        self.assertIsNone(result['interval'])
+        self.assertIn('checksum', result['error'])
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_javascript_reader_validates_header(self):
+        """model_artifact.js rejects the rating ranges and categories its tables are not indexed by."""
+        def with_header(header, payload):
+            header = bytearray(header)
+            struct.pack_into('<I', header, 20, zlib.crc32(payload))
+            return bytes(header + payload)
+
+        header, payload = self.data[:HEADER.size], bytearray(self.data[HEADER.size:])
+        other_range = bytearray(header)
+        struct.pack_into('<I', other_range, 12, 3000)
+        unknown = bytearray(payload)
+        unknown[:12] = b'BLINDFOLD\0\0\0'
+        swapped = bytearray(payload)
+        swapped[:12], swapped[16:28] = payload[16:28], payload[:12]
+        artifacts = {'range': with_header(other_range, payload), 'unknown': with_header(header, unknown),
+                     'order': with_header(header, swapped)}
+
+        script = (
+            "const fs = require('fs');\n"
+            "eval(fs.readFileSync(process.argv[1], 'utf8') + '\\n;globalThis.read = readModelArtifact;');\n"
+            "const errors = process.argv.slice(2).map((path) => {\n"
+            "  try { read(new Uint8Array(fs.readFileSync(path))); return null; } catch (e) { return e.message; }\n"
+            "});\n"
+            "console.log(JSON.stringify(errors));\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name, data in artifacts.items():
+                paths.append(os.path.join(tmp, f'{name}.bin'))
+                with open(paths[-1], 'wb') as f:
+                    f.write(data)
+            reader = os.path.join(self.root_dir, 'model_artifact.js')
+            output = subprocess.run(['node', '-e', script, reader, *paths], capture_output=True, text=True, check=True).stdout
+        errors = dict(zip(artifacts, json.loads(output)))
+
+        self.assertIn(f'up to 3000, expected {LUT_MAX_RATING}', errors['range'])
+        self.assertIn('Unknown category in model artifact: BLINDFOLD', errors['unknown'])
+        self.assertIn('BULLET out of order', errors['order'])
+        with self.assertRaisesRegex(ValueError, 'up to 3000'):
+            read_artifact(artifacts['range'])
+
+if __name__ == '__main__':
+    unittest.main()
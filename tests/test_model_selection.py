@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+import os
+import sys
+import tempfile
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convert_ratings import predict_regression
+from model_selection import CANDIDATES, cross_validate, pool_adjacent_violators, register_candidate, select_models
+
+
+class TestModelSelection(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(1)
+        cls.x = np.linspace(800, 2800, 40)
+        cls.y_linear = 1.2 * cls.x - 600 + rng.normal(0, 20, len(cls.x))
+        cls.y_curved = 0.0004 * (cls.x - 800) ** 2 + 0.5 * cls.x + rng.normal(0, 20, len(cls.x))
+
+    def test_registry_covers_families(self):
+        for name in ['polynomial1', 'polynomial2', 'polynomial3', 'log', 'piecewise_linear', 'monotone_spline', 'isotonic']:
+            self.assertIn(name, CANDIDATES)
+
+    def test_every_candidate_fits(self):
+        """Every registered candidate produces a model that tracks the data."""
+        for name, fit in CANDIDATES.items():
+            with self.subTest(candidate=name):
+                regression = fit(self.x, self.y_linear)
+                residuals = self.y_linear - predict_regression(regression, self.x)
+                self.assertLess(np.sqrt(np.mean(residuals ** 2)), 150)
+
+    def test_polynomials_keep_existing_layout(self):
+        self.assertEqual(CANDIDATES['polynomial1'](self.x, self.y_linear)['type'], 'linear')
+        quadratic = CANDIDATES['polynomial2'](self.x, self.y_curved)
+        self.assertEqual(quadratic['type'], 'quadratic')
+        self.assertAlmostEqual(quadratic['params'][0], 0.0004, delta=0.0001)
+
+    def test_monotone_candidates_are_monotone(self):
+        ratings = np.arange(0, 4001, 10)
+        for name in ['monotone_spline', 'isotonic']:
+            with self.subTest(candidate=name):
+                predictions = predict_regression(CANDIDATES[name](self.x, self.y_linear), ratings)
+                self.assertTrue(np.all(np.diff(predictions) >= -1e-9))
+
+    def test_pool_adjacent_violators(self):
+        fitted = pool_adjacent_violators([1, 3, 2, 4, 0], np.ones(5))
+        np.testing.assert_allclose(fitted, [1, 2.25, 2.25, 2.25, 2.25])
+
+    def test_cross_validate_prefers_true_family(self):
+        linear = np.mean(cross_validate('polynomial1', self.x, self.y_curved))
+        quadratic = np.mean(cross_validate('polynomial2', self.x, self.y_curved))
+        self.assertLess(quadratic, linear)
+
+    def test_select_models_caches_by_dataset(self):
+        """Only datasets whose data changed are cross-validated again."""
+        candidates = ['polynomial1', 'polynomial2', 'log']
+        with tempfile.TemporaryDirectory() as cache_dir:
+            datasets = {'A': (self.x, self.y_linear), 'B': (self.x, self.y_curved)}
+            regressions, scores = select_models(datasets, candidates, workers=1, cache_dir=cache_dir)
+            self.assertEqual(regressions['B']['type'], 'quadratic')
+            self.assertEqual(set(scores['A']), set(candidates))
+            self.assertEqual(len(os.listdir(cache_dir)), 6)
+
+            datasets['B'] = (self.x, self.y_curved + 1.0)
+            _, rescored = select_models(datasets, candidates, workers=1, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 9)
+            self.assertEqual(rescored['A'], scores['A'])
+
+    def test_register_candidate(self):
+        @register_candidate('test_constant')
+        def fit_constant(x, y):
+            return {'type': 'polynomial', 'params': [float(np.mean(y))]}
+        try:
+            regressions, _ = select_models({'A': (self.x, self.y_linear)}, ['test_constant'], workers=1, cache_dir=None)
+            self.assertEqual(regressions['A']['params'], [float(np.mean(self.y_linear))])
+        finally:
+            del CANDIDATES['test_constant']
+
+if __name__ == '__main__':
+    unittest.main()
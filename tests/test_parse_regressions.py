@@ -0,0 +1,220 @@
+import unittest
+import pandas as pd
+import asyncio
+import functools
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parse_regressions
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class ETagHandler(QuietHandler):
+    """Serves one page under an ETag, counting full responses and 304s; /slow answers after a delay."""
+    page = b'<table id="t"><tr><th>A</th></tr><tr><td>1</td></tr></table>'
+    counts = {200: 0, 304: 0}
+
+    def do_GET(self):
+        if self.path.startswith('/slow'):
+            time.sleep(0.3)
+        # /stale answers 304 to every request that does not ask for a fresh copy, /broken to all of them
+        if self.path.startswith('/broken') or (self.path.startswith('/stale') and self.headers.get('Cache-Control') != 'no-cache'):
+            self.send_response(304)
+            self.end_headers()
+            return
+        etag = f'"{hash(self.page)}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.counts[304] += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.counts[200] += 1
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(self.page)))
+        self.end_headers()
+        self.wfile.write(self.page)
+
+
+class TestParseRegressions(unittest.TestCase):
+    """Fetches a saved copy of the ChessGoals page from a local HTTP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_dir = os.path.dirname(os.path.abspath(__file__))
+        cls.root_dir = os.path.dirname(cls.test_dir)
+        handler = functools.partial(QuietHandler, directory=os.path.join(cls.test_dir, 'fixtures'))
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}/chessgoals_rating_comparison.html'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_static_fetch_finds_full_tables(self):
+        start = time.perf_counter()
+        page, changed = asyncio.run(parse_regressions.fetch_conditional(self.url, cache_dir=None))
+        self.assertTrue(changed)
+        elapsed = time.perf_counter() - start
+
+        table = parse_regressions.parse_table(page, 'tablepress-27')
+        self.assertEqual(len(table), 35)
+        self.assertIn('Lichess Blitz (+/- 75) N=2489', table.columns)
+        self.assertLess(elapsed, 1.0)
+
+    def test_main_writes_csvs_without_rendering(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                with mock.patch.object(sys, 'argv', ['parse_regressions.py', '--url', self.url]), \
+                     mock.patch.object(parse_regressions, 'fetch_rendered', side_effect=AssertionError('rendered')):
+                    parse_regressions.main()
+                for filename in ['lichess_to_chess_com_data.csv', 'chess_com_to_chess_com_data.csv']:
+                    written = pd.read_csv(filename)
+                    expected = pd.read_csv(os.path.join(self.root_dir, filename))
+                    pd.testing.assert_frame_equal(written, expected)
+
+                # The parsed tables now compare equal to what was written, so a rerun leaves the files alone
+                with mock.patch.object(sys, 'argv', ['parse_regressions.py', '--url', self.url]), \
+                     mock.patch('builtins.print') as printed:
+                    parse_regressions.main()
+                self.assertTrue(all('already up to date' in c.args[0] for c in printed.call_args_list))
+            finally:
+                os.chdir(cwd)
+
+    def test_parse_table_keeps_empty_cells_in_place(self):
+        html = (b'<table id="t"><tr><th>A</th><th>B<br/>\n(+/- 5)</th><th>C</th></tr>'
+                b'<tr><td>1</td><td></td><td>3</td></tr>'
+                b'<tr><td>4</td><td>5</td></tr>'
+                b'<tr><td> </td><td></td><td></td></tr>'
+                b'<tr><td>7</td><td>1,200</td><td><b>9</b></td></tr></table>')
+        table = parse_regressions.parse_table(html, 't')
+        self.assertEqual(list(table.columns), ['A', 'B (+/- 5)', 'C'])
+        self.assertEqual(list(table['A']), [1, 4, 7])
+        self.assertEqual(table['A'].dtype, 'int64')
+        self.assertTrue(pd.isna(table['B (+/- 5)'][0]))
+        self.assertEqual(table['B (+/- 5)'][2], 1200)
+        self.assertEqual(table['C'][0], 3)
+        self.assertTrue(pd.isna(table['C'][1]))
+        self.assertEqual(table['C'][2], 9)
+
+    def test_parse_table_rejects_text(self):
+        with self.assertRaises(ValueError):
+            parse_regressions.parse_table(b'<table id="t"><tr><th>A</th></tr><tr><td>n/a</td></tr></table>', 't')
+
+    def test_parse_table_requires_headers(self):
+        with self.assertRaises(ValueError):
+            parse_regressions.parse_table(b'<table id="t"><tr><td>1</td><td>2</td></tr></table>', 't')
+
+    def test_parse_table_after_other_tables(self):
+        """Rows of the tables that are not asked for are dropped as they are read, not kept in the tree."""
+        other = ''.join(f'<tr><td>{i}</td></tr>' for i in range(50000))
+        html = (f'<table id="other"><tr><th>X</th></tr>{other}</table>'
+                '<table id="t"><tr><th>A</th></tr><tr><td>1</td></tr><tr><td>2</td></tr></table>').encode()
+        table = parse_regressions.parse_table(html, 't')
+        self.assertEqual(list(table['A']), [1, 2])
+
+    def test_parse_large_table(self):
+        rows = ''.join(f'<tr><td>{i}</td><td>{i * 2}</td></tr>' for i in range(100000))
+        html = f'<table id="big"><tr><th>A</th><th>B</th></tr>{rows}</table>'.encode()
+        table = parse_regressions.parse_table(html, 'big')
+        self.assertEqual(len(table), 100000)
+        self.assertEqual(table['B'].iloc[-1], 199998)
+
+    def test_fetch_error_exits(self):
+        url = self.url.replace('chessgoals_rating_comparison', 'missing')
+        with mock.patch.object(sys, 'argv', ['parse_regressions.py', '--url', url, '--cache-dir', '']), \
+             mock.patch('builtins.print'), self.assertRaises(SystemExit):
+            parse_regressions.main()
+
+
+class TestConditionalFetch(unittest.TestCase):
+    """Revalidates cached pages against a local server that honours If-None-Match."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ETagHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ETagHandler.page = b'<table id="t"><tr><th>A</th></tr><tr><td>1</td></tr></table>'
+        ETagHandler.counts.update({200: 0, 304: 0})
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def test_unchanged_page_is_a_304(self):
+        url = f'{self.url}/page'
+        page, changed = asyncio.run(parse_regressions.fetch_conditional(url, self.cache_dir))
+        self.assertTrue(changed)
+        cached, changed = asyncio.run(parse_regressions.fetch_conditional(url, self.cache_dir))
+        self.assertFalse(changed)
+        self.assertEqual(cached, page)
+        self.assertEqual(ETagHandler.counts, {200: 1, 304: 1})
+
+        ETagHandler.page = b'<table id="t"><tr><th>A</th></tr><tr><td>2</td></tr></table>'
+        page, changed = asyncio.run(parse_regressions.fetch_conditional(url, self.cache_dir))
+        self.assertTrue(changed)
+        self.assertEqual(page, ETagHandler.page)
+
+    def test_unasked_304_fetches_the_page(self):
+        page, changed = asyncio.run(parse_regressions.fetch_conditional(f'{self.url}/stale', self.cache_dir))
+        self.assertEqual((page, changed), (ETagHandler.page, True))
+        with self.assertRaises(ValueError):
+            asyncio.run(parse_regressions.fetch_conditional(f'{self.url}/broken', self.cache_dir))
+
+    def test_without_cache_always_downloads(self):
+        for _ in range(2):
+            _, changed = asyncio.run(parse_regressions.fetch_conditional(f'{self.url}/page', None))
+            self.assertTrue(changed)
+        self.assertEqual(ETagHandler.counts, {200: 2, 304: 0})
+
+    def test_sources_are_fetched_concurrently(self):
+        urls = [f'{self.url}/slow/{i}' for i in range(4)]
+        start = time.perf_counter()
+        pages = asyncio.run(parse_regressions.fetch_sources(urls, self.cache_dir))
+        elapsed = time.perf_counter() - start
+        self.assertEqual([changed for _, changed in pages], [True] * 4)
+        self.assertLess(elapsed, 1.0)
+
+    def test_diff_rows(self):
+        old = pd.DataFrame({'a': [1, 2, 3, 3], 'b': [10.0, 20.0, 30.0, 30.0]})
+        new = pd.DataFrame({'a': [3, 1, 4], 'b': [30.0, 10.0, 40.0]})
+        added, removed = parse_regressions.diff_rows(old, new)
+        self.assertEqual(added.values.tolist(), [[4, 40.0]])
+        self.assertEqual(removed.values.tolist(), [[2, 20.0], [3, 30.0]])
+
+    def test_update_csv_reports_changed_rows(self):
+        path = os.path.join(self.cache_dir, 'table.csv')
+        old = pd.DataFrame({'a': [1, 2], 'b': [10, 20]})
+        with mock.patch('builtins.print'):
+            added, removed = parse_regressions.update_csv(old, path)
+            self.assertEqual(len(added), 2)
+            self.assertIsNone(parse_regressions.update_csv(old.astype(float), path))
+            added, removed = parse_regressions.update_csv(pd.DataFrame({'a': [1, 3], 'b': [10, 30]}), path)
+        self.assertEqual(added.values.tolist(), [[3, 30]])
+        self.assertEqual(removed.values.tolist(), [[2, 20]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+import ast
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipeline import Stage, default_stages, run_pipeline
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.state_path = self.path('state.json')
+        self.calls = []
+        with open(self.path('data.csv'), 'w') as f:
+            f.write('a,b\n1,2\n')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def copy_stage(self, name, source, target, deps=()):
+        def action():
+            self.calls.append(name)
+            with open(self.path(source)) as f, open(self.path(target), 'w') as out:
+                out.write(f.read())
+        return Stage(name, action, inputs=[self.path(source)], outputs=[self.path(target)], deps=list(deps))
+
+    def stages(self):
+        return [
+            self.copy_stage('fit', 'data.csv', 'model.txt'),
+            self.copy_stage('plots', 'model.txt', 'plot.txt', deps=['fit']),
+            self.copy_stage('package', 'plot.txt', 'package.txt', deps=['plots']),
+        ]
+
+    def statuses(self, timings):
+        return {name: status for name, status, _ in timings}
+
+    def test_skips_unchanged_stages(self):
+        first = run_pipeline(self.stages(), self.state_path)
+        self.assertEqual(set(self.statuses(first).values()), {'ran'})
+        self.assertEqual(self.calls, ['fit', 'plots', 'package'])
+
+        second = run_pipeline(self.stages(), self.state_path)
+        self.assertEqual(set(self.statuses(second).values()), {'skipped'})
+        self.assertEqual(len(self.calls), 3)
+
+    def test_reruns_when_inputs_or_outputs_change(self):
+        run_pipeline(self.stages(), self.state_path)
+        with open(self.path('data.csv'), 'a') as f:
+            f.write('3,4\n')
+        os.remove(self.path('package.txt'))
+        self.calls.clear()
+
+        statuses = self.statuses(run_pipeline(self.stages(), self.state_path))
+        self.assertEqual(statuses, {'fit': 'ran', 'plots': 'ran', 'package': 'ran'})
+
+    def test_unchanged_outputs_stop_propagation(self):
+        """A rerun stage that writes identical outputs lets its dependents skip."""
+        run_pipeline(self.stages(), self.state_path)
+        stages = self.stages()
+        stages[0].always = True
+        self.calls.clear()
+        statuses = self.statuses(run_pipeline(stages, self.state_path))
+        self.assertEqual(statuses, {'fit': 'ran', 'plots': 'skipped', 'package': 'skipped'})
+
+    def test_runs_independent_stages_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=5)
+        stages = [Stage('tests', barrier.wait), Stage('plots', barrier.wait)]
+        start = time.perf_counter()
+        statuses = self.statuses(run_pipeline(stages, self.state_path))
+        self.assertEqual(statuses, {'tests': 'ran', 'plots': 'ran'})
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_failure_blocks_dependents(self):
+        def fail():
+            raise RuntimeError('boom')
+        stages = [Stage('fit', fail), self.copy_stage('plots', 'data.csv', 'plot.txt', deps=['fit'])]
+        statuses = self.statuses(run_pipeline(stages, self.state_path))
+        self.assertEqual(statuses, {'fit': 'failed', 'plots': 'blocked'})
+        self.assertEqual(self.calls, [])
+
+    def test_rejects_unknown_dependencies(self):
+        with self.assertRaises(ValueError):
+            run_pipeline([Stage('plots', lambda: None, deps=['fit'])], self.state_path)
+
+    def test_data_change_reruns_the_tests(self):
+        """Changing a comparison CSV reruns the test stage, not only the stages that rebuild the models."""
+        stages = default_stages(offline=True)
+        ran = []
+        for stage in stages:
+            stage.action = lambda name=stage.name: ran.append(name)
+        cwd = os.getcwd()
+        os.chdir(self.dir)
+        try:
+            for stage in stages:
+                for path in stage.inputs + stage.outputs:
+                    if not any(c in path for c in '*?['):
+                        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                        with open(path, 'a') as f:
+                            f.write('0\n')
+            run_pipeline(stages, self.state_path)
+            self.assertEqual(set(ran), {stage.name for stage in stages})
+            ran.clear()
+
+            with open('lichess_to_chess_com_data.csv', 'a') as f:
+                f.write('1\n')
+            statuses = self.statuses(run_pipeline(stages, self.state_path))
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(statuses['test_regressions'], 'ran')
+        self.assertEqual(statuses['test_extension'], 'skipped')
+
+    def test_script_stages_hash_the_modules_they_import(self):
+        """Editing any repository module a stage's script imports, even lazily, invalidates its outputs."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        def local_imports(module, seen):
+            if module in seen or not os.path.exists(os.path.join(root, f'{module}.py')):
+                return seen
+            seen.add(module)
+            with open(os.path.join(root, f'{module}.py'), 'r') as f:
+                tree = ast.parse(f.read())
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        local_imports(alias.name, seen)
+                elif isinstance(node, ast.ImportFrom) and node.module:
+                    local_imports(node.module, seen)
+            return seen
+
+        for stage in default_stages():
+            # Stages that always run have nothing to invalidate
+            if stage.always or not isinstance(stage.action, list) or not stage.action[1].endswith('.py'):
+                continue
+            with self.subTest(stage=stage.name):
+                modules = local_imports(stage.action[1][:-3], set())
+                self.assertLessEqual({f'{m}.py' for m in modules}, set(stage.inputs))
+
+if __name__ == '__main__':
+    unittest.main()
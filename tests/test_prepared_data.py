@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import prepared_data
+from prepared_data import cache_path, load_datasets
+from rating_graph import CATEGORY_SYSTEMS, RatingGraph
+
+
+class TestPreparedData(unittest.TestCase):
+
+    def setUp(self):
+        test_dir = os.path.dirname(os.path.abspath(__file__))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, 'cache')
+        self.paths = []
+        for name in ['example_lichess_to_chess_com_data.csv', 'example_chess_com_to_chess_com_data.csv']:
+            self.paths.append(os.path.join(self.tmp.name, name))
+            shutil.copy(os.path.join(test_dir, name), self.paths[-1])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_the_rating_graph(self):
+        datasets = load_datasets(self.paths, self.cache_dir)
+        expected = RatingGraph.from_csv(self.paths).datasets()
+        self.assertEqual(list(datasets), list(CATEGORY_SYSTEMS))
+        for category, (x, y) in datasets.items():
+            self.assertEqual(x.dtype, np.float64)
+            np.testing.assert_array_equal(x, expected[category][0])
+            np.testing.assert_array_equal(y, expected[category][1])
+
+    def test_reuses_the_cache_until_the_csvs_change(self):
+        first = load_datasets(self.paths, self.cache_dir)
+        with mock.patch.object(prepared_data.RatingGraph, 'from_csv', side_effect=AssertionError('parsed')):
+            cached = load_datasets(self.paths, self.cache_dir)
+        for category in CATEGORY_SYSTEMS:
+            np.testing.assert_array_equal(cached[category][1], first[category][1])
+
+        path = cache_path(self.paths, self.cache_dir)
+        with open(self.paths[0], 'a') as f:
+            f.write('\n2500,2100,2050,2150,2000\n')
+        self.assertNotEqual(cache_path(self.paths, self.cache_dir), path)
+        changed = load_datasets(self.paths, self.cache_dir)
+        self.assertEqual(len(changed['BLITZ'][0]), len(first['BLITZ'][0]) + 1)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)),
+                         sorted(os.path.basename(p) for p in (path, cache_path(self.paths, self.cache_dir))))
+
+if __name__ == '__main__':
+    unittest.main()
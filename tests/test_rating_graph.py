@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+import pandas as pd
+import os
+import sys
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rating_graph import CATEGORY_SYSTEMS, GRID, RatingGraph
+
+
+class TestRatingGraph(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        test_dir = os.path.dirname(os.path.abspath(__file__))
+        cls.lichess_data = pd.read_csv(os.path.join(test_dir, 'example_lichess_to_chess_com_data.csv'))
+        cls.chess_com_data = pd.read_csv(os.path.join(test_dir, 'example_chess_com_to_chess_com_data.csv'))
+        cls.graph = RatingGraph([cls.lichess_data, cls.chess_com_data])
+
+    def chained(self, ratings, *steps):
+        """Converts by chaining np.interp over (source, target, table) steps, as the scripts used to."""
+        for source, target, table in steps:
+            pairs = table[[source, target]].dropna()
+            ratings = np.interp(ratings, pairs[source], pairs[target])
+        return ratings
+
+    def test_covers_every_rating_system(self):
+        self.assertEqual(set(self.graph.systems), set(self.lichess_data.columns) | set(self.chess_com_data.columns))
+        for source in self.graph.systems:
+            for target in self.graph.systems:
+                self.assertEqual(self.graph.path(source, target)[-1], target)
+
+    def test_paths_go_through_shared_system(self):
+        self.assertEqual(self.graph.path('lichess_bullet', 'fide'), ['lichess_bullet', 'chess_com_blitz', 'fide'])
+        self.assertEqual(self.graph.path('lichess_rapid', 'lichess_blitz'), ['lichess_rapid', 'lichess_blitz'])
+        self.assertEqual(self.graph.path('uscf', 'uscf'), ['uscf'])
+
+    def test_multi_hop_matches_chained_interpolation(self):
+        ratings = np.arange(600, 3000, dtype=np.float64)
+        expected = self.chained(ratings, ('lichess_bullet', 'chess_com_blitz', self.lichess_data),
+                                ('chess_com_blitz', 'uscf', self.chess_com_data))
+        np.testing.assert_allclose(self.graph.convert(ratings, 'lichess_bullet', 'uscf'), expected, rtol=1e-12)
+
+    def test_interpolates_between_grid_points(self):
+        converted = self.graph.convert([1500.25, 1500.75, np.nan], 'chess_com_blitz', 'fide')
+        expected = self.chained(np.array([1500.25, 1500.75]), ('chess_com_blitz', 'fide', self.chess_com_data))
+        np.testing.assert_allclose(converted[:2], expected)
+        self.assertTrue(np.isnan(converted[2]))
+
+    def test_transforms_are_composed_once(self):
+        transform = self.graph.transform('lichess_classical', 'chess_com_rapid')
+        self.assertEqual(transform.shape, GRID.shape)
+        self.assertIs(self.graph.transform('lichess_classical', 'chess_com_rapid'), transform)
+
+    def test_datasets_match_the_fitting_data(self):
+        """The category datasets are the pairs the regressions were always fitted on."""
+        datasets = self.graph.datasets()
+        self.assertEqual(list(datasets), list(CATEGORY_SYSTEMS))
+
+        bullet = self.lichess_data[['lichess_bullet', 'chess_com_blitz']].dropna()
+        expected = self.chained(bullet['chess_com_blitz'], ('chess_com_blitz', 'chess_com_bullet', self.chess_com_data))
+        np.testing.assert_array_equal(datasets['BULLET'][0], bullet['lichess_bullet'])
+        np.testing.assert_array_equal(datasets['BULLET'][1], expected)
+
+        classical = self.lichess_data[['lichess_classical', 'chess_com_blitz']].dropna()
+        np.testing.assert_array_equal(datasets['CLASSICAL'][0], classical['lichess_classical'])
+        np.testing.assert_array_equal(datasets['CLASSICAL'][1], classical['chess_com_blitz'])
+
+    def test_unknown_system(self):
+        with self.assertRaises(KeyError):
+            self.graph.convert([1500], 'lichess_blitz', 'ecf')
+
+    def test_disconnected_systems(self):
+        graph = RatingGraph([{'a': [1, 2], 'b': [3, 4]}, {'c': [1, 2], 'd': [5, 6]}])
+        with self.assertRaises(ValueError):
+            graph.path('a', 'd')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,12 +3,18 @@ import pandas as pd
 import numpy as np
 import json
 import os
+import shutil
 import sys
+import tempfile
 
 # Add the parent directory to the path to import the module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from calculate_regressions import find_best_regression, calculate_aic
+from calculate_regressions import (find_best_regression, fit_regressions, calculate_aic, bootstrap_intervals, build_interval_table,
+                                   round_regressions)
+from convert_ratings import build_inverse_table, build_lookup_table
+from prepared_data import load_datasets
+from rating_graph import DATA_PATHS
 
 
 class TestRegressions(unittest.TestCase):
@@ -19,6 +25,15 @@ class TestRegressions(unittest.TestCase):
         cls.test_dir = os.path.dirname(os.path.abspath(__file__))
         cls.lichess_data = pd.read_csv(os.path.join(cls.test_dir, 'example_lichess_to_chess_com_data.csv'))
         cls.chess_com_data = pd.read_csv(os.path.join(cls.test_dir, 'example_chess_com_to_chess_com_data.csv'))
+        # Per-category training pairs, prepared the same way as for fitting and plotting
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.datasets = load_datasets([os.path.join(cls.test_dir, 'example_lichess_to_chess_com_data.csv'),
+                                      os.path.join(cls.test_dir, 'example_chess_com_to_chess_com_data.csv')],
+                                     cls.cache_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.cache_dir)
         
     def calculate_regression_value(self, regression, lichess_rating):
         """Calculate regression value using the same logic as JavaScript extension."""
@@ -71,12 +86,7 @@ class TestRegressions(unittest.TestCase):
 
     def test_bullet_regression(self):
         """Test Bullet regression (Lichess Bullet -> Chess.com Bullet via Blitz interpolation)."""
-        l_b_vs_c_b = self.lichess_data[['lichess_bullet', 'chess_com_blitz']].dropna()
-        c_b_vs_c_b = self.chess_com_data[['chess_com_blitz', 'chess_com_bullet']].dropna()
-        interp_bullet_ratings = np.interp(l_b_vs_c_b['chess_com_blitz'], 
-                                        c_b_vs_c_b['chess_com_blitz'], 
-                                        c_b_vs_c_b['chess_com_bullet'])
-        regression = find_best_regression(l_b_vs_c_b['lichess_bullet'], interp_bullet_ratings)
+        regression = find_best_regression(*self.datasets['BULLET'])
         
         self.assertIsNotNone(regression)
         self.assertIn('type', regression)
@@ -99,12 +109,7 @@ class TestRegressions(unittest.TestCase):
 
     def test_rapid_regression(self):
         """Test Rapid regression (Lichess Rapid -> Chess.com Rapid via Blitz interpolation)."""
-        l_r_vs_c_b = self.lichess_data[['lichess_rapid', 'chess_com_blitz']].dropna()
-        c_b_vs_c_r = self.chess_com_data[['chess_com_blitz', 'chess_com_rapid']].dropna()
-        interp_rapid_ratings = np.interp(l_r_vs_c_b['chess_com_blitz'], 
-                                       c_b_vs_c_r['chess_com_blitz'], 
-                                       c_b_vs_c_r['chess_com_rapid'])
-        regression = find_best_regression(l_r_vs_c_b['lichess_rapid'], interp_rapid_ratings)
+        regression = find_best_regression(*self.datasets['RAPID'])
         
         self.assertIsNotNone(regression)
         self.assertIn('type', regression)
@@ -219,32 +224,9 @@ class TestRegressions(unittest.TestCase):
 
     def test_full_integration(self):
         """Test full integration by recreating the regressions.json logic."""
-        # This test recreates the full calculation process
-        regressions = {}
-        
-        # Blitz
-        df_blitz = self.lichess_data[['lichess_blitz', 'chess_com_blitz']].dropna()
-        regressions['BLITZ'] = find_best_regression(df_blitz['lichess_blitz'], df_blitz['chess_com_blitz'])
-        
-        # Bullet
-        l_b_vs_c_b = self.lichess_data[['lichess_bullet', 'chess_com_blitz']].dropna()
-        c_b_vs_c_b = self.chess_com_data[['chess_com_blitz', 'chess_com_bullet']].dropna()
-        interp_bullet_ratings = np.interp(l_b_vs_c_b['chess_com_blitz'], 
-                                        c_b_vs_c_b['chess_com_blitz'], 
-                                        c_b_vs_c_b['chess_com_bullet'])
-        regressions['BULLET'] = find_best_regression(l_b_vs_c_b['lichess_bullet'], interp_bullet_ratings)
-        
-        # Rapid
-        l_r_vs_c_b = self.lichess_data[['lichess_rapid', 'chess_com_blitz']].dropna()
-        c_b_vs_c_r = self.chess_com_data[['chess_com_blitz', 'chess_com_rapid']].dropna()
-        interp_rapid_ratings = np.interp(l_r_vs_c_b['chess_com_blitz'], 
-                                       c_b_vs_c_r['chess_com_blitz'], 
-                                       c_b_vs_c_r['chess_com_rapid'])
-        regressions['RAPID'] = find_best_regression(l_r_vs_c_b['lichess_rapid'], interp_rapid_ratings)
-        
-        # Classical
-        df_classical = self.lichess_data[['lichess_classical', 'chess_com_blitz']].dropna()
-        regressions['CLASSICAL'] = find_best_regression(df_classical['lichess_classical'], df_classical['chess_com_blitz'])
+        # This test recreates the full calculation process from the prepared datasets
+        regressions = {game_type: find_best_regression(x, y) for game_type, (x, y) in self.datasets.items()}
+        self.assertEqual(regressions, fit_regressions(self.datasets))
         
         # Verify all regressions were created
         for game_type in ['BLITZ', 'BULLET', 'RAPID', 'CLASSICAL']:
@@ -366,6 +348,78 @@ class TestRegressions(unittest.TestCase):
         self.assertEqual(regression['type'], best_type, 
                         f"Expected {best_type} based on AIC values: {aic_values}, but got {regression['type']}")
 
+    def test_batched_fit_matches_sklearn(self):
+        """The batched closed-form fit reproduces the sklearn models for every category."""
+        from sklearn.linear_model import LinearRegression
+
+        datasets = {}
+        df_blitz = self.lichess_data[['lichess_blitz', 'chess_com_blitz']].dropna()
+        datasets['BLITZ'] = (df_blitz['lichess_blitz'], df_blitz['chess_com_blitz'])
+        df_classical = self.lichess_data[['lichess_classical', 'chess_com_blitz']].dropna()
+        datasets['CLASSICAL'] = (df_classical['lichess_classical'], df_classical['chess_com_blitz'])
+        x_log = pd.Series([100, 200, 500, 1000, 2000])
+        datasets['LOG'] = (x_log, np.log(x_log) * 100 + 500)
+
+        regressions = fit_regressions(datasets)
+
+        for name, (x, y) in datasets.items():
+            with self.subTest(name=name):
+                regression = regressions[name]
+                self.assertEqual(regression, find_best_regression(x, y))
+                x_values = x.values.astype(float)
+                if regression['type'] == 'quadratic':
+                    features = np.column_stack([x_values, x_values ** 2])
+                elif regression['type'] == 'log':
+                    features = np.log(x_values).reshape(-1, 1)
+                else:
+                    features = x_values.reshape(-1, 1)
+                model = LinearRegression().fit(features, y)
+                expected = list(model.coef_[::-1]) + [model.intercept_]
+                np.testing.assert_allclose(regression['params'], expected, rtol=1e-8)
+
+    def test_bootstrap_intervals(self):
+        """Bootstrap prediction intervals cover the data spread and widen away from the data."""
+        df_blitz = self.lichess_data[['lichess_blitz', 'chess_com_blitz']].dropna()
+        x, y = df_blitz['lichess_blitz'], df_blitz['chess_com_blitz']
+        regression = find_best_regression(x, y)
+
+        half_widths = bootstrap_intervals(x, y, regression, n_samples=2000)
+
+        self.assertEqual(len(half_widths), 4001)
+        self.assertTrue(np.all(np.isfinite(half_widths)))
+        inside = half_widths[int(x.median())]
+        self.assertGreater(inside, 0)
+        self.assertGreater(half_widths[4000], inside)
+        # Same seed, same intervals
+        np.testing.assert_array_equal(half_widths, bootstrap_intervals(x, y, regression, n_samples=2000))
+
+    def test_refit_reproduces_committed_regressions(self):
+        """Fitting the committed CSVs again writes exactly the committed regressions.json."""
+        root_dir = os.path.dirname(self.test_dir)
+        datasets = load_datasets([os.path.join(root_dir, path) for path in DATA_PATHS], self.cache_dir)
+        with open(os.path.join(root_dir, 'regressions.json'), 'r') as f:
+            committed = json.load(f)
+        self.assertEqual(round_regressions(fit_regressions(datasets)), committed)
+
+    def test_rounding_keeps_every_table(self):
+        """Rounding the committed models' parameters changes none of the tables built from them."""
+        root_dir = os.path.dirname(self.test_dir)
+        datasets = load_datasets([os.path.join(root_dir, path) for path in DATA_PATHS], self.cache_dir)
+        regressions = fit_regressions(datasets)
+        rounded = round_regressions(regressions)
+        np.testing.assert_array_equal(build_lookup_table(rounded), build_lookup_table(regressions))
+        np.testing.assert_array_equal(build_inverse_table(rounded), build_inverse_table(regressions))
+        np.testing.assert_array_equal(build_interval_table(datasets, rounded, n_samples=500, workers=1),
+                                      build_interval_table(datasets, regressions, n_samples=500, workers=1))
+
+    def test_interval_table_skips_paired_categories(self):
+        """Categories fitted from paired ratings get a zero row, which the readers show as no interval."""
+        regressions = fit_regressions(self.datasets)
+        table = build_interval_table(self.datasets, regressions, n_samples=200, workers=1, skip={'BULLET': None})
+        self.assertEqual(table.shape, (4, 4001))
+        self.assertFalse(table[1].any())
+        self.assertTrue(table[0].any())
+
     def test_bullet_regression_explanation(self):
         """Test and document the bullet regression process to explain the logic."""
         # Step 1: Get Lichess Bullet → Chess.com Blitz relationship
@@ -383,8 +437,10 @@ class TestRegressions(unittest.TestCase):
         # Step 4: Create regression from Lichess Bullet → Chess.com Bullet (interpolated)
         regression = find_best_regression(l_b_vs_c_b['lichess_bullet'], interp_bullet_ratings)
         
-        # Verify the process works
+        # Verify the process works, and that the prepared dataset holds exactly these pairs
         self.assertIsNotNone(regression)
+        np.testing.assert_array_equal(self.datasets['BULLET'][0], l_b_vs_c_b['lichess_bullet'])
+        np.testing.assert_array_equal(self.datasets['BULLET'][1], interp_bullet_ratings)
         
         # Test with a known example
         # If someone has 1295 Lichess bullet, what's their estimated Chess.com bullet?
@@ -432,29 +488,7 @@ class TestRegressions(unittest.TestCase):
         
         for game_type in game_types:
             with self.subTest(game_type=game_type):
-                if game_type == 'BLITZ':
-                    df = self.lichess_data[['lichess_blitz', 'chess_com_blitz']].dropna()
-                    regression = find_best_regression(df['lichess_blitz'], df['chess_com_blitz'])
-                
-                elif game_type == 'BULLET':
-                    l_b_vs_c_b = self.lichess_data[['lichess_bullet', 'chess_com_blitz']].dropna()
-                    c_b_vs_c_b = self.chess_com_data[['chess_com_blitz', 'chess_com_bullet']].dropna()
-                    interp_bullet_ratings = np.interp(l_b_vs_c_b['chess_com_blitz'], 
-                                                    c_b_vs_c_b['chess_com_blitz'], 
-                                                    c_b_vs_c_b['chess_com_bullet'])
-                    regression = find_best_regression(l_b_vs_c_b['lichess_bullet'], interp_bullet_ratings)
-                
-                elif game_type == 'RAPID':
-                    l_r_vs_c_b = self.lichess_data[['lichess_rapid', 'chess_com_blitz']].dropna()
-                    c_b_vs_c_r = self.chess_com_data[['chess_com_blitz', 'chess_com_rapid']].dropna()
-                    interp_rapid_ratings = np.interp(l_r_vs_c_b['chess_com_blitz'], 
-                                                   c_b_vs_c_r['chess_com_blitz'], 
-                                                   c_b_vs_c_r['chess_com_rapid'])
-                    regression = find_best_regression(l_r_vs_c_b['lichess_rapid'], interp_rapid_ratings)
-                
-                else:  # CLASSICAL
-                    df = self.lichess_data[['lichess_classical', 'chess_com_blitz']].dropna()
-                    regression = find_best_regression(df['lichess_classical'], df['chess_com_blitz'])
+                regression = find_best_regression(*self.datasets[game_type])
                 
                 # Test that regression was created successfully
                 self.assertIsNotNone(regression, f"{game_type} regression failed to create")
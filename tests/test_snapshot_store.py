@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+import pandas as pd
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_regressions import fit_regressions, regression_from_coefs
+from rating_graph import RatingGraph
+from snapshot_store import (COEFFICIENT_COLUMNS, STORE_PATH, append_csvs, append_snapshot, list_snapshots,
+                            read_snapshots, refit_snapshots, snapshot_tables, table_name)
+
+
+class TestSnapshotStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cls.paths = [os.path.join(cls.root_dir, 'tests', name)
+                     for name in ['example_lichess_to_chess_com_data.csv', 'example_chess_com_to_chess_com_data.csv']]
+        cls.tables = {table_name(p): pd.read_csv(p) for p in cls.paths}
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.store = os.path.join(self.tmp, 'snapshots.arrow')
+
+    def shifted(self, offset):
+        """The tables with every Lichess rating moved by offset."""
+        tables = {name: df.copy() for name, df in self.tables.items()}
+        lichess = tables['example_lichess_to_chess_com_data']
+        for column in lichess.columns:
+            if column.startswith('lichess_'):
+                lichess[column] += offset
+        return tables
+
+    def test_append_skips_unchanged_tables(self):
+        first = append_snapshot(self.tables, self.store, 'test', datetime(2026, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(first['id'], 1)
+        self.assertIsNone(append_snapshot({n: df.astype(float) for n, df in self.tables.items()}, self.store))
+        second = append_snapshot(self.shifted(10), self.store, taken_at=datetime(2026, 2, 1, tzinfo=timezone.utc))
+        self.assertEqual(second['id'], 2)
+        self.assertEqual([s['id'] for s in list_snapshots(self.store)], [1, 2])
+        self.assertEqual(list_snapshots(self.store)[0]['source'], 'test')
+
+    def test_round_trip(self):
+        append_snapshot(self.tables, self.store)
+        append_snapshot(self.shifted(10), self.store)
+        rows = read_snapshots(self.store, ids=[1]).to_pandas()
+        self.assertEqual(set(rows['snapshot']), {1})
+        for name, df in snapshot_tables(rows, list_snapshots(self.store)[0]).items():
+            pd.testing.assert_frame_equal(df, self.tables[name].astype(np.float64))
+
+    def test_new_columns_are_null_in_older_snapshots(self):
+        append_snapshot(self.tables, self.store)
+        tables = self.shifted(0)
+        tables['example_chess_com_to_chess_com_data']['ecf'] = 1500.0
+        append_snapshot(tables, self.store)
+        rows = read_snapshots(self.store).to_pandas()
+        self.assertTrue(rows.loc[rows['snapshot'] == 1, 'ecf'].isna().all())
+        old = snapshot_tables(rows, list_snapshots(self.store)[0])
+        self.assertNotIn('ecf', old['example_chess_com_to_chess_com_data'])
+
+    def test_select_by_date(self):
+        for month, offset in enumerate([0, 10, 20], start=1):
+            append_snapshot(self.shifted(offset), self.store, taken_at=datetime(2026, month, 1, tzinfo=timezone.utc))
+        rows = read_snapshots(self.store, since='2026-02-01', until='2026-03-01T00:00:00+00:00')
+        self.assertEqual(sorted(set(rows['snapshot'].to_pylist())), [2, 3])
+        self.assertEqual(len(read_snapshots(self.store, until='2025-12-31')), 0)
+        with self.assertRaises(FileNotFoundError):
+            read_snapshots(os.path.join(self.tmp, 'missing.arrow'))
+
+    def test_refit_matches_find_best_regression(self):
+        append_snapshot(self.tables, self.store)
+        append_snapshot(self.shifted(-50), self.store)
+        series = refit_snapshots(self.store)
+        self.assertEqual(len(series), 2 * 4)
+        for i, snapshot in enumerate(list_snapshots(self.store)):
+            tables = self.tables if i == 0 else self.shifted(-50)
+            expected = fit_regressions(RatingGraph(tables.values()).datasets())
+            for category, regression in expected.items():
+                row = series[(series['snapshot'] == snapshot['id']) & (series['category'] == category)].iloc[0]
+                refit = regression_from_coefs(row['type'], row[COEFFICIENT_COLUMNS].to_numpy(dtype=np.float64))
+                self.assertEqual(refit['type'], regression['type'])
+                np.testing.assert_allclose(refit['params'], regression['params'], rtol=1e-9)
+
+    def test_committed_store_holds_the_current_csvs(self):
+        latest = list_snapshots(os.path.join(self.root_dir, STORE_PATH))[-1]
+        stored = os.path.join(self.tmp, 'stored.arrow')
+        snapshot = append_csvs([os.path.join(self.root_dir, f'{name}.csv') for name in latest['tables']], stored)
+        self.assertEqual(snapshot['tables'], latest['tables'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import numpy as np
+import pandas as pd
+import os
+import sys
+import tempfile
+
+# Add the parent directory to the path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculate_regressions import fit_candidates, fit_regressions
+from rating_graph import CATEGORY_SYSTEMS
+from streaming_fit import SufficientStatistics, accumulate, accumulate_files, fit_statistics, read_paired_chunks
+
+
+def paired_ratings(n, seed=0):
+    """Synthetic paired accounts: one Lichess/Chess.com pair per category, with some ratings missing."""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for category, (source, target) in CATEGORY_SYSTEMS.items():
+        x = rng.uniform(700, 2800, n)
+        data[source] = x
+        data.setdefault(target, 1.2 * x - 600 + 2e-5 * (x - 1500) ** 2 + rng.normal(0, 60, n))
+    df = pd.DataFrame(data)
+    df.loc[rng.random(n) < 0.1, 'lichess_rapid'] = np.nan
+    return df
+
+
+class TestStreamingFit(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        data = pd.read_csv(os.path.join(cls.root_dir, 'tests', 'example_lichess_to_chess_com_data.csv'))
+        df = data[['lichess_blitz', 'chess_com_blitz']].dropna()
+        cls.x, cls.y = df['lichess_blitz'].to_numpy(), df['chess_com_blitz'].to_numpy()
+
+    def assertSameRegression(self, actual, expected):
+        self.assertEqual(actual['type'], expected['type'])
+        np.testing.assert_allclose(actual['params'], expected['params'], rtol=1e-9)
+
+    def test_matches_in_memory_fit(self):
+        """Every family's coefficients, MSE and AIC match the batched in-memory fit."""
+        coefs, mse, aic = SufficientStatistics().update(self.x, self.y).fit()
+        expected_coefs, expected_mse, expected_aic = fit_candidates([self.x], [self.y])
+        np.testing.assert_allclose(coefs, expected_coefs[0], rtol=1e-9)
+        np.testing.assert_allclose(mse, expected_mse[0], rtol=1e-9)
+        np.testing.assert_allclose(aic, expected_aic[0], rtol=1e-9)
+
+    def test_chunks_merge_into_the_whole(self):
+        df = paired_ratings(5000)
+        whole = accumulate([df.to_dict('series')])
+        merged = {category: SufficientStatistics() for category in CATEGORY_SYSTEMS}
+        for start in range(0, len(df), 700):
+            part = df.iloc[start:start + 700]
+            for category, stats in accumulate([part.to_dict('series')]).items():
+                merged[category] += stats
+        for category in CATEGORY_SYSTEMS:
+            self.assertEqual(merged[category].n, whole[category].n)
+            np.testing.assert_allclose(merged[category].gram, whole[category].gram, rtol=1e-12)
+            self.assertSameRegression(merged[category].regression(), whole[category].regression())
+
+    def test_skips_missing_ratings(self):
+        df = paired_ratings(3000)
+        stats = accumulate([df.to_dict('series')])
+        datasets = {category: (df[source], df[target]) for category, (source, target) in CATEGORY_SYSTEMS.items()}
+        datasets = {category: (x[x.notna() & y.notna()], y[x.notna() & y.notna()]) for category, (x, y) in datasets.items()}
+        self.assertLess(stats['RAPID'].n, 3000)
+        expected = fit_regressions(datasets)
+        for category, regression in fit_statistics(stats).items():
+            self.assertSameRegression(regression, expected[category])
+
+    def test_log_needs_positive_ratings(self):
+        x = np.linspace(800, 2400, 50)
+        stats = SufficientStatistics().update(x, 900 * np.log(x) - 5600)
+        self.assertEqual(stats.regression()['type'], 'log')
+        stats.update([0.0, 1200.0], [0.0, 900 * np.log(1200) - 5600])
+        self.assertEqual(stats.fit()[2][2], np.inf)
+        self.assertNotEqual(stats.regression()['type'], 'log')
+
+    def test_requires_data(self):
+        with self.assertRaises(ValueError):
+            SufficientStatistics().fit()
+
+    def test_reads_csv_and_parquet_in_chunks(self):
+        df = paired_ratings(2500)
+        expected = fit_statistics(accumulate([df.to_dict('series')]))
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path, parquet_path = os.path.join(tmp, 'paired.csv'), os.path.join(tmp, 'paired.parquet')
+            df.iloc[:1000].to_csv(csv_path, index=False)
+            df.iloc[1000:].to_parquet(parquet_path, row_group_size=400)
+            chunks = list(read_paired_chunks(parquet_path, ['lichess_blitz', 'chess_com_blitz', 'fide'], chunk_rows=300))
+            self.assertEqual(sum(len(chunk['lichess_blitz']) for chunk in chunks), 1500)
+            self.assertEqual(set(chunks[0]), {'lichess_blitz', 'chess_com_blitz'})
+            stats = accumulate_files([csv_path, parquet_path], workers=2, chunk_rows=300)
+        for category, regression in fit_statistics(stats).items():
+            self.assertSameRegression(regression, expected[category])
+
+if __name__ == '__main__':
+    unittest.main()
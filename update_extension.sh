@@ -7,38 +7,11 @@ set -e
 echo "Activating Python virtual environment..."
 source .venv/bin/activate
 
-# --- Run Python Scripts ---
-echo "
-Fetching latest data from ChessGoals..."
-python parse_regressions.py
-
-echo "
-Calculating new regression models..."
-python calculate_regressions.py
-
-echo "
-Generating updated plots for README..."
-python generate_plots.py
-
-# --- Run Tests ---
-echo "
-Running Playwright tests..."
-pytest tests/test_extension.py
-
-echo "
-Running Regression accuracy tests..."
-pytest tests/test_regressions.py
-
-# --- Package Extension ---
-echo "
-Zipping extension files..."
-
-# Remove old zip file if it exists
-if [ -f Lichess2Chess.zip ]; then
-    rm Lichess2Chess.zip
-fi
-
-zip -r Lichess2Chess.zip manifest.json lichess2chess.js regressions.json images/
+# --- Run Pipeline ---
+# Fetches the data, refits the models, regenerates the plots, runs both test suites
+# and zips the extension, skipping any stage whose inputs are unchanged.
+# Extra arguments (e.g. --offline, --force) are passed through.
+python pipeline.py "$@"
 
 echo "
 ---------------------------------------------------"